@@ -16,14 +16,103 @@
 # THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
+import asyncio
 import traceback
 import game
 import numpy as np
 import random
 import bittensor as bt
+from typing import List, Set, Tuple
 
 
-async def ping_uids(dendrite: bt.dendrite, metagraph, uids, timeout=30):
+def _is_healthy(response) -> bool:
+    return bool(
+        response is not None
+        and response.is_available
+        and response.version == game.__version__
+    )
+
+
+async def iter_ping_results(dendrite: bt.dendrite, metagraph, uids, timeout=30):
+    """
+    Pings every UID concurrently and yields results as they arrive.
+
+    Args:
+        dendrite (bittensor.dendrite): The dendrite instance to use for pinging nodes.
+        metagraph (bittensor.metagraph): The metagraph instance containing network information.
+        uids (list): A list of UIDs to ping.
+        timeout (int, optional): The timeout in seconds for each ping. Defaults to 30.
+
+    Yields:
+        tuple: ``(uid, response)`` in completion order. ``response`` is None if the ping raised.
+        Pings still in flight are cancelled when the generator is closed.
+    """
+
+    async def _ping(uid):
+        try:
+            responses = await dendrite.forward(
+                [metagraph.axons[uid]],
+                game.protocol.Ping(),
+                timeout=timeout,
+                deserialize=True,
+            )
+            return uid, responses[0]
+        except Exception as e:
+            bt.logging.debug(f"Ping to uid {uid} failed: {e}")
+            return uid, None
+
+    tasks = [asyncio.ensure_future(_ping(uid)) for uid in uids]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def ping_until_quorum(
+    dendrite: bt.dendrite, metagraph, uids, quorum: int, timeout=30
+) -> Tuple[List[int], Set[int]]:
+    """
+    Pings UIDs and returns as soon as ``quorum`` healthy miners have answered.
+
+    Args:
+        dendrite (bittensor.dendrite): The dendrite instance to use for pinging nodes.
+        metagraph (bittensor.metagraph): The metagraph instance containing network information.
+        uids (list): UIDs to ping, highest selection priority first.
+        quorum (int): Number of available, version-matched miners to wait for.
+        timeout (int, optional): The timeout in seconds for each ping. Defaults to 30.
+
+    Returns:
+        tuple: A tuple containing:
+            - The UIDs that answered healthy, in the priority order of ``uids``.
+            - Every UID whose ping finished, healthy or not. UIDs outside this set were cancelled.
+    """
+    priority = {int(uid): index for index, uid in enumerate(uids)}
+    successful: List[int] = []
+    answered: Set[int] = set()
+    bt.logging.info(
+        f"Pinging {len(uids)} uids with timeout {timeout}s until {quorum} answer..."
+    )
+    results = iter_ping_results(dendrite, metagraph, uids, timeout=timeout)
+    try:
+        async for uid, response in results:
+            answered.add(int(uid))
+            if _is_healthy(response):
+                successful.append(int(uid))
+                if len(successful) >= quorum:
+                    break
+    finally:
+        # Closing the generator cancels the pings still in flight.
+        await results.aclose()
+    successful.sort(key=lambda uid: priority[uid])
+    bt.logging.info(
+        f"ping() quorum {len(successful)}/{quorum} after {len(answered)} answers: {successful}"
+    )
+    return successful, answered
+
+
+async def ping_uids(dendrite: bt.dendrite, metagraph, uids, timeout=30, quorum=None):
     """
     Pings a list of UIDs to check their availability on the Bittensor network.
 
@@ -32,12 +121,18 @@ async def ping_uids(dendrite: bt.dendrite, metagraph, uids, timeout=30):
         metagraph (bittensor.metagraph): The metagraph instance containing network information.
         uids (list): A list of UIDs (unique identifiers) to ping.
         timeout (int, optional): The timeout in seconds for each ping. Defaults to 3.
+        quorum (int, optional): If set, return as soon as this many healthy miners have answered
+            and cancel the remaining pings. Defaults to None, which waits for every UID.
 
     Returns:
-        tuple: A tuple containing two lists:
-            - The first list contains UIDs that were successfully pinged.
-            - The second list contains UIDs that failed to respond.
+        list: The UIDs that were successfully pinged.
     """
+    if quorum:
+        successful_uids, _ = await ping_until_quorum(
+            dendrite, metagraph, uids, quorum, timeout=timeout
+        )
+        return successful_uids
+
     axons = [metagraph.axons[uid] for uid in uids]
     try:
         bt.logging.info(f"Pinging {len(uids)} uids with timeout {timeout}s...")
@@ -48,9 +143,7 @@ async def ping_uids(dendrite: bt.dendrite, metagraph, uids, timeout=30):
             deserialize=True,
         )
         successful_uids = [
-            uid
-            for uid, response in zip(uids, responses)
-            if response.is_available and response.version == game.__version__
+            uid for uid, response in zip(uids, responses) if _is_healthy(response)
         ]
     except Exception as e:
         bt.logging.error(f"Dendrite ping failed: {e}")
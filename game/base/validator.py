@@ -39,11 +39,23 @@ from game.base.utils.weight_utils import (
 )  # TODO: Replace when bittensor switches to numpy
 from game.mock import MockDendrite
 from game.utils.config import add_validator_args
+from game.validator.async_score_store import AsyncScoreStore
+from game.validator.availability import AvailabilityTracker
+from game.validator.backend_client import BackendClient
+from game.validator.clue_arbiter import ClueArbiter, ClueVerdictCache
+from game.validator.latency import LatencyModel
+from game.validator.matchmaker import Matchmaker
+from game.validator.retention import RetentionService
+from game.validator.room_manager import RoomManager
+from game.validator.room_publisher import RoomOutbox, RoomPublisher
+from game.validator.room_state import RoomStateTracker
+from game.validator.scheduler import GameScheduler
 from game.validator.score_store import ScoreStore
 from game.validator.scoring_config import (
     parse_interval_to_seconds,
     SCORING_INTERVAL,
 )
+from game.validator.telemetry import TurnTelemetry
 
 
 class BaseValidatorNeuron(BaseNeuron):
@@ -98,21 +110,47 @@ class BaseValidatorNeuron(BaseNeuron):
         except AttributeError:
             pass
         bt.logging.info(f"Using backend: {self.backend_base}")
+        self.backend = BackendClient(
+            self.backend_base,
+            signer=self.build_signed_headers,
+            timeout=self.config.backend.timeout,
+            retries=self.config.backend.retries,
+            header_ttl=self.config.backend.header_ttl,
+        )
         scores_endpoint = f"{self.backend_base}/api/v1/rooms/score"
         scores_fetch_endpoint = f"{self.backend_base}/api/v1/rooms/sync"
+        scoring_interval_text = SCORING_INTERVAL
+        if hasattr(self.config, "scoring") and getattr(
+            self.config.scoring, "interval", None
+        ):
+            scoring_interval_text = self.config.scoring.interval
+        self.scoring_window_seconds = parse_interval_to_seconds(scoring_interval_text)
         self.score_store = ScoreStore(
             scores_db_path,
             backend_url=scores_endpoint,
             fetch_url=scores_fetch_endpoint,
             signer=self.build_signed_headers,
+            window_seconds=self.scoring_window_seconds,
         )
         self.score_store.init(self.metagraph.hotkeys)
-        scoring_interval_text = SCORING_INTERVAL
-        if hasattr(self.config, "scoring") and getattr(
-            self.config.scoring, "interval", None
-        ):
-            scoring_interval_text = self.config.scoring.interval
-        self.scoring_window_seconds = parse_interval_to_seconds(scoring_interval_text)
+        # Games write through the async facade; weight setting reads the store directly.
+        self.async_store = AsyncScoreStore(self.score_store, backend=self.backend)
+        self.latency_model = LatencyModel(
+            os.path.join(self.config.neuron.full_path, "latency.json"),
+            min_timeout=self.config.neuron.min_query_timeout,
+            max_timeout=self.config.neuron.max_query_timeout,
+        )
+        self.latency_model.load()
+        # Miners missing from latency.json start from their recorded turns.
+        recent = self.score_store.recent_turn_latencies(self.latency_model.history)
+        seeded = sum(
+            self.latency_model.seed(uid, hotkey, recent.get(hotkey))
+            for uid, hotkey in enumerate(self.metagraph.hotkeys)
+        )
+        if seeded:
+            bt.logging.info(
+                f"Seeded latency history for {seeded} miners from telemetry"
+            )
 
         # Init sync with the network. Updates the metagraph.
         self.sync()
@@ -131,6 +169,58 @@ class BaseValidatorNeuron(BaseNeuron):
         self.is_running: bool = False
         self.thread: Union[threading.Thread, None] = None
         self.lock = asyncio.Lock()
+        self.room_states = RoomStateTracker()
+        self.room_publisher = RoomPublisher(
+            self,
+            RoomOutbox(os.path.join(self.config.neuron.full_path, "room_outbox.db")),
+            replay_interval=self.config.neuron.room_outbox_interval,
+        )
+        self.room_manager = RoomManager(
+            self,
+            pool_size=self.config.neuron.num_concurrent_forwards,
+            room_ttl=self.config.neuron.room_ttl,
+            cleanup_interval=self.config.neuron.room_cleanup_interval,
+            ready_ttl=self.config.neuron.ready_room_ttl,
+        )
+        self.clue_arbiter = ClueArbiter(
+            ClueVerdictCache(os.path.join(self.config.neuron.full_path, "arbiter.db")),
+            api_key=os.environ.get("OPENAI_KEY"),
+            model=self.config.arbiter.model,
+            max_concurrency=self.config.arbiter.max_concurrency,
+            timeout=self.config.arbiter.timeout,
+            batch_window=self.config.arbiter.batch_window,
+            max_batch=self.config.arbiter.max_batch,
+        )
+        self.turn_telemetry = TurnTelemetry(self)
+        self.availability = AvailabilityTracker(
+            self,
+            interval=self.config.neuron.availability_interval,
+            stale_after=self.config.neuron.availability_stale_after,
+            batch_size=self.config.neuron.availability_batch_size,
+        )
+        self.matchmaker = Matchmaker(
+            self,
+            team_size=self.config.neuron.sample_size,
+            num_teams=self.config.neuron.num_concurrent_forwards,
+        )
+        self.scheduler = GameScheduler(
+            self,
+            num_slots=self.config.neuron.num_concurrent_forwards,
+            game_timeout=self.config.neuron.game_timeout,
+            sync_interval=self.config.neuron.sync_interval,
+        )
+        self.retention = RetentionService(
+            self,
+            retention_multiple=self.config.scoring.retention_multiple,
+            interval=self.config.scoring.compaction_interval,
+            verdict_max_age=self.config.arbiter.cache_max_age,
+            verdict_max_rows=self.config.arbiter.cache_max_rows,
+        )
+        self.scheduler.add_service("availability", self.availability.run)
+        self.scheduler.add_service("retention", self.retention.run)
+        self.scheduler.add_service("room_outbox", self.room_publisher.run)
+        self.scheduler.add_service("rooms", self.room_manager.run)
+        self.scheduler.add_service("telemetry", self.turn_telemetry.run)
 
     def serve_axon(self):
         """Serve axon to enable external connections."""
@@ -155,11 +245,17 @@ class BaseValidatorNeuron(BaseNeuron):
             bt.logging.error(f"Failed to create Axon initialize with exception: {e}")
             pass
 
-    async def concurrent_forward(self):
-        coroutines = [
-            self.forward() for _ in range(self.config.neuron.num_concurrent_forwards)
-        ]
-        await asyncio.gather(*coroutines)
+    def weights_version_matches(self) -> bool:
+        """Checks that our spec version matches the subnet weights version."""
+        weights_version = self.subtensor.get_subnet_hyperparameters(
+            self.config.netuid
+        ).weights_version
+        if self.spec_version != weights_version:
+            bt.logging.warning(
+                f"Spec version {self.spec_version} does not match subnet weights version {weights_version}. Please upgrade your code."
+            )
+            return False
+        return True
 
     def run(self):
         """
@@ -170,7 +266,8 @@ class BaseValidatorNeuron(BaseNeuron):
         2. Continuously forwards queries to the miners on the network, rewarding their responses and updating the scores accordingly.
         3. Periodically resynchronizes with the chain; updating the metagraph with the latest network state and setting weights.
 
-        The essence of the validator's operations is in the forward function, which is called every step. The forward function is responsible for querying the network and scoring the responses.
+        Games are run by the GameScheduler, which keeps num_concurrent_forwards games in flight and starts a new one as soon as any finishes.
+        The essence of the validator's operations is in the forward function, which is called once per game. The forward function is responsible for querying the network and scoring the responses.
 
         Note:
             - The function leverages the global configurations set during the initialization of the miner.
@@ -191,28 +288,19 @@ class BaseValidatorNeuron(BaseNeuron):
             try:
                 bt.logging.info(f"step({self.step}) block({self.block})")
 
-                # Check weights version and run if matches
-                weights_version = self.subtensor.get_subnet_hyperparameters(
-                    self.config.netuid
-                ).weights_version
-                if self.spec_version != weights_version:
-                    bt.logging.warning(
-                        f"Spec version {self.spec_version} does not match subnet weights version {weights_version}. Please upgrade your code."
-                    )
-                    time.sleep(12)
-                    continue
-                # Run multiple forwards concurrently.
-                self.loop.run_until_complete(self.concurrent_forward())
+                # Keep games running continuously; the scheduler also syncs the
+                # metagraph and sets weights on its own cadence.
+                self.loop.run_until_complete(self.scheduler.run())
 
                 # Check if we should exit.
                 if self.should_exit:
+                    self.loop.run_until_complete(self.room_publisher.flush())
+                    self.loop.run_until_complete(self.room_manager.close())
+                    self.loop.run_until_complete(self.backend.close())
+                    self.loop.run_until_complete(self.clue_arbiter.close())
+                    bt.logging.info(f"Clue arbiter stats: {self.clue_arbiter.stats()}")
                     break
 
-                # Sync metagraph and potentially set weights.
-                self.sync()
-
-                self.step += 1
-
             # If someone intentionally stops the validator, it'll safely terminate operations.
             except KeyboardInterrupt:
                 self.axon.stop()
@@ -251,6 +339,8 @@ class BaseValidatorNeuron(BaseNeuron):
             self.thread.join(5)
             self.is_running = False
             bt.logging.debug("Stopped")
+        if hasattr(self, "async_store"):
+            self.async_store.close()
         if hasattr(self, "score_store"):
             self.score_store.close()
 
@@ -495,37 +585,52 @@ class BaseValidatorNeuron(BaseNeuron):
 
     def resync_metagraph(self):
         """Resyncs the metagraph and updates the hotkeys and moving averages based on the new metagraph."""
-        bt.logging.info("resync_metagraph()")
+        self.apply_metagraph(self.fetch_metagraph())
 
-        # Copies state of metagraph before syncing.
-        previous_metagraph = copy.deepcopy(self.metagraph)
+    def fetch_metagraph(self) -> "bt.metagraph":
+        """Returns a freshly synced copy of the metagraph.
 
-        # Sync the metagraph.
-        self.metagraph.sync(subtensor=self.subtensor)
+        The live metagraph is left untouched, so this can run in a worker
+        thread while games read it.
+        """
+        bt.logging.info("resync_metagraph()")
+        metagraph = copy.deepcopy(self.metagraph)
+        metagraph.sync(subtensor=self.subtensor)
+        return metagraph
+
+    def apply_metagraph(self, metagraph: "bt.metagraph") -> None:
+        """Swaps in a synced metagraph with the hotkeys and scores that match it.
 
+        The new state is built aside and assigned in one go; call this on the
+        event loop so games never see a half-updated validator.
+        """
         # Check if the metagraph axon info has changed.
-        if previous_metagraph.axons == self.metagraph.axons:
+        if self.metagraph.axons == metagraph.axons:
+            self.metagraph = metagraph
             return
 
         bt.logging.info(
             "Metagraph updated, re-syncing hotkeys, dendrite pool and moving averages"
         )
+        scores = np.array(self.scores, copy=True)
         # Zero out all hotkeys that have been replaced.
         for uid, hotkey in enumerate(self.hotkeys):
-            if hotkey != self.metagraph.hotkeys[uid]:
-                self.scores[uid] = 0  # hotkey has been replaced
+            if hotkey != metagraph.hotkeys[uid]:
+                scores[uid] = 0  # hotkey has been replaced
 
         # Check to see if the metagraph has changed size.
         # If so, we need to add new hotkeys and moving averages.
-        if len(self.hotkeys) < len(self.metagraph.hotkeys):
+        if len(self.hotkeys) < len(metagraph.hotkeys):
             # Update the size of the moving average scores.
-            new_moving_average = np.zeros((self.metagraph.n))
-            min_len = min(len(self.hotkeys), len(self.scores))
-            new_moving_average[:min_len] = self.scores[:min_len]
-            self.scores = new_moving_average
+            new_moving_average = np.zeros((metagraph.n))
+            min_len = min(len(self.hotkeys), len(scores))
+            new_moving_average[:min_len] = scores[:min_len]
+            scores = new_moving_average
 
+        self.metagraph = metagraph
+        self.scores = scores
         # Update the hotkeys.
-        self.hotkeys = copy.deepcopy(self.metagraph.hotkeys)
+        self.hotkeys = copy.deepcopy(metagraph.hotkeys)
 
     def save_state(self):
         """Saves the state of the validator to a file."""
@@ -538,6 +643,7 @@ class BaseValidatorNeuron(BaseNeuron):
             scores=self.scores,
             hotkeys=self.hotkeys,
         )
+        self.latency_model.save()
 
     def load_state(self):
         """Loads the state of the validator from a file."""
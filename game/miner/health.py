@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import bittensor as bt
+
+# Outcomes that count against a provider; "ok" is the only good one.
+BAD_RESPONSES = ("empty", "truncated", "invalid")
+FAILURES = ("error", "timeout")
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+def classify(err: BaseException) -> str:
+    """Maps a failed call to a health outcome."""
+    kind = getattr(err, "kind", None)
+    if kind:
+        return kind
+    if isinstance(err, asyncio.TimeoutError) or "timeout" in type(err).__name__.lower():
+        return "timeout"
+    return "error"
+
+
+class ProviderHealth:
+    """Rolling health of one provider and model, with a circuit breaker.
+
+    Calls from the last ``window`` seconds give the error rate (errors and
+    timeouts), the bad-response rate (empty, truncated or rejected answers)
+    and the p95 latency of good answers. Once ``min_calls`` calls are in the
+    window, the circuit opens when either rate reaches its threshold or the
+    p95 passes ``slow_after``; ``trip_after`` consecutive failures open it
+    straight away. An open circuit refuses calls for ``open_for`` seconds,
+    then lets ``half_open_trials`` trial calls through. A good trial closes
+    it; a bad one opens it again for twice as long, up to ``max_open_for``.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        window: float = 60.0,
+        min_calls: int = 5,
+        error_threshold: float = 0.5,
+        bad_response_threshold: float = 0.5,
+        slow_after: float = 20.0,
+        trip_after: int = 3,
+        open_for: float = 10.0,
+        max_open_for: float = 120.0,
+        half_open_trials: int = 1,
+    ):
+        self.key = key
+        self.window = float(window)
+        self.min_calls = int(min_calls)
+        self.error_threshold = float(error_threshold)
+        self.bad_response_threshold = float(bad_response_threshold)
+        self.slow_after = float(slow_after)
+        self.trip_after = int(trip_after)
+        self.base_open_for = float(open_for)
+        self.max_open_for = float(max_open_for)
+        self.half_open_trials = max(1, int(half_open_trials))
+        self.state = CircuitState.CLOSED
+        self.open_for = self.base_open_for
+        self.open_until = 0.0
+        self.trials = 0
+        self.consecutive_failures = 0
+        self.opened = 0
+        self._calls: Deque[Tuple[float, str, Optional[float]]] = deque()
+
+    def allows(self, now: Optional[float] = None) -> bool:
+        """Whether a call may go to this provider right now."""
+        now = time.monotonic() if now is None else now
+        if self.state is CircuitState.OPEN and now >= self.open_until:
+            self.state = CircuitState.HALF_OPEN
+            self.trials = 0
+            bt.logging.info(f"{self.key} circuit half-open, sending a trial call")
+        if self.state is CircuitState.OPEN:
+            return False
+        if self.state is CircuitState.HALF_OPEN:
+            return self.trials < self.half_open_trials
+        return True
+
+    def started(self) -> None:
+        if self.state is CircuitState.HALF_OPEN:
+            self.trials += 1
+
+    def finished(
+        self,
+        outcome: Optional[str],
+        latency: Optional[float] = None,
+        now: Optional[float] = None,
+    ) -> None:
+        """Records a call's outcome; None means it was cancelled unanswered."""
+        now = time.monotonic() if now is None else now
+        if outcome is None:
+            if self.state is CircuitState.HALF_OPEN:
+                self.trials = max(0, self.trials - 1)
+            return
+        self._calls.append((now, outcome, latency if outcome == "ok" else None))
+        self._expire(now)
+        if outcome in FAILURES:
+            self.consecutive_failures += 1
+        elif outcome == "ok":
+            self.consecutive_failures = 0
+
+        if self.state is CircuitState.HALF_OPEN:
+            if outcome == "ok":
+                self._close()
+            else:
+                self._open(now, min(self.max_open_for, self.open_for * 2))
+            return
+        if self.state is CircuitState.CLOSED:
+            reason = self._degraded(now)
+            if reason:
+                self._open(now, self.base_open_for, reason)
+
+    def rates(self, now: Optional[float] = None) -> Dict[str, Any]:
+        self._expire(time.monotonic() if now is None else now)
+        calls = len(self._calls)
+        latencies = sorted(
+            latency for _, outcome, latency in self._calls if outcome == "ok"
+        )
+        return {
+            "calls": calls,
+            "error_rate": self._share(FAILURES),
+            "bad_response_rate": self._share(BAD_RESPONSES),
+            "p95": (
+                latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+                if latencies
+                else None
+            ),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "opened": self.opened,
+            **self.rates(),
+        }
+
+    def _share(self, outcomes) -> float:
+        if not self._calls:
+            return 0.0
+        return sum(outcome in outcomes for _, outcome, _ in self._calls) / len(
+            self._calls
+        )
+
+    def _degraded(self, now: float) -> Optional[str]:
+        if self.consecutive_failures >= self.trip_after:
+            return f"{self.consecutive_failures} failures in a row"
+        rates = self.rates(now)
+        if rates["calls"] < self.min_calls:
+            return None
+        if rates["error_rate"] >= self.error_threshold:
+            return f"error rate {rates['error_rate']:.0%}"
+        if rates["bad_response_rate"] >= self.bad_response_threshold:
+            return f"bad response rate {rates['bad_response_rate']:.0%}"
+        if rates["p95"] is not None and rates["p95"] > self.slow_after:
+            return f"p95 latency {rates['p95']:.1f}s"
+        return None
+
+    def _open(self, now: float, open_for: float, reason: str = "trial failed") -> None:
+        self.state = CircuitState.OPEN
+        self.open_for = open_for
+        self.open_until = now + open_for
+        self.opened += 1
+        bt.logging.warning(f"{self.key} circuit open for {open_for:.0f}s: {reason}")
+
+    def _close(self) -> None:
+        bt.logging.info(f"{self.key} circuit closed")
+        self.state = CircuitState.CLOSED
+        self.open_for = self.base_open_for
+        self.consecutive_failures = 0
+        # Judge the recovered provider on fresh calls only.
+        self._calls.clear()
+
+    def _expire(self, now: float) -> None:
+        while self._calls and self._calls[0][0] < now - self.window:
+            self._calls.popleft()
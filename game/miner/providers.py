@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Dict, List, Optional
+
+import bittensor as bt
+import httpx
+from openai import AsyncOpenAI
+
+CHUTES_URL = "https://llm.chutes.ai/v1/chat/completions"
+
+
+class ProviderError(Exception):
+    """Raised when a provider call fails or returns no usable text.
+
+    ``kind`` says how it failed: "error", "empty" or "truncated".
+    """
+
+    def __init__(self, message: str, kind: str = "error"):
+        super().__init__(message)
+        self.kind = kind
+
+
+class ChatProvider:
+    """One chat-completion backend with a long-lived client and a concurrency limit.
+
+    The client and the concurrency semaphore are created on first use inside
+    the running event loop and kept for the miner's lifetime, so requests
+    reuse its keep-alive connections. At most ``max_concurrency`` calls run at
+    once; the rest wait their turn without blocking the loop.
+    """
+
+    name = "provider"
+
+    def __init__(
+        self,
+        model: str,
+        max_concurrency: int = 8,
+        timeout: float = 25.0,
+        max_tokens: int = 600,
+    ):
+        self.model = model
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.timeout = float(timeout)
+        self.max_tokens = int(max_tokens)
+        self.in_flight = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}:{self.model}"
+
+    def semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            # Created here rather than in __init__: on Python 3.9 a semaphore
+            # binds to the loop current at construction, not the one it runs on.
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def complete(
+        self,
+        messages: List[dict],
+        temperature: float,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """Returns the completion text; raises ProviderError if there is none."""
+        async with self.semaphore():
+            self.in_flight += 1
+            try:
+                text = await self._complete(
+                    messages, temperature, self.timeout if timeout is None else timeout
+                )
+            finally:
+                self.in_flight -= 1
+        if not text or not text.strip():
+            raise ProviderError(f"{self.key} returned an empty response", "empty")
+        return text
+
+    async def warm_up(self) -> None:
+        """Opens a pooled connection ahead of the first real request."""
+        try:
+            await self._warm_up()
+            bt.logging.info(f"Warmed up {self.key}")
+        except Exception as err:  # noqa: BLE001
+            bt.logging.warning(f"Could not warm up {self.key}: {err}")
+
+    async def close(self) -> None:
+        pass
+
+    async def _complete(
+        self, messages: List[dict], temperature: float, timeout: float
+    ) -> str:
+        raise NotImplementedError
+
+    async def _warm_up(self) -> None:
+        pass
+
+
+class OpenAIProvider(ChatProvider):
+    name = "openai"
+
+    def __init__(self, api_key: Optional[str], model: str = "gpt-4o-mini", **kwargs):
+        super().__init__(model, **kwargs)
+        self.api_key = api_key
+        self._client: Optional[AsyncOpenAI] = None
+
+    def client(self) -> AsyncOpenAI:
+        if self._client is None:
+            # Retries are ours to schedule against the validator's deadline.
+            self._client = AsyncOpenAI(
+                api_key=self.api_key, timeout=self.timeout, max_retries=0
+            )
+        return self._client
+
+    async def _complete(
+        self, messages: List[dict], temperature: float, timeout: float
+    ) -> str:
+        response = await self.client().chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=self.max_tokens,
+            response_format={"type": "json_object"},
+            timeout=timeout,
+        )
+        if not response.choices:
+            raise ProviderError(f"{self.key} returned no choices", "empty")
+        choice = response.choices[0]
+        if choice.finish_reason == "length":
+            raise ProviderError(f"{self.key} response was truncated", "truncated")
+        return choice.message.content
+
+    async def _warm_up(self) -> None:
+        await self.client().models.retrieve(self.model)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+        self._client = None
+
+
+class ChutesProvider(ChatProvider):
+    name = "chutes"
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        model: str = "deepseek-ai/DeepSeek-V3",
+        url: str = CHUTES_URL,
+        max_tokens: int = 2400,
+        **kwargs,
+    ):
+        super().__init__(model, max_tokens=max_tokens, **kwargs)
+        self.api_key = api_key
+        self.url = url
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                    keepalive_expiry=60,
+                ),
+                headers={"Authorization": f"Bearer {self.api_key}"},
+            )
+        return self._client
+
+    async def _complete(
+        self, messages: List[dict], temperature: float, timeout: float
+    ) -> str:
+        body = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": self.max_tokens,
+            # Streaming truncated long reasoning strings.
+            "stream": False,
+            "response_format": {"type": "json_object"},
+        }
+        response = await self.client().post(self.url, json=body, timeout=timeout)
+        if response.status_code != 200:
+            raise ProviderError(
+                f"{self.key} request failed: {response.status_code} - {response.text[:200]}"
+            )
+        choices = response.json().get("choices")
+        if not choices:
+            raise ProviderError(f"{self.key} returned no choices", "empty")
+        if choices[0].get("finish_reason") == "length":
+            raise ProviderError(f"{self.key} response was truncated", "truncated")
+        return choices[0]["message"]["content"]
+
+    async def _warm_up(self) -> None:
+        # Any answer will do: the point is the TLS handshake and a pooled socket.
+        await self.client().get(self.url.rsplit("/chat/", 1)[0] + "/models")
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+
+
+class ProviderPool:
+    """The miner's LLM providers, built once at startup and shared by every request."""
+
+    def __init__(self, providers: Dict[str, ChatProvider], default: str):
+        if default not in providers:
+            raise ValueError(f"Unknown default provider {default!r}")
+        self.providers = providers
+        self.default = default
+
+    def get(self, name: Optional[str] = None) -> ChatProvider:
+        return self.providers[name or self.default]
+
+    def ordered(self) -> List[ChatProvider]:
+        """The default provider, then the others in the order they were added."""
+        primary = self.get()
+        return [primary] + [
+            provider for provider in self.providers.values() if provider is not primary
+        ]
+
+    async def warm_up(self) -> None:
+        await asyncio.gather(
+            *[provider.warm_up() for provider in self.providers.values()]
+        )
+
+    async def close(self) -> None:
+        await asyncio.gather(
+            *[provider.close() for provider in self.providers.values()]
+        )
+
+    @classmethod
+    def from_env(cls, max_concurrency: int = 8, timeout: float = 25.0) -> ProviderPool:
+        """Builds the pool from the miner's environment.
+
+        OPENAI_KEY, CHUTES_API_KEY, CHUTES_MODEL and CHUTES_BACKUP_MODEL pick
+        the providers; USE_CHUTES_AI makes Chutes the default.
+        """
+        # Insertion order is the order the router falls back in.
+        providers: Dict[str, ChatProvider] = {}
+        if os.environ.get("CHUTES_API_KEY"):
+            providers["chutes"] = ChutesProvider(
+                os.environ.get("CHUTES_API_KEY"),
+                model=os.environ.get("CHUTES_MODEL", "deepseek-ai/DeepSeek-V3"),
+                max_concurrency=max_concurrency,
+                timeout=timeout,
+            )
+            if os.environ.get("CHUTES_BACKUP_MODEL"):
+                providers["chutes_backup"] = ChutesProvider(
+                    os.environ.get("CHUTES_API_KEY"),
+                    model=os.environ["CHUTES_BACKUP_MODEL"],
+                    max_concurrency=max_concurrency,
+                    timeout=timeout,
+                )
+        providers["openai"] = OpenAIProvider(
+            os.environ.get("OPENAI_KEY"),
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+        )
+        use_chutes = os.environ.get("USE_CHUTES_AI", "false").lower() == "true"
+        if use_chutes and "chutes" not in providers:
+            bt.logging.warning(
+                "USE_CHUTES_AI is set but CHUTES_API_KEY is not; using OpenAI"
+            )
+        return cls(
+            providers, "chutes" if use_chutes and "chutes" in providers else "openai"
+        )
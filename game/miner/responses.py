@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+
+REQUIRED_FIELDS = {"spymaster": ("clue", "number"), "operative": ("guesses",)}
+
+
+class RejectedAnswer(ValueError):
+    """A well-formed answer the miner will not use, e.g. a clue on the board.
+
+    Unlike a malformed answer, this says nothing about the provider's health.
+    """
+
+
+def clean_json(text: str) -> str:
+    """Strips markdown fences and surrounding prose from a JSON completion.
+
+    Some models wrap their answer in ```json fences or write a sentence
+    before it; this returns the first complete JSON object in ``text``, or
+    the stripped text if there is none.
+    """
+    cleaned = text.strip()
+    if cleaned.startswith("```"):
+        first_newline = cleaned.find("\n")
+        if first_newline != -1:
+            cleaned = cleaned[first_newline + 1 :]
+        if cleaned.endswith("```"):
+            cleaned = cleaned[:-3].strip()
+    if cleaned.startswith(("{", "[")):
+        return cleaned
+    start = cleaned.find("{")
+    if start == -1:
+        return cleaned
+    depth = 0
+    for i in range(start, len(cleaned)):
+        if cleaned[i] == "{":
+            depth += 1
+        elif cleaned[i] == "}":
+            depth -= 1
+            if depth == 0:
+                return cleaned[start : i + 1]
+    return cleaned
+
+
+def parse_completion(text: str, role: str) -> dict:
+    """Parses a completion and checks it has the fields ``role`` needs.
+
+    Raises ValueError (json.JSONDecodeError included) if it does not.
+    """
+    parsed = json.loads(clean_json(text))
+    if not isinstance(parsed, dict):
+        raise ValueError("Completion is not a JSON object")
+    missing = [field for field in REQUIRED_FIELDS.get(role, ()) if field not in parsed]
+    if missing:
+        raise ValueError(f"Incomplete JSON response, missing {', '.join(missing)}")
+    return parsed
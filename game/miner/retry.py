@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+import bittensor as bt
+
+AttemptFn = Callable[[int, float], Awaitable[Any]]
+
+
+class Deadline:
+    """The time left to answer one validator request.
+
+    The validator stops waiting ``synapse.timeout`` seconds after it signed
+    the request (``synapse.dendrite.nonce`` is its send time in ns). We aim
+    to answer ``margin`` seconds before that, leaving room for the reply to
+    travel back. If the nonce looks skewed against our clock, the budget is
+    counted from when the request arrived instead.
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = max(0.0, float(seconds))
+        self.started = time.monotonic()
+
+    @classmethod
+    def from_synapse(
+        cls, synapse, margin: float = 1.5, default_timeout: float = 12.0
+    ) -> Deadline:
+        timeout = float(getattr(synapse, "timeout", None) or default_timeout)
+        elapsed = 0.0
+        nonce = getattr(getattr(synapse, "dendrite", None), "nonce", None)
+        if nonce:
+            sent_ago = time.time() - nonce / 1e9
+            if 0 <= sent_ago < timeout:
+                elapsed = sent_ago
+        return cls(timeout - elapsed - margin)
+
+    def remaining(self) -> float:
+        return self.seconds - (time.monotonic() - self.started)
+
+
+class RetryEngine:
+    """Runs inference attempts against a request deadline.
+
+    Failed attempts are retried after an async, jittered exponential backoff,
+    so waiting never blocks the event loop. The first attempt starts with
+    ``min_attempt`` seconds left; a retry only when the time left covers a
+    typical attempt (an EWMA of past ones, at least ``min_attempt``). Time
+    spent in attempts cut off at the deadline counts towards the EWMA and
+    skipped retries decay it towards ``min_attempt``, so one slow answer
+    cannot keep retries off for good. Each attempt is cut off at the
+    deadline. When time runs out ``run`` returns None so the caller can send
+    its fallback answer while the validator is still listening. The engine
+    keeps a record of how each request's budget was spent.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 2.0,
+        min_attempt: float = 2.0,
+        alpha: float = 0.2,
+        history: int = 200,
+    ):
+        self.max_attempts = max(1, int(max_attempts))
+        self.backoff = float(backoff)
+        self.max_backoff = float(max_backoff)
+        self.min_attempt = float(min_attempt)
+        self.alpha = float(alpha)
+        self.expected: Optional[float] = None
+        self.requests = 0
+        self.fallbacks = 0
+        self.outcomes: Dict[str, int] = {}
+        self.budgets: Deque[Dict[str, Any]] = deque(maxlen=history)
+
+    def needed(self, number: int = 1) -> float:
+        """Seconds attempt ``number`` should have left before it is worth starting."""
+        if number == 0:
+            return self.min_attempt
+        return max(self.min_attempt, self.expected or 0.0)
+
+    async def run(self, attempt: AttemptFn, deadline: Deadline) -> Any:
+        """Calls ``attempt(number, seconds_left)`` until one returns a result.
+
+        An attempt fails by raising; its result is returned as soon as it
+        succeeds. Returns None if every attempt failed or time ran out.
+        """
+        self.requests += 1
+        spent: List[Dict[str, Any]] = []
+        try:
+            for number in range(self.max_attempts):
+                left = deadline.remaining()
+                if left < self.needed(number):
+                    self._note(spent, "skipped", 0.0)
+                    break
+                started = time.monotonic()
+                try:
+                    result = await asyncio.wait_for(attempt(number, left), left)
+                except asyncio.TimeoutError:
+                    duration = time.monotonic() - started
+                    self._note(spent, "timeout", duration)
+                    self._observe(duration)
+                    break
+                except Exception as err:  # noqa: BLE001
+                    self._note(spent, "error", time.monotonic() - started)
+                    bt.logging.warning(f"Inference attempt {number + 1} failed: {err}")
+                else:
+                    duration = time.monotonic() - started
+                    self._note(spent, "ok", duration)
+                    self._observe(duration)
+                    return result
+                if number + 1 < self.max_attempts:
+                    delay = self._backoff(number)
+                    if deadline.remaining() - delay < self.needed(number + 1):
+                        self._note(spent, "skipped", 0.0)
+                        self._observe(self.min_attempt)
+                        break
+                    await asyncio.sleep(delay)
+            self.fallbacks += 1
+            return None
+        finally:
+            self._close_budget(deadline, spent)
+
+    def stats(self) -> Dict[str, Any]:
+        """Aggregate budget use over the recent requests.
+
+        ``attempt_share`` is the mean fraction of the request budget spent in
+        the first, second, ... attempt; ``budget_used`` the mean fraction
+        spent overall.
+        """
+        shares: Dict[int, List[float]] = {}
+        for budget in self.budgets:
+            for index, share in enumerate(budget["shares"]):
+                shares.setdefault(index, []).append(share)
+        used = [sum(budget["shares"]) for budget in self.budgets]
+        return {
+            "requests": self.requests,
+            "fallbacks": self.fallbacks,
+            "outcomes": dict(self.outcomes),
+            "expected_attempt": self.expected,
+            "attempt_share": [
+                sum(values) / len(values) for _, values in sorted(shares.items())
+            ],
+            "budget_used": sum(used) / len(used) if used else 0.0,
+        }
+
+    def _backoff(self, number: int) -> float:
+        delay = min(self.max_backoff, self.backoff * (2**number))
+        return delay * random.uniform(0.5, 1.5)
+
+    def _observe(self, duration: float) -> None:
+        if self.expected is None:
+            self.expected = duration
+        else:
+            self.expected += self.alpha * (duration - self.expected)
+
+    def _note(self, spent: List[Dict[str, Any]], outcome: str, duration: float):
+        self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+        if outcome != "skipped":
+            spent.append({"outcome": outcome, "seconds": duration})
+
+    def _close_budget(self, deadline: Deadline, spent: List[Dict[str, Any]]) -> None:
+        budget = deadline.seconds or 1e-9
+        shares = [attempt["seconds"] / budget for attempt in spent]
+        self.budgets.append({"seconds": deadline.seconds, "shares": shares})
+        summary = ", ".join(
+            f"{attempt['outcome']} {attempt['seconds']:.1f}s ({share:.0%})"
+            for attempt, share in zip(spent, shares)
+        )
+        bt.logging.debug(
+            f"Inference budget {deadline.seconds:.1f}s: {summary or 'no attempts'}"
+        )
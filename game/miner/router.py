@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+import bittensor as bt
+
+from game.miner.health import ProviderHealth, classify
+from game.miner.providers import ChatProvider, ProviderError, ProviderPool
+from game.miner.responses import RejectedAnswer
+
+AcceptFn = Callable[[str], Any]
+
+
+class HedgedRouter:
+    """Sends a prompt to the primary provider and races a backup when it runs late.
+
+    The primary is the pool's default provider. If it has not produced an
+    accepted answer by its expected latency (the p95 of its recent successful
+    calls, or ``hedge_after`` until it has ``min_samples`` of them), the same
+    prompt goes to the next provider. A failed or rejected answer brings in
+    the next provider right away. The first answer that ``accept`` takes
+    wins and the other calls are cancelled. Hedged requests are capped at
+    ``max_hedge_ratio`` of recent requests, so a slow stretch does not
+    double what we spend on every turn.
+
+    Every call feeds the provider's ProviderHealth (built with
+    ``health_options``). Providers whose circuit is open are skipped, unless
+    every circuit is open, in which case the full order is tried anyway.
+    """
+
+    def __init__(
+        self,
+        pool: ProviderPool,
+        hedge_after: float = 8.0,
+        max_hedge_ratio: float = 0.3,
+        min_samples: int = 5,
+        history: int = 100,
+        health_options: Optional[Dict[str, Any]] = None,
+    ):
+        self.pool = pool
+        self.hedge_after = float(hedge_after)
+        self.max_hedge_ratio = float(max_hedge_ratio)
+        self.min_samples = int(min_samples)
+        self.history = int(history)
+        self.hedges = 0
+        self.wins: Dict[str, int] = {}
+        self._recent: Deque[bool] = deque(maxlen=self.history)
+        self._latency: Dict[str, Deque[float]] = {}
+        self.health: Dict[str, ProviderHealth] = {
+            provider.key: ProviderHealth(provider.key, **(health_options or {}))
+            for provider in pool.providers.values()
+        }
+
+    def available(self) -> List[ChatProvider]:
+        """Providers in fallback order, without those whose circuit is open."""
+        ordered = self.pool.ordered()
+        healthy = [p for p in ordered if self.health[p.key].allows()]
+        if not healthy:
+            bt.logging.warning("Every provider circuit is open; trying them anyway")
+            return ordered
+        return healthy
+
+    def expected_latency(self, provider: ChatProvider) -> float:
+        samples = self._latency.get(provider.key)
+        if not samples or len(samples) < self.min_samples:
+            return self.hedge_after
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+    def can_hedge(self) -> bool:
+        if not self._recent:
+            return self.max_hedge_ratio > 0
+        return sum(self._recent) < self.max_hedge_ratio * len(self._recent)
+
+    def record(self, provider: ChatProvider, seconds: float) -> None:
+        self._latency.setdefault(provider.key, deque(maxlen=self.history)).append(
+            seconds
+        )
+
+    async def complete(
+        self,
+        messages: List[dict],
+        temperature: float,
+        timeout: float,
+        accept: AcceptFn,
+    ) -> Any:
+        """Returns ``accept(text)`` for the first answer it takes.
+
+        ``accept`` raises to reject an answer. Raises ProviderError if no
+        provider gave an accepted answer within ``timeout``.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        waiting = self.available()
+        # available() falls back to every provider when all circuits are open.
+        insist = not any(self.health[p.key].allows() for p in waiting)
+        running: Dict[asyncio.Future, ChatProvider] = {}
+        started: Dict[asyncio.Future, float] = {}
+        hedged = False
+        hedge_at = deadline
+        errors: List[str] = []
+
+        def launch() -> Optional[ChatProvider]:
+            nonlocal hedge_at
+            while waiting:
+                provider = waiting.pop(0)
+                # A circuit may have opened, or a half-open trial started,
+                # while earlier providers were tried.
+                if insist or self.health[provider.key].allows():
+                    break
+                errors.append(f"{provider.key}: circuit open")
+            else:
+                return None
+            now = loop.time()
+            task = asyncio.ensure_future(
+                provider.complete(
+                    messages, temperature, timeout=max(deadline - now, 0.1)
+                )
+            )
+            running[task] = provider
+            started[task] = now
+            self.health[provider.key].started()
+            hedge_at = now + self.expected_latency(provider)
+            return provider
+
+        launch()
+        may_hedge = self.can_hedge()
+        try:
+            while running:
+                wait = deadline - loop.time()
+                if waiting and not hedged and may_hedge:
+                    wait = min(wait, hedge_at - loop.time())
+                done, _ = await asyncio.wait(
+                    running, timeout=max(wait, 0), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    provider = running.pop(task)
+                    health = self.health[provider.key]
+                    latency = loop.time() - started[task]
+                    try:
+                        text = task.result()
+                    except Exception as err:  # noqa: BLE001
+                        health.finished(classify(err))
+                        errors.append(f"{provider.key}: {err}")
+                        continue
+                    try:
+                        result = accept(text)
+                    except Exception as err:  # noqa: BLE001
+                        # A malformed answer counts against the provider;
+                        # a well-formed one we do not like does not.
+                        rejected = isinstance(err, RejectedAnswer)
+                        health.finished("ok" if rejected else "invalid", latency)
+                        errors.append(f"{provider.key}: {err}")
+                        continue
+                    health.finished("ok", latency)
+                    self.record(provider, latency)
+                    self.wins[provider.key] = self.wins.get(provider.key, 0) + 1
+                    return result
+                if loop.time() >= deadline:
+                    break
+                if not waiting:
+                    continue
+                if not running:
+                    # Every call so far failed: go straight to the next provider.
+                    launch()
+                elif not hedged and may_hedge and loop.time() >= hedge_at:
+                    hedged = True
+                    slow = next(iter(running.values()))
+                    backup = launch()
+                    if backup is not None:
+                        self.hedges += 1
+                        bt.logging.debug(f"Hedging {slow.key} with {backup.key}")
+            raise ProviderError(
+                "; ".join(errors) or f"No provider answered within {timeout:.1f}s"
+            )
+        finally:
+            self._recent.append(hedged)
+            # Calls still running at the deadline were too slow; hedge
+            # losers were merely beaten.
+            too_slow = loop.time() >= deadline
+            for task, provider in running.items():
+                task.cancel()
+                self.health[provider.key].finished("timeout" if too_slow else None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hedges": self.hedges,
+            "hedge_rate": (
+                sum(self._recent) / len(self._recent) if self._recent else 0.0
+            ),
+            "wins": dict(self.wins),
+            "expected_latency": {
+                provider.key: self.expected_latency(provider)
+                for provider in self.pool.providers.values()
+            },
+            "health": {key: health.stats() for key, health in self.health.items()},
+        }
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+def turn_digest(synapse) -> str:
+    """Canonical key for a game turn: role, team, board, clue and number.
+
+    Words are upper-cased and cards sorted by word, so the same board state
+    gives the same key whichever validator sends it.
+    """
+    cards = sorted(
+        (
+            str(card.word).upper(),
+            str(card.color or "").lower(),
+            bool(card.is_revealed),
+        )
+        for card in synapse.cards or []
+    )
+    payload = {
+        "role": str(synapse.your_role or "").lower(),
+        "team": str(synapse.your_team or "").lower(),
+        "cards": cards,
+        "clue": str(synapse.your_clue or "").strip().upper(),
+        "number": synapse.your_number,
+    }
+    return hashlib.sha256(
+        json.dumps(payload, separators=(",", ":")).encode()
+    ).hexdigest()
+
+
+class SingleFlightCache:
+    """Runs one call per key at a time and keeps its result for a while.
+
+    Concurrent callers with the same key wait on the call already in flight
+    instead of starting their own. That call is shielded, so it finishes
+    (and is cached) even if the caller that started it gives up; the
+    validator's retry then finds the answer ready. Results are kept for
+    ``ttl`` seconds in an LRU of ``max_entries``; ``get_or_run`` is told
+    which results are worth keeping.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 256):
+        self.ttl = float(ttl)
+        self.max_entries = max(1, int(max_entries))
+        self.hits = 0
+        self.coalesced = 0
+        self.misses = 0
+        self._results: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, key: str, now: Optional[float] = None) -> Any:
+        now = time.monotonic() if now is None else now
+        cached = self._results.get(key)
+        if cached is None:
+            return None
+        expires, result = cached
+        if now >= expires:
+            del self._results[key]
+            return None
+        self._results.move_to_end(key)
+        return result
+
+    def put(self, key: str, result: Any, now: Optional[float] = None) -> None:
+        now = time.monotonic() if now is None else now
+        self._results[key] = (now + self.ttl, result)
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+
+    async def get_or_run(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[Any]],
+        keep: Callable[[Any], bool] = lambda result: result is not None,
+    ) -> Any:
+        """Returns the cached result for ``key``, or the result of ``call()``."""
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._run(key, call, keep))
+            # Nobody may be left to read a failure once every caller gave up.
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self._inflight[key] = task
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.coalesced + self.misses
+        return {
+            "entries": len(self._results),
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "saved_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+        }
+
+    async def _run(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[Any]],
+        keep: Callable[[Any], bool],
+    ) -> Any:
+        try:
+            result = await call()
+            if keep(result):
+                self.put(key, result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
@@ -165,6 +165,76 @@ def add_miner_args(cls, parser):
         default=3_000,
     )
 
+    parser.add_argument(
+        "--provider.max_concurrency",
+        type=int,
+        help="Maximum number of concurrent requests to each LLM provider.",
+        default=8,
+    )
+
+    parser.add_argument(
+        "--provider.timeout",
+        type=float,
+        help="Timeout in seconds for a single LLM provider request.",
+        default=25.0,
+    )
+
+    parser.add_argument(
+        "--provider.max_attempts",
+        type=int,
+        help="Maximum number of LLM attempts per validator request.",
+        default=3,
+    )
+
+    parser.add_argument(
+        "--provider.min_attempt",
+        type=float,
+        help="Minimum seconds left before another LLM attempt is started.",
+        default=2.0,
+    )
+
+    parser.add_argument(
+        "--provider.deadline_margin",
+        type=float,
+        help="Seconds before the validator's timeout by which the miner answers.",
+        default=1.5,
+    )
+
+    parser.add_argument(
+        "--provider.hedge_after",
+        type=float,
+        help="Seconds before a provider with no latency history is raced against the next one.",
+        default=8.0,
+    )
+
+    parser.add_argument(
+        "--provider.max_hedge_ratio",
+        type=float,
+        help="Maximum fraction of recent requests sent to a second provider.",
+        default=0.3,
+    )
+
+    parser.add_argument(
+        "--provider.breaker_open_for",
+        type=float,
+        help="Seconds a degraded provider is skipped before a trial call is let through.",
+        default=10.0,
+    )
+
+    parser.add_argument(
+        "--provider.slow_after",
+        type=float,
+        help="p95 latency in seconds above which a provider counts as degraded.",
+        default=20.0,
+    )
+
+    parser.add_argument(
+        "--provider.cache_ttl",
+        type=float,
+        help="Seconds an answered turn is reused for repeated identical requests.",
+        default=60.0,
+    )
+
     parser.add_argument(
         "--wandb.project_name",
         type=str,
@@ -211,6 +281,104 @@ def add_validator_args(cls, parser):
         default=1,
     )
 
+    parser.add_argument(
+        "--neuron.game_timeout",
+        type=float,
+        help="Hard deadline in seconds for a single game; slower games are cancelled.",
+        default=900,
+    )
+
+    parser.add_argument(
+        "--neuron.sync_interval",
+        type=float,
+        help="How often in seconds to resync the metagraph and check whether to set weights.",
+        default=60,
+    )
+
+    parser.add_argument(
+        "--neuron.availability_interval",
+        type=float,
+        help="Seconds between background availability probe batches.",
+        default=5,
+    )
+
+    parser.add_argument(
+        "--neuron.availability_stale_after",
+        type=float,
+        help="Seconds after which a miner's availability entry is re-probed.",
+        default=300,
+    )
+
+    parser.add_argument(
+        "--neuron.availability_batch_size",
+        type=int,
+        help="Maximum number of miners pinged per availability probe batch.",
+        default=32,
+    )
+
+    parser.add_argument(
+        "--neuron.ping_quorum_factor",
+        type=float,
+        help="Stop pinging once sample_size times this many healthy miners answered. 0 waits for every miner.",
+        default=2.0,
+    )
+
+    parser.add_argument(
+        "--neuron.room_delta_updates",
+        action="store_true",
+        help="Send only what changed since the last acknowledged room update (needs backend delta support).",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--neuron.room_outbox_interval",
+        type=float,
+        help="Seconds between retries of room updates that failed to reach the backend.",
+        default=30,
+    )
+
+    parser.add_argument(
+        "--neuron.game_budget",
+        type=float,
+        help="Seconds one game may run before it is voided without scoring.",
+        default=600,
+    )
+
+    parser.add_argument(
+        "--neuron.min_query_timeout",
+        type=float,
+        help="Lower bound for a turn query timeout derived from the miner's latency.",
+        default=10,
+    )
+
+    parser.add_argument(
+        "--neuron.max_query_timeout",
+        type=float,
+        help="Timeout for miners without latency history and upper bound for all others.",
+        default=30,
+    )
+
+    parser.add_argument(
+        "--neuron.room_ttl",
+        type=float,
+        help="Seconds a finished game's room is kept for spectators before it is deleted.",
+        default=600,
+    )
+
+    parser.add_argument(
+        "--neuron.room_cleanup_interval",
+        type=float,
+        help="Seconds between passes that delete expired rooms.",
+        default=300,
+    )
+
+    parser.add_argument(
+        "--neuron.ready_room_ttl",
+        type=float,
+        help="Seconds a pre-provisioned room may wait unused before it is replaced.",
+        default=1800,
+    )
+
     parser.add_argument(
         "--neuron.sample_size",
         type=int,
@@ -239,6 +407,97 @@ def add_validator_args(cls, parser):
         help="Rolling window to sum validator scores when setting weights (e.g. '3 days').",
     )
 
+    parser.add_argument(
+        "--scoring.retention_multiple",
+        type=float,
+        default=2.0,
+        help="Keep score and selection history for this many scoring windows (minimum 1).",
+    )
+
+    parser.add_argument(
+        "--scoring.compaction_interval",
+        type=float,
+        default=3600,
+        help="Seconds between score database compaction runs.",
+    )
+
+    parser.add_argument(
+        "--backend.timeout",
+        type=float,
+        default=10,
+        help="Timeout in seconds for calls to the backend API.",
+    )
+
+    parser.add_argument(
+        "--backend.retries",
+        type=int,
+        default=2,
+        help="Retries for idempotent backend calls that fail or return 429/5xx.",
+    )
+
+    parser.add_argument(
+        "--backend.header_ttl",
+        type=float,
+        default=30,
+        help="Seconds a signed backend header set is reused before re-signing.",
+    )
+
+    parser.add_argument(
+        "--arbiter.model",
+        type=str,
+        default="gpt-5",
+        help="Model that rules on clues the opponent spymaster flags as invalid.",
+    )
+
+    parser.add_argument(
+        "--arbiter.max_concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of clue arbiter calls in flight at once.",
+    )
+
+    parser.add_argument(
+        "--arbiter.timeout",
+        type=float,
+        default=60,
+        help="Seconds to wait for a clue verdict before the flagged clue is accepted.",
+    )
+
+    parser.add_argument(
+        "--arbiter.batch_window",
+        type=float,
+        default=0.01,
+        help="Seconds to collect clue checks that arrive while another is in flight into one arbiter request; 0 sends each on its own.",
+    )
+
+    parser.add_argument(
+        "--arbiter.max_batch",
+        type=int,
+        default=8,
+        help="Maximum number of clue checks in one arbiter request.",
+    )
+
+    parser.add_argument(
+        "--arbiter.cache_max_age",
+        type=float,
+        default=30 * 86400,
+        help="Seconds a cached clue verdict is kept before retention prunes it.",
+    )
+
+    parser.add_argument(
+        "--arbiter.cache_max_rows",
+        type=int,
+        default=100000,
+        help="Maximum number of cached clue verdicts; retention drops the oldest beyond it.",
+    )
+
+    parser.add_argument(
+        "--arbiter.speculative",
+        action="store_true",
+        help="Start the clue arbiter alongside the opponent's clue check instead of after a flag.",
+        default=False,
+    )
+
     parser.add_argument(
         "--neuron.axon_off",
         "--axon_off",
@@ -0,0 +1,16 @@
+from .ruleSysPrompt import ruleModeratorPrompt
+
+ruleBatchSysPrompt = f"""{ruleModeratorPrompt}
+- Input: several numbered cases, one per line, each with its own clue and board words.
+Decide every case on its own; the cases are unrelated.
+
+Return a valid JSON object with one entry per case:
+{{
+  "verdicts": [
+    {{"id": case number, "valid": true/false, "reasoning": short explanation why it is valid or invalid}}
+  ]
+}}
+
+Your response will be directly parsed as JSON, so make sure you ONLY return a JSON object and nothing else. (even ````json` blocks are not allowed)
+
+"""
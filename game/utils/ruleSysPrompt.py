@@ -1,11 +1,13 @@
 from .baseSysPrompt import baseSysPrompt
 
-ruleSysPrompt = f"""
+ruleModeratorPrompt = f"""
 {baseSysPrompt}
 
 You are a strict moderator for the board game Codenames.
 Your job is to decide if a given clue is a valid word according to Codenames rules.
+"""
 
+ruleSysPrompt = f"""{ruleModeratorPrompt}
 - Input: a clue word and the current board words.
 
 Return a valid JSON object with the following structure:
@@ -1,9 +1,65 @@
+import asyncio
+import math
 import random
 import time
 import bittensor as bt
-from game.api.get_query_axons import ping_uids
+from game.api.get_query_axons import ping_uids, ping_until_quorum
+import heapq
 import numpy as np
-from typing import List
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Set
+
+
+class SelectionIndex:
+    """Draws uids least-selected first without rescanning the whole pool.
+
+    Uids are bucketed by selection count and the distinct counts are kept in a
+    min-heap, so each draw is O(log n). A draw picks uniformly at random from the
+    lowest non-empty bucket. Uids without a recorded count are treated as being
+    at the current minimum, so they are eligible alongside that bucket.
+    """
+
+    def __init__(
+        self,
+        uids: Sequence[int],
+        counts: Sequence[Optional[int]],
+        rng: random.Random = None,
+    ):
+        """``counts[i]`` is the selection count of ``uids[i]``, or None if unknown."""
+        self._rng = rng or random
+        self._buckets: Dict[int, List[int]] = defaultdict(list)
+        self._unknown: List[int] = []
+        self._size = len(uids)
+        buckets = self._buckets
+        unknown = self._unknown
+        for uid, count in zip(uids, counts):
+            if count is None:
+                unknown.append(uid)
+            else:
+                buckets[count].append(uid)
+        self._counts = list(buckets)
+        heapq.heapify(self._counts)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def draw(self) -> Optional[int]:
+        """Removes and returns a random uid with the lowest selection count."""
+        while self._counts and not self._buckets[self._counts[0]]:
+            del self._buckets[heapq.heappop(self._counts)]
+        bucket = self._buckets[self._counts[0]] if self._counts else []
+        total = len(bucket) + len(self._unknown)
+        if total == 0:
+            return None
+        pick = self._rng.randrange(total)
+        if pick < len(bucket):
+            source = bucket
+        else:
+            source, pick = self._unknown, pick - len(bucket)
+        # Swap with the last element so removal is O(1).
+        source[pick], source[-1] = source[-1], source[pick]
+        self._size -= 1
+        return source.pop()
 
 
 async def get_random_uids(self, k: int, exclude: List[int] = None) -> np.ndarray:
@@ -11,91 +67,96 @@ async def get_random_uids(self, k: int, exclude: List[int] = None) -> np.ndarray
 
     exclude_set = {int(uid) for uid in (exclude or [])}
 
-    successful_uids = await ping_uids(
-        self.dendrite, self.metagraph, self.metagraph.uids, timeout=30
-    )
-    successful_set = {int(uid) for uid in successful_uids}
-
     window_seconds = self.scoring_window_seconds
     window_scores = {}
     selection_counts = {}
     try:
         since = time.time() - float(window_seconds)
-        window_scores = self.score_store.window_scores_by_hotkey(since)
-        selection_counts = self.score_store.selection_counts_since(since)
+        window_scores, selection_counts = await asyncio.gather(
+            self.async_store.window_scores_by_hotkey(since),
+            self.async_store.selection_counts_since(since),
+        )
     except Exception as err:  # noqa: BLE001
         bt.logging.error(f"Failed to fetch window scores: {err}")
         window_scores = {}
         selection_counts = {}
 
     available_pool = [
-        int(uid) for uid in self.metagraph.uids if int(uid) not in exclude_set
+        uid for uid in self.metagraph.uids.tolist() if uid not in exclude_set
     ]
 
-    random.shuffle(available_pool)
+    availability = getattr(self, "availability", None)
+    quorum_factor = float(getattr(self.config.neuron, "ping_quorum_factor", 0) or 0)
+    if availability is not None and availability.is_warm:
+        # Read the background availability table instead of pinging everyone.
+        successful_uids = availability.available_uids()
+    elif quorum_factor > 0:
+        # Ping least-selected miners first and stop once enough have answered.
+        random.shuffle(available_pool)
+        available_pool.sort(
+            key=lambda uid: selection_counts.get(self.metagraph.hotkeys[uid], 0)
+        )
+        successful_uids, answered = await ping_until_quorum(
+            self.dendrite,
+            self.metagraph,
+            available_pool,
+            quorum=max(k, math.ceil(k * quorum_factor)),
+            timeout=30,
+        )
+        # Miners whose ping was cancelled are left out of this pass entirely.
+        available_pool = [uid for uid in available_pool if uid in answered]
+    else:
+        successful_uids = await ping_uids(
+            self.dendrite, self.metagraph, self.metagraph.uids, timeout=30
+        )
+    successful_set = {int(uid) for uid in successful_uids}
+
+    hotkeys = self.metagraph.hotkeys
+    index = SelectionIndex(
+        available_pool,
+        [selection_counts.get(hotkeys[uid]) for uid in available_pool],
+    )
     selected: List[int] = []
     hotkeys_to_increase: List[str] = []  # Hotkeys to increase selection count for
-    selected_ips: List[str] = []  # IPs to avoid selecting duplicates
-    selected_coldkeys: List[str] = []  # Coldkeys to avoid selecting duplicates
-
-    while len(selected) < k and len(available_pool) > 0:
-        available_selection_counts = [
-            selection_counts.get(self.metagraph.hotkeys[uid])
-            for uid in available_pool
-            if self.metagraph.hotkeys[uid] in selection_counts
-        ]
-        if len(available_selection_counts) > 0:
-            min_selection_count = min(available_selection_counts)
-        else:
-            min_selection_count = 0
-
-        for uid in available_pool:
-            if len(selected) >= k:
-                break
-            if uid in selected:
-                continue
-
-            hotkey = self.metagraph.hotkeys[uid]
-            current_count = selection_counts.get(hotkey, min_selection_count)
-
-            if current_count > min_selection_count:
-                continue
-
-            try:
-                available_pool.remove(uid)
-            except ValueError:
-                pass
-
-            ip = self.metagraph.axons[uid].ip
-            # Avoid selecting multiple miners from the same IP
-            if ip in selected_ips:
-                bt.logging.info(
-                    f"Skipping UID {uid} from IP {ip} to avoid duplicates. Selected IPs: {selected_ips}"
-                )
-                continue
-
-            coldkey = self.metagraph.coldkeys[uid]
-            if coldkey in selected_coldkeys:
-                bt.logging.info(
-                    f"Skipping UID {uid} with coldkey {coldkey} to avoid duplicates. Selected coldkeys: {selected_coldkeys}"
-                )
-
-            # Mark hotkey to increase selection count
-            hotkeys_to_increase.append(hotkey)
-
-            if uid not in successful_set:
-                continue
-
-            score = float(window_scores.get(hotkey, 0.0))
-
-            # Filter out very low score miners
-            if score < -2.0:
-                bt.logging.warning(f"UID {uid} has low score: {score}")
-                continue
-
-            selected.append(uid)
-            selected_ips.append(ip)
-            selected_coldkeys.append(coldkey)
+    selected_ips: Set[str] = set()  # IPs to avoid selecting duplicates
+    selected_coldkeys: Set[str] = set()  # Coldkeys to avoid selecting duplicates
+
+    while len(selected) < k:
+        uid = index.draw()
+        if uid is None:
+            break
+
+        hotkey = hotkeys[uid]
+        ip = self.metagraph.axons[uid].ip
+        # Avoid selecting multiple miners from the same IP
+        if ip in selected_ips:
+            bt.logging.info(
+                f"Skipping UID {uid} from IP {ip} to avoid duplicates. Selected IPs: {selected_ips}"
+            )
+            continue
+
+        coldkey = self.metagraph.coldkeys[uid]
+        if coldkey in selected_coldkeys:
+            bt.logging.info(
+                f"Skipping UID {uid} with coldkey {coldkey} to avoid duplicates. Selected coldkeys: {selected_coldkeys}"
+            )
+
+        # Mark hotkey to increase selection count
+        hotkeys_to_increase.append(hotkey)
+
+        if uid not in successful_set:
+            continue
+
+        score = float(window_scores.get(hotkey, 0.0))
+
+        # Filter out very low score miners
+        if score < -2.0:
+            bt.logging.warning(f"UID {uid} has low score: {score}")
+            continue
+
+        selected.append(uid)
+        selected_ips.add(ip)
+        selected_coldkeys.add(coldkey)
 
     if len(selected) < k:
         bt.logging.warning(
@@ -103,7 +164,7 @@ async def get_random_uids(self, k: int, exclude: List[int] = None) -> np.ndarray
         )
     else:
         bt.logging.info(
-            f"Selected miners: {selected}, selected counts: {[selection_counts.get(self.metagraph.hotkeys[uid], 0) for uid in selected]}"
+            f"Selected miners: {selected}, selected counts: {[selection_counts.get(hotkeys[uid], 0) for uid in selected]}"
         )
 
     return selected, hotkeys_to_increase
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Optional, Tuple
+
+import bittensor as bt
+
+from game.validator.clue_rules import Ruling
+
+Verdict = Tuple[bool, str]
+# (valid, reason, source): source is the stage that decided the clue.
+Adjudication = Tuple[bool, str, str]
+RulesFn = Callable[[], Tuple[Ruling, str]]
+OpponentFn = Callable[[], Awaitable[Tuple[bool, str]]]
+ArbiterFn = Callable[[], Awaitable[Verdict]]
+
+VALID = (True, "Clue is valid")
+OPPONENT = "opponent"
+RULES = "rules"
+ARBITER = "arbiter"
+
+
+async def adjudicate_clue(
+    check_rules: RulesFn,
+    ask_opponent: OpponentFn,
+    ask_arbiter: ArbiterFn,
+    speculative: bool = False,
+) -> Adjudication:
+    """Rules on a clue, running its stages concurrently.
+
+    A clue stands unless the opponent spymaster flags it (``ask_opponent``
+    returns ``(flagged, reason)``). The local rules run while the opponent
+    is being asked. If they find a mechanical break, a flag is upheld
+    without the arbiter. Otherwise the arbiter decides, because the rules
+    cannot see irregular forms or foreign words. With ``speculative`` the
+    arbiter starts alongside the opponent rather than after a flag, and its
+    "valid" decides at once. Stages still running when the verdict is known
+    are cancelled. Returns the verdict with the stage that decided it:
+    ``OPPONENT`` (no flag), ``RULES`` or ``ARBITER``.
+    """
+    opponent = asyncio.ensure_future(ask_opponent())
+    arbiter: Optional[asyncio.Future] = None
+    try:
+        # Let the opponent query go out, then run the rules while it is in flight.
+        await asyncio.sleep(0)
+        ruling, rule_reason = check_rules()
+        if speculative and ruling != Ruling.INVALID:
+            arbiter = asyncio.ensure_future(ask_arbiter())
+            await asyncio.wait([opponent, arbiter], return_when=asyncio.FIRST_COMPLETED)
+            if arbiter.done() and arbiter.result()[0]:
+                return (*arbiter.result(), ARBITER)
+        flagged, objection = await opponent
+        if not flagged:
+            return (*VALID, OPPONENT)
+        bt.logging.warning(f"Opponent flagged the clue: {objection}")
+        if ruling == Ruling.INVALID:
+            return False, rule_reason, RULES
+        if arbiter is None:
+            arbiter = asyncio.ensure_future(ask_arbiter())
+        return (*await arbiter, ARBITER)
+    finally:
+        for task in (opponent, arbiter):
+            if task is not None and not task.done():
+                task.cancel()
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import time
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import bittensor as bt
+
+from game.validator.backend_client import BackendClient
+from game.validator.score_store import (
+    INSERT_GAME_SQL,
+    INSERT_SELECTION_SQL,
+    INSERT_TURN_SQL,
+    MARK_SYNCED_SQL,
+    UPSERT_SCORES_ALL_SQL,
+    ScoreStore,
+    game_row,
+    scores_all_rows,
+    selection_rows,
+    turn_rows,
+)
+
+
+class _WriteJob:
+    def __init__(
+        self,
+        write: Callable[[Any], Any],
+        after: Optional[Callable[[], None]],
+        future: asyncio.Future,
+    ):
+        self.write = write
+        self.after = after
+        self.future = future
+        self.error: Optional[BaseException] = None
+
+
+class AsyncScoreStore:
+    """Asyncio facade over ``ScoreStore`` that keeps SQLite off the event loop.
+
+    Writes are queued to a single writer thread. It commits whatever has queued
+    up as one transaction (group commit), giving each job its own savepoint so a
+    failing job does not undo its neighbours. Reads run in worker threads on the
+    store's pooled WAL reader connections, so selection and weight-setting
+    reads never wait behind score writes.
+    """
+
+    def __init__(
+        self,
+        store: ScoreStore,
+        backend: Optional[BackendClient] = None,
+        max_batch: int = 64,
+    ):
+        self.store = store
+        self.backend = backend or BackendClient("", signer=store.signer)
+        self.max_batch = max(1, int(max_batch))
+        self.batches_committed = 0
+        self.jobs_committed = 0
+        self._queue: "queue.Queue[Optional[_WriteJob]]" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._writer_loop, name="score-writer", daemon=True
+        )
+        self._thread.start()
+
+    async def record_game(self, **game) -> None:
+        row = game_row(**game)
+        await self._submit(
+            lambda cur: cur.execute(INSERT_GAME_SQL, row),
+            after=lambda: self.store.note_local_game(row),
+        )
+
+    async def record_selections(self, selections: Iterable[Tuple[str, int]]) -> int:
+        rows = selection_rows(selections)
+        if not rows:
+            return 0
+        await self._submit(lambda cur: cur.executemany(INSERT_SELECTION_SQL, rows))
+        return len(rows)
+
+    async def record_turns(self, turns: Iterable[dict]) -> int:
+        rows = turn_rows(turns)
+        if not rows:
+            return 0
+        await self._submit(lambda cur: cur.executemany(INSERT_TURN_SQL, rows))
+        return len(rows)
+
+    async def mark_synced(self, room_id: str) -> None:
+        synced_at = int(time.time())
+        await self._submit(
+            lambda cur: cur.execute(MARK_SYNCED_SQL, (synced_at, room_id))
+        )
+
+    async def upsert_scores_all(self, rows: Sequence[dict]) -> None:
+        mapped_rows = scores_all_rows(rows)
+        if not mapped_rows:
+            return
+        await self._submit(
+            lambda cur: cur.executemany(UPSERT_SCORES_ALL_SQL, mapped_rows),
+            after=lambda: self.store.note_scores_all(mapped_rows),
+        )
+
+    async def pending(self) -> List[Dict[str, object]]:
+        return list(await asyncio.to_thread(self.store.pending))
+
+    async def window_scores_by_hotkey(self, since_ts: float) -> Dict[str, float]:
+        return await asyncio.to_thread(self.store.window_scores_by_hotkey, since_ts)
+
+    async def selection_counts_since(self, since_ts: float) -> Dict[str, int]:
+        return await asyncio.to_thread(self.store.selection_counts_since, since_ts)
+
+    async def games_in_window(self, since_ts: float) -> int:
+        return await asyncio.to_thread(self.store.games_in_window, since_ts)
+
+    async def turn_latency_stats(
+        self, since_ts: float, role: Optional[str] = None
+    ) -> Dict[Tuple[str, str], Dict[str, float]]:
+        return await asyncio.to_thread(self.store.turn_latency_stats, since_ts, role)
+
+    async def max_scores_all_id(self) -> int:
+        return await asyncio.to_thread(self.store.max_scores_all_id)
+
+    async def sync_pending(self) -> int:
+        """Pushes unsynced rows to the backend API.
+
+        Returns the number of rows marked as synced.
+        """
+
+        if not self.store.backend_url:
+            bt.logging.warning("No backend URL configured for score syncing.")
+            return 0
+
+        to_sync = await self.pending()
+        if not to_sync:
+            return 0
+
+        synced = 0
+        for row in to_sync:
+            payload = {
+                "red": {
+                    "spymaster": {
+                        "hotkey": row["rs"],
+                        "score": row["score_rs"],
+                    },
+                    "operative": {
+                        "hotkey": row["ro"],
+                        "score": row["score_ro"],
+                    },
+                },
+                "blue": {
+                    "spymaster": {
+                        "hotkey": row["bs"],
+                        "score": row["score_bs"],
+                    },
+                    "operative": {
+                        "hotkey": row["bo"],
+                        "score": row["score_bo"],
+                    },
+                },
+                "reason": row["reason"],
+            }
+            try:
+                resp = await self.backend.patch(
+                    self.store.backend_url + "/" + row["room_id"], json=payload
+                )
+                if resp.status in (200, 201, 202, 204):
+                    await self.mark_synced(row["room_id"])
+                    synced += 1
+                else:
+                    bt.logging.error(
+                        f"Failed to sync score {row['room_id']}: {resp.status} {resp.text}"
+                    )
+            except Exception as err:  # noqa: BLE001
+                bt.logging.error(f"Exception syncing score {row['room_id']}: {err}")
+            bt.logging.info(f"Upload {synced} scores")
+        await self.sync_scores_all()
+        return synced
+
+    async def sync_scores_all(self) -> int:
+        if not self.store.fetch_url:
+            bt.logging.debug("No fetch URL configured; skipping scores_all sync.")
+            return 0
+
+        try:
+            params = {}
+            since_id = await self.max_scores_all_id()
+            params["since_id"] = since_id
+            params["limit"] = 100
+            while True:
+                resp = await self.backend.get(
+                    self.store.fetch_url, params=params, timeout=15
+                )
+                if resp.status != 200:
+                    bt.logging.error(
+                        f"Failed to sync scores_all: {resp.status} {resp.text}"
+                    )
+                    return 0
+                payload = resp.json()
+                if not isinstance(payload["data"], list):
+                    bt.logging.error(
+                        "Unexpected payload when syncing scores_all; expected list."
+                    )
+                    return
+                await self.upsert_scores_all(payload["data"])
+                bt.logging.info(
+                    f"Synced Score: {params['since_id'] + payload['meta']['count']} / {payload['meta']['total']}"
+                )
+                if not payload["meta"]["has_more"]:
+                    break
+                params["since_id"] = payload["meta"]["next_since_id"]
+        except Exception as err:  # noqa: BLE001
+            bt.logging.error(f"Exception refreshing scores_all: {err}")
+            return 0
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Flushes queued writes and stops the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+
+    async def _submit(
+        self,
+        write: Callable[[Any], Any],
+        after: Optional[Callable[[], None]] = None,
+    ) -> None:
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put(_WriteJob(write, after, future))
+        await future
+
+    def _writer_loop(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            jobs = [job]
+            stop = False
+            while len(jobs) < self.max_batch:
+                try:
+                    job = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    stop = True
+                    break
+                jobs.append(job)
+            self._commit(jobs)
+            if stop:
+                return
+
+    def _commit(self, jobs: List[_WriteJob]) -> None:
+        try:
+            with self.store._transaction() as cur:
+                for job in jobs:
+                    cur.execute("SAVEPOINT job")
+                    try:
+                        job.write(cur)
+                    except Exception as err:  # noqa: BLE001
+                        cur.execute("ROLLBACK TO job")
+                        job.error = err
+                    cur.execute("RELEASE job")
+        except Exception as err:  # noqa: BLE001
+            bt.logging.error(f"Score write batch failed: {err}")
+            for job in jobs:
+                job.error = job.error or err
+        else:
+            self.batches_committed += 1
+            self.jobs_committed += sum(1 for job in jobs if job.error is None)
+        for job in jobs:
+            if job.error is None and job.after is not None:
+                try:
+                    job.after()
+                except Exception as err:  # noqa: BLE001
+                    bt.logging.error(f"Score write follow-up failed: {err}")
+            job.future.get_loop().call_soon_threadsafe(_resolve, job.future, job.error)
+
+
+def _resolve(future: asyncio.Future, error: Optional[BaseException]) -> None:
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(None)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional
+
+import bittensor as bt
+
+import game
+
+
+class MinerAvailability:
+    """Availability record for a single uid."""
+
+    def __init__(self, uid: int, hotkey: str, history: int):
+        self.uid = uid
+        self.hotkey = hotkey
+        self.last_seen: float = 0.0
+        self.last_probe: float = 0.0
+        self.next_probe: float = 0.0
+        self.version: Optional[str] = None
+        self.outcomes: Deque[bool] = deque(maxlen=history)
+
+    @property
+    def success_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return sum(self.outcomes) / len(self.outcomes)
+
+    @property
+    def last_ok(self) -> bool:
+        return bool(self.outcomes) and self.outcomes[-1]
+
+
+class AvailabilityTracker:
+    """Keeps a per-uid availability table up to date in the background.
+
+    The whole metagraph is pinged once at startup. After that, each entry is
+    re-probed once it is older than ``stale_after`` seconds, a small batch at a
+    time, with jitter so the probes spread out over the window. Miner selection
+    reads the table instead of pinging every uid before each game.
+    """
+
+    def __init__(
+        self,
+        validator,
+        interval: float = 5.0,
+        stale_after: float = 300.0,
+        batch_size: int = 32,
+        timeout: float = 30.0,
+        history: int = 20,
+        min_success_rate: float = 0.5,
+    ):
+        self.validator = validator
+        self.interval = float(interval)
+        self.stale_after = float(stale_after)
+        self.batch_size = max(1, int(batch_size))
+        self.timeout = float(timeout)
+        self.history = int(history)
+        self.min_success_rate = float(min_success_rate)
+        self.entries: Dict[int, MinerAvailability] = {}
+        self.is_warm = False
+
+    def entry(self, uid: int) -> MinerAvailability:
+        uid = int(uid)
+        hotkey = self.validator.metagraph.hotkeys[uid]
+        current = self.entries.get(uid)
+        if current is None or current.hotkey != hotkey:
+            # New uid or the hotkey was replaced: start from a clean record.
+            current = MinerAvailability(uid, hotkey, self.history)
+            self.entries[uid] = current
+        return current
+
+    def record(
+        self, uid: int, ok: bool, version: Optional[str] = None, now: float = None
+    ) -> None:
+        now = time.time() if now is None else now
+        entry = self.entry(uid)
+        entry.outcomes.append(bool(ok))
+        entry.last_probe = now
+        entry.next_probe = now + self.stale_after * random.uniform(0.8, 1.2)
+        if ok:
+            entry.last_seen = now
+            entry.version = version
+
+    def note_turn(self, uid: int, answered: bool, now: float = None) -> None:
+        """Folds a game turn into the table; an unanswered turn triggers a re-probe."""
+        now = time.time() if now is None else now
+        entry = self.entry(uid)
+        if answered:
+            entry.last_seen = now
+            return
+        entry.outcomes.append(False)
+        entry.next_probe = now
+
+    def available_uids(self) -> List[int]:
+        """Uids whose latest probe succeeded on our version and that are mostly reachable."""
+        horizon = time.time() - 2 * self.stale_after
+        return [
+            uid
+            for uid, entry in self.entries.items()
+            if entry.last_ok
+            and entry.version == game.__version__
+            and entry.last_seen >= horizon
+            and entry.success_rate >= self.min_success_rate
+            and uid < len(self.validator.metagraph.hotkeys)
+            and entry.hotkey == self.validator.metagraph.hotkeys[uid]
+        ]
+
+    def due_uids(self, now: float = None) -> List[int]:
+        now = time.time() if now is None else now
+        due = [
+            int(uid)
+            for uid in self.validator.metagraph.uids
+            if self.entry(uid).next_probe <= now
+        ]
+        due.sort(key=lambda uid: self.entries[uid].next_probe)
+        return due[: self.batch_size]
+
+    async def probe(self, uids: Iterable[int]) -> None:
+        uids = [int(uid) for uid in uids]
+        if not uids:
+            return
+        axons = [self.validator.metagraph.axons[uid] for uid in uids]
+        try:
+            responses = await self.validator.dendrite.forward(
+                axons,
+                game.protocol.Ping(),
+                timeout=self.timeout,
+                deserialize=True,
+            )
+        except Exception as err:  # noqa: BLE001
+            bt.logging.error(f"Availability probe failed: {err}")
+            return
+        now = time.time()
+        for uid, response in zip(uids, responses):
+            ok = bool(response is not None and response.is_available)
+            self.record(uid, ok, response.version if ok else None, now=now)
+
+    async def run(self) -> None:
+        uids = [int(uid) for uid in self.validator.metagraph.uids]
+        bt.logging.info(f"Availability tracker warming up on {len(uids)} uids")
+        await self.probe(uids)
+        self.is_warm = True
+        bt.logging.info(
+            f"Availability tracker ready: {len(self.available_uids())} available uids"
+        )
+        while not self.validator.should_exit:
+            await asyncio.sleep(self.interval)
+            await self.probe(self.due_uids())
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import time
+from typing import Any, Callable, Dict, Optional
+
+import aiohttp
+import bittensor as bt
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Raised when the backend circuit breaker is open and calls are refused."""
+
+
+class BackendResponse:
+    """Status and body of a finished backend call."""
+
+    def __init__(self, status: int, text: str):
+        self.status = status
+        self.text = text
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+class BackendClient:
+    """Shared HTTP client for the rooms and scores API.
+
+    Keeps one keep-alive connection pool for the validator's lifetime and
+    reuses signed headers until they are ``header_ttl`` seconds old, instead of
+    paying a TLS handshake and an sr25519 signature on every call. Idempotent
+    calls are retried on network errors and 429/5xx responses with jittered
+    backoff. After ``failure_threshold`` consecutive failed calls the circuit
+    opens and calls fail fast for ``reset_after`` seconds. It then turns
+    half-open: one trial call is let through while the rest still fail fast.
+    A successful trial closes the circuit; a failed one re-opens it.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        signer: Optional[Callable[[], Dict[str, str]]] = None,
+        timeout: float = 10.0,
+        retries: int = 2,
+        backoff: float = 0.5,
+        header_ttl: float = 30.0,
+        failure_threshold: int = 5,
+        reset_after: float = 30.0,
+        max_connections: int = 32,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.signer = signer
+        self.timeout = float(timeout)
+        self.retries = max(0, int(retries))
+        self.backoff = float(backoff)
+        self.header_ttl = float(header_ttl)
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_after = float(reset_after)
+        self.max_connections = int(max_connections)
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self._trial_in_flight = False
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._headers: Dict[str, str] = {}
+        self._headers_at = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return time.monotonic() < self.open_until
+
+    @property
+    def is_half_open(self) -> bool:
+        return bool(self.open_until) and not self.is_open
+
+    def headers(self) -> Dict[str, str]:
+        """Signed headers, re-signed once they are older than ``header_ttl``."""
+        if self.signer is None:
+            return {}
+        now = time.monotonic()
+        if not self._headers or now - self._headers_at >= self.header_ttl:
+            self._headers = self.signer()
+            self._headers_at = now
+        return self._headers
+
+    def invalidate_headers(self) -> None:
+        self._headers = {}
+
+    def url(self, path: str) -> str:
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    async def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections, keepalive_timeout=60
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def get(self, path: str, **kwargs) -> BackendResponse:
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs) -> BackendResponse:
+        return await self.request("POST", path, **kwargs)
+
+    async def patch(self, path: str, **kwargs) -> BackendResponse:
+        return await self.request("PATCH", path, **kwargs)
+
+    async def delete(self, path: str, **kwargs) -> BackendResponse:
+        return await self.request("DELETE", path, **kwargs)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotent: Optional[bool] = None,
+        timeout: Optional[float] = None,
+    ) -> BackendResponse:
+        """Sends a signed request and returns the final response.
+
+        Non-2xx responses are returned rather than raised. Network errors and
+        timeouts are raised once the retries run out. ``idempotent`` defaults
+        to every method except POST; only idempotent calls are retried.
+        """
+        trial = self._admit()
+        try:
+            return await self._request(
+                method,
+                path,
+                json=json,
+                params=params,
+                idempotent=idempotent,
+                timeout=timeout,
+            )
+        finally:
+            if trial:
+                self._trial_in_flight = False
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Any,
+        params: Optional[Dict[str, Any]],
+        idempotent: Optional[bool],
+        timeout: Optional[float],
+    ) -> BackendResponse:
+        if idempotent is None:
+            idempotent = method.upper() != "POST"
+        attempts = 1 + (self.retries if idempotent else 0)
+        url = self.url(path)
+        session = await self.session()
+        request_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+        resigned = False
+        attempt = 0
+        while True:
+            try:
+                async with session.request(
+                    method,
+                    url,
+                    json=json,
+                    params=params,
+                    headers=self.headers(),
+                    timeout=request_timeout,
+                ) as resp:
+                    response = BackendResponse(resp.status, await resp.text())
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                attempt += 1
+                if attempt >= attempts:
+                    self._record_failure()
+                    raise
+                bt.logging.debug(f"{method} {url} failed ({err}), retrying")
+                await self._sleep_backoff(attempt)
+                continue
+
+            if response.status == 401 and not resigned and self.signer is not None:
+                # The cached signature may have aged out on the server side.
+                resigned = True
+                self.invalidate_headers()
+                continue
+            if response.status in RETRYABLE_STATUSES:
+                attempt += 1
+                if attempt < attempts:
+                    await self._sleep_backoff(attempt)
+                    continue
+                self._record_failure()
+                return response
+            self._record_success()
+            return response
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _sleep_backoff(self, attempt: int) -> None:
+        await asyncio.sleep(
+            self.backoff * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+        )
+
+    def _admit(self) -> bool:
+        """Raises if the circuit refuses the call; returns True for a half-open trial."""
+        if self.is_open:
+            raise CircuitOpenError(
+                f"Backend circuit open for another {self.open_until - time.monotonic():.0f}s"
+            )
+        if not self.is_half_open:
+            return False
+        if self._trial_in_flight:
+            raise CircuitOpenError(
+                "Backend circuit half-open; a trial call is in flight"
+            )
+        self._trial_in_flight = True
+        return True
+
+    def _record_success(self) -> None:
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+
+    def _record_failure(self) -> None:
+        self.consecutive_failures += 1
+        # A failure while the circuit is half-open re-opens it straight away.
+        if self.open_until or self.consecutive_failures >= self.failure_threshold:
+            if not self.is_open:
+                bt.logging.warning(
+                    f"Backend unreachable after {self.consecutive_failures} failed calls; "
+                    f"pausing calls for {self.reset_after:.0f}s"
+                )
+            self.open_until = time.monotonic() + self.reset_after
@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+import bittensor as bt
+from openai import AsyncOpenAI
+
+from game.utils.ruleBatchSysPrompt import ruleBatchSysPrompt
+from game.utils.ruleSysPrompt import ruleSysPrompt
+
+Verdict = Tuple[bool, str]
+RespondFn = Callable[[List[Dict[str, str]]], Awaitable[str]]
+
+
+def normalize_clue(clue: str) -> str:
+    return " ".join(clue.split()).lower()
+
+
+def verdict_key(clue: str, number: int, board_words: List[str]) -> str:
+    """Cache key for a clue on a board; word order and case do not matter."""
+    words = sorted(word.strip().lower() for word in board_words)
+    raw = json.dumps([normalize_clue(clue), int(number), words])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def case_text(clue: str, number: int, board_words: List[str]) -> str:
+    return f"Clue: {clue}, Number: {number}, Board Words: {board_words}"
+
+
+def parse_verdict(result: Dict[str, Any]) -> Verdict:
+    if result["valid"] == False:
+        return False, result["reasoning"]
+    return True, "Clue is valid"
+
+
+class ClueVerdictCache:
+    """SQLite table of arbiter verdicts, shared by every game and kept across restarts.
+
+    ``prune`` bounds it by age and row count.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        folder = os.path.dirname(db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            db_path, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL;")
+        self._conn.execute("PRAGMA synchronous=NORMAL;")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS clue_verdicts (
+                key TEXT PRIMARY KEY,
+                clue TEXT NOT NULL,
+                valid INTEGER NOT NULL,
+                reason TEXT NOT NULL,
+                created_at REAL NOT NULL
+            );
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_clue_verdicts_created_at "
+            "ON clue_verdicts(created_at);"
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM clue_verdicts"
+            ).fetchone()
+        return int(count)
+
+    def get(self, key: str) -> Optional[Verdict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT valid, reason FROM clue_verdicts WHERE key=?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return bool(row[0]), row[1]
+
+    def put(self, key: str, clue: str, verdict: Verdict) -> None:
+        valid, reason = verdict
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO clue_verdicts(key, clue, valid, reason, created_at) "
+                "VALUES(?, ?, ?, ?, ?)",
+                (key, clue, int(valid), reason, time.time()),
+            )
+
+    def prune(self, max_age: float, max_rows: int, now: Optional[float] = None) -> int:
+        """Drops verdicts older than ``max_age`` seconds, then the oldest ones
+        beyond ``max_rows``; returns how many went."""
+        now = time.time() if now is None else now
+        with self._lock:
+            deleted = self._conn.execute(
+                "DELETE FROM clue_verdicts WHERE created_at < ?", (now - max_age,)
+            ).rowcount
+            deleted += self._conn.execute(
+                """
+                DELETE FROM clue_verdicts WHERE key IN (
+                    SELECT key FROM clue_verdicts
+                    ORDER BY created_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (max(0, int(max_rows)),),
+            ).rowcount
+        return deleted
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class _Case:
+    __slots__ = ("clue", "number", "board_words", "future")
+
+    def __init__(self, clue: str, number: int, board_words: List[str]):
+        self.clue = clue
+        self.number = number
+        self.board_words = board_words
+        self.future = asyncio.get_running_loop().create_future()
+
+
+class ArbiterBatcher:
+    """Folds clue checks that arrive close together into one model request.
+
+    A check that finds the batcher idle is sent at once, so a lone dispute
+    never waits. Checks that arrive while a request is in flight open a
+    ``window``-second collection window; a batch is sent when the window
+    closes or ``max_batch`` checks are waiting. The verdicts are routed back
+    by case id, and cases the batched answer leaves out or garbles are retried
+    as single requests. A lone case is always sent as a single request.
+    """
+
+    def __init__(self, respond: RespondFn, window: float = 0.01, max_batch: int = 8):
+        self.respond = respond
+        self.window = float(window)
+        self.max_batch = max(1, int(max_batch))
+        self.batches = 0
+        self.batched_cases = 0
+        self.fallbacks = 0
+        self._pending: List[_Case] = []
+        self._timer: Optional[asyncio.Task] = None
+        self._sending = 0
+
+    async def adjudicate(
+        self, clue: str, number: int, board_words: List[str]
+    ) -> Verdict:
+        case = _Case(clue, number, board_words)
+        self._pending.append(case)
+        idle = len(self._pending) == 1 and not self._sending
+        if idle or len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.ensure_future(self._send_later())
+        return await case.future
+
+    def _take(self) -> List[_Case]:
+        # Checks cancelled while waiting drop out of the batch.
+        cases = [case for case in self._pending if not case.future.done()]
+        self._pending = []
+        return cases
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # Counted before the task starts, so checks arriving meanwhile batch up.
+        self._sending += 1
+        asyncio.ensure_future(self._send(self._take()))
+
+    async def _send_later(self) -> None:
+        await asyncio.sleep(self.window)
+        self._timer = None
+        self._flush()
+
+    async def _send(self, cases: List[_Case]) -> None:
+        try:
+            if len(cases) == 1:
+                await self._send_single(cases[0])
+            elif cases:
+                await self._send_batch(cases)
+        finally:
+            self._sending -= 1
+            for case in cases:
+                if not case.future.done():
+                    case.future.cancel()
+
+    async def _send_batch(self, cases: List[_Case]) -> None:
+        lines = [
+            f"Case {index}: {case_text(case.clue, case.number, case.board_words)}"
+            for index, case in enumerate(cases)
+        ]
+        messages = [
+            {"role": "system", "content": ruleBatchSysPrompt},
+            {"role": "user", "content": "\n".join(lines)},
+        ]
+        verdicts: Dict[int, Verdict] = {}
+        try:
+            result = json.loads(await self.respond(messages))
+            for entry in result["verdicts"]:
+                verdicts[int(entry["id"])] = parse_verdict(entry)
+        except Exception as err:  # noqa: BLE001
+            bt.logging.warning(f"Batched clue arbitration failed: {err}")
+        self.batches += 1
+        self.batched_cases += len(cases)
+        missing = []
+        for index, case in enumerate(cases):
+            if index in verdicts:
+                if not case.future.done():
+                    case.future.set_result(verdicts[index])
+            else:
+                missing.append(case)
+        if missing:
+            self.fallbacks += len(missing)
+            await asyncio.gather(*[self._send_single(case) for case in missing])
+
+    async def _send_single(self, case: _Case) -> None:
+        messages = [
+            {"role": "system", "content": ruleSysPrompt},
+            {
+                "role": "user",
+                "content": case_text(case.clue, case.number, case.board_words),
+            },
+        ]
+        try:
+            result = json.loads(await self.respond(messages))
+            bt.logging.info(f"Rule System Response: {result}")
+            verdict = parse_verdict(result)
+        except Exception as err:  # noqa: BLE001
+            if not case.future.done():
+                case.future.set_exception(err)
+            return
+        if not case.future.done():
+            case.future.set_result(verdict)
+
+
+class _Inflight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class ClueArbiter:
+    """Rules on clues the opponent spymaster flagged, without blocking the event loop.
+
+    At most ``max_concurrency`` model calls run at once, and each check gives
+    up after ``timeout`` seconds, queueing included. When the arbiter cannot
+    answer in time, the flag is unconfirmed and the clue stands. Verdicts are
+    cached by normalised clue, number and unrevealed board words, and checks
+    for the same key that arrive while one is running share its result.
+    With ``batch_window`` set, model calls go through an ``ArbiterBatcher``.
+    """
+
+    def __init__(
+        self,
+        cache: ClueVerdictCache,
+        api_key: Optional[str] = None,
+        model: str = "gpt-5",
+        effort: str = "medium",
+        max_concurrency: int = 4,
+        timeout: float = 60.0,
+        respond: Optional[RespondFn] = None,
+        history: int = 512,
+        batch_window: float = 0.0,
+        max_batch: int = 8,
+    ):
+        self.cache = cache
+        self.api_key = api_key
+        self.model = model
+        self.effort = effort
+        self.timeout = float(timeout)
+        self.respond = respond or self._openai_respond
+        self.hits = 0
+        self.misses = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.latencies: Deque[float] = deque(maxlen=history)
+        self._semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+        self._inflight: Dict[str, _Inflight] = {}
+        self._client = None
+        self.batcher = ArbiterBatcher(
+            self._limited_respond, window=batch_window, max_batch=max_batch
+        )
+
+    async def check(self, clue: str, number: int, board_words: List[str]) -> Verdict:
+        """Returns ``(valid, reason)`` for a clue on the given unrevealed words.
+
+        Cancelling a check only cancels the model call once no other caller
+        is waiting for the same verdict.
+        """
+        key = verdict_key(clue, number, board_words)
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        entry = self._inflight.get(key)
+        if entry is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._run(key, clue, number, board_words))
+            entry = self._inflight[key] = _Inflight(task)
+        else:
+            self.hits += 1
+        entry.waiters += 1
+        try:
+            return await asyncio.shield(entry.task)
+        finally:
+            entry.waiters -= 1
+            if entry.waiters == 0 and not entry.task.done():
+                entry.task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        latencies = sorted(self.latencies)
+        return {
+            "lookups": lookups,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "latency_p50": _percentile(latencies, 0.50),
+            "latency_p95": _percentile(latencies, 0.95),
+            "batches": self.batcher.batches,
+            "batched_cases": self.batcher.batched_cases,
+            "batch_fallbacks": self.batcher.fallbacks,
+        }
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+        self.cache.close()
+
+    async def _run(
+        self, key: str, clue: str, number: int, board_words: List[str]
+    ) -> Verdict:
+        started = time.perf_counter()
+        try:
+            verdict = await asyncio.wait_for(
+                self._adjudicate(clue, number, board_words), self.timeout
+            )
+            await asyncio.to_thread(self.cache.put, key, clue, verdict)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            bt.logging.warning(
+                f"Clue arbiter timed out after {self.timeout:.0f}s; accepting clue '{clue}'"
+            )
+            verdict = (True, "Clue is valid")
+        except Exception as err:  # noqa: BLE001
+            self.errors += 1
+            bt.logging.error(f"Clue arbiter failed: {err}; accepting clue '{clue}'")
+            verdict = (True, "Clue is valid")
+        finally:
+            entry = self._inflight.get(key)
+            if entry is not None and entry.task is asyncio.current_task():
+                del self._inflight[key]
+        self.latencies.append(time.perf_counter() - started)
+        return verdict
+
+    async def _adjudicate(
+        self, clue: str, number: int, board_words: List[str]
+    ) -> Verdict:
+        if self.batcher.window > 0:
+            return await self.batcher.adjudicate(clue, number, board_words)
+        messages = [
+            {"role": "system", "content": ruleSysPrompt},
+            {"role": "user", "content": case_text(clue, number, board_words)},
+        ]
+        result = json.loads(await self._limited_respond(messages))
+        bt.logging.info(f"Rule System Response: {result}")
+        return parse_verdict(result)
+
+    async def _limited_respond(self, messages: List[Dict[str, str]]) -> str:
+        async with self._semaphore:
+            return await self.respond(messages)
+
+    async def _openai_respond(self, messages: List[Dict[str, str]]) -> str:
+        if self._client is None:
+            self._client = AsyncOpenAI(api_key=self.api_key)
+        result = await self._client.responses.create(
+            model=self.model,
+            input=messages,
+            reasoning={"effort": self.effort},
+        )
+        return result.output_text
+
+
+def _percentile(values: List[float], fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    index = min(len(values) - 1, int(round(fraction * (len(values) - 1))))
+    return values[index]
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import os
+import re
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# Shortest run of letters two words must share to look like a compound part.
+MIN_SHARED_PART = 4
+# Both halves of a compound (horse|shoe, mail|box) must be at least this long.
+MIN_COMPOUND_WORD = 3
+# Plain -s/-ed/-ing endings on shorter words too often make another word
+# (news, hers, bated), so those forms are left to a judge.
+MIN_FORM_BASE = 4
+# Non-overlapping words closer than this may be irregular forms (run/ran).
+MAX_FORM_DISTANCE = 1
+
+_SEPARATORS = re.compile(r"[\s\-_]+")
+_LETTERS = re.compile(r"^[a-z']+$")
+_NUMBER_WORDS = frozenset(
+    "zero one two three four five six seven eight nine ten eleven twelve".split()
+)
+_WORDLISTS = ("wordlist-eng.txt", "wordlist-common.txt")
+_SIBILANT_ENDINGS = ("s", "x", "z", "ch", "sh")
+_VOWELS = "aeiou"
+
+
+class Ruling(Enum):
+    VALID = "valid"
+    INVALID = "invalid"
+    AMBIGUOUS = "ambiguous"
+
+
+def normalize_word(word: str) -> str:
+    return word.strip().strip("\"'.,!?").lower()
+
+
+@lru_cache(maxsize=1)
+def known_words() -> FrozenSet[str]:
+    """Words a compound may be built from: the board vocabulary and common words."""
+    folder = os.path.join(os.path.dirname(os.path.dirname(__file__)), "utils")
+    words = set()
+    for name in _WORDLISTS:
+        with open(os.path.join(folder, name)) as f:
+            words.update(normalize_word(line) for line in f if line.strip())
+    return frozenset(words)
+
+
+def inflections(word: str) -> Dict[str, bool]:
+    """Regular plural, -ed and -ing forms of ``word``.
+
+    Each form maps to whether it is unmistakable. Plain endings on words
+    shorter than ``MIN_FORM_BASE`` are not: new+s is also the word news.
+    """
+    plain = len(word) >= MIN_FORM_BASE
+    # stop -> stopped, run -> running; star+ed is stared, a different word.
+    doubles = (
+        len(word) >= 3
+        and word[-1] not in _VOWELS + "wxy"
+        and word[-2] in _VOWELS
+        and word[-3] not in _VOWELS
+    )
+    forms: Dict[str, bool] = {}
+    if word.endswith(_SIBILANT_ENDINGS):
+        forms[word + "es"] = True
+    else:
+        forms[word + "s"] = plain
+    if len(word) > 2 and word[-1] == "y" and word[-2] not in _VOWELS:
+        forms[word[:-1] + "ies"] = True
+        forms[word[:-1] + "ied"] = True
+    if word.endswith("e") and not word.endswith("ee"):
+        forms[word + "d"] = True
+        forms[word[:-1] + "ing"] = True
+    else:
+        forms.setdefault(word + "ed", plain and not doubles)
+        forms.setdefault(word + "ing", plain and not doubles)
+    if doubles:
+        forms[word + word[-1] + "ed"] = True
+        forms[word + word[-1] + "ing"] = True
+    return forms
+
+
+def form_of(word: str, base: str) -> Optional[bool]:
+    """Whether ``word`` is a regular form of ``base``: True if unmistakably,
+    False if it only may be, None if not at all."""
+    return inflections(base).get(word)
+
+
+def stem(word: str) -> str:
+    """Crude suffix stripping, used only to spot words that may be related."""
+    if len(word) > 4 and word.endswith(("ies", "ied")):
+        return word[:-3] + "y"
+    for suffix in ("ing", "ers", "er", "ed", "es", "s"):
+        if len(word) > len(suffix) + 2 and word.endswith(suffix):
+            if suffix == "s" and word.endswith("ss"):
+                break
+            word = word[: -len(suffix)]
+            if len(word) > 3 and word[-1] == word[-2] and word[-1] not in "aeiouls":
+                word = word[:-1]  # stopped -> stop, running -> run
+            break
+    if len(word) > 3 and word.endswith("e"):
+        word = word[:-1]
+    return word
+
+
+def _grams(word: str) -> FrozenSet[str]:
+    size = MIN_SHARED_PART
+    return frozenset(word[i : i + size] for i in range(len(word) - size + 1))
+
+
+def _within_distance(a: str, b: str, limit: int) -> bool:
+    """Levenshtein distance of ``a`` and ``b`` is at most ``limit``."""
+    if abs(len(a) - len(b)) > limit:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        current = [i]
+        for j, y in enumerate(b, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (x != y))
+            )
+        if min(current) > limit:
+            return False
+        previous = current
+    return previous[-1] <= limit
+
+
+class _BoardWord:
+    __slots__ = ("word", "joined", "parts", "stems", "grams")
+
+    def __init__(self, word: str):
+        self.word = word
+        parts = [part for part in _SEPARATORS.split(normalize_word(word)) if part]
+        self.joined = "".join(parts)
+        self.parts = parts if len(parts) > 1 else []
+        self.stems = {stem(self.joined)} | {stem(part) for part in self.parts}
+        self.grams = _grams(self.joined)
+
+
+class ClueRuleEngine:
+    """Decides the mechanical Codenames clue rules without a model call.
+
+    Built once per board. ``check`` rules a clue against the words still
+    face up. A clue that is one of them, a regular plural/-ed/-ing form of
+    one, a part of a multi-word one, or a compound with one whose other half
+    is a known word (horse for HORSESHOE, mailbox for BOX) is INVALID. So is
+    a single letter. A ruling of INVALID settles a flagged clue without the
+    arbiter, so anything less certain is AMBIGUOUS and needs a judge: letters
+    found inside a word (pen in OPEN, penguin for PEN), endings that may make
+    another word (news for NEW, cater for CAT), other resemblances (a shared
+    word part, a near spelling), several words, non-letters and number words.
+    Any other single word is VALID; irregular forms (broke for BREAK) and
+    foreign words are not detected.
+    """
+
+    def __init__(self, board_words: Iterable[str]):
+        self._words: Dict[str, _BoardWord] = {
+            normalize_word(word): _BoardWord(word) for word in board_words
+        }
+        self._known = known_words().union(
+            *[{board.joined, *board.parts} for board in self._words.values()]
+        )
+
+    def _compound(self, short: str, long: str) -> bool:
+        """``short`` starts or ends ``long`` and what is left is a known word."""
+        if len(short) < MIN_COMPOUND_WORD or len(short) >= len(long):
+            return False
+        if long.startswith(short):
+            rest = long[len(short) :]
+        elif long.endswith(short):
+            rest = long[: -len(short)]
+        else:
+            return False
+        return len(rest) >= MIN_COMPOUND_WORD and rest in self._known
+
+    def check(self, clue: str, unrevealed: Iterable[str]) -> Tuple[Ruling, str]:
+        text = normalize_word(clue or "")
+        if not text:
+            return Ruling.INVALID, "Clue is empty"
+        active = []
+        for word in unrevealed:
+            board = self._words.get(normalize_word(word))
+            active.append(board if board is not None else _BoardWord(word))
+
+        parts = [part for part in _SEPARATORS.split(text) if part]
+        if len(parts) > 1:
+            for part in parts:
+                ruling, reason = self._check_word(part, active)
+                if ruling == Ruling.INVALID:
+                    return ruling, reason
+            return Ruling.AMBIGUOUS, f"Clue '{clue}' is more than one word"
+        return self._check_word(parts[0], active)
+
+    def _check_word(self, text: str, active: List[_BoardWord]) -> Tuple[Ruling, str]:
+        if len(text) == 1:
+            return Ruling.INVALID, f"Clue '{text}' is a single letter"
+        ambiguous = None
+        clue_stem = stem(text)
+        clue_grams = _grams(text)
+        for board in active:
+            joined = board.joined
+            if text == joined:
+                return Ruling.INVALID, f"Clue '{text}' is the board word {board.word}"
+            if text in board.parts:
+                return Ruling.INVALID, f"Clue '{text}' is part of {board.word}"
+            for part in [joined] + board.parts:
+                sure = form_of(text, part)
+                if sure is None:
+                    sure = form_of(part, text)
+                if sure:
+                    return Ruling.INVALID, f"Clue '{text}' is a form of {board.word}"
+                if sure is not None and ambiguous is None:
+                    ambiguous = f"Clue '{text}' may be a form of {board.word}"
+            for part in board.parts or [joined]:
+                if self._compound(text, part) or self._compound(part, text):
+                    return (
+                        Ruling.INVALID,
+                        f"Clue '{text}' and board word {board.word} form a compound",
+                    )
+            if ambiguous is None and (text in joined or joined in text):
+                ambiguous = f"Clue '{text}' and board word {board.word} share letters"
+            if ambiguous is None and clue_stem in board.stems:
+                ambiguous = f"Clue '{text}' may be a form of {board.word}"
+            if ambiguous is not None:
+                continue
+            if not clue_grams.isdisjoint(board.grams):
+                ambiguous = f"Clue '{text}' shares a word part with {board.word}"
+            elif min(len(text), len(joined)) >= 3 and _within_distance(
+                text, joined, MAX_FORM_DISTANCE
+            ):
+                ambiguous = f"Clue '{text}' may be a form of {board.word}"
+        if ambiguous is not None:
+            return Ruling.AMBIGUOUS, ambiguous
+        if not _LETTERS.match(text):
+            return Ruling.AMBIGUOUS, f"Clue '{text}' is not a plain word"
+        if text in _NUMBER_WORDS:
+            return Ruling.AMBIGUOUS, f"Clue '{text}' names a number"
+        return Ruling.VALID, "Clue is valid"
@@ -20,17 +20,15 @@ import asyncio
 import time
 import uuid
 import bittensor as bt
-import aiohttp
-import json
 from game.protocol import GameSynapse, GameSynapseOutput
-from game.utils.ruleSysPrompt import ruleSysPrompt
+from game.validator.adjudication import adjudicate_clue
+from game.validator.clue_rules import ClueRuleEngine
+from game.validator.latency import GameBudget, adaptive_query
 from game.validator.reward import get_rewards
-from game.utils.uids import get_random_uids
 import random
 import typing
 from game.utils.game import TParticipant
 from game.utils.game import (
-    GameState,
     Role,
     TeamColor,
     CardColor,
@@ -38,14 +36,10 @@ from game.utils.game import (
     Clue,
     ChatMessage,
 )
-from openai import OpenAI
-import os
 from dotenv import load_dotenv
 
 load_dotenv()  # take environment variables from .env.
 
-client = OpenAI(api_key=os.environ.get("OPENAI_KEY"))
-
 
 def organize_team(self, uids):
     """
@@ -75,183 +69,9 @@ def resetAnimations(self, cards):
         card.was_recently_revealed = False
 
 
-async def create_room(self, game_state: GameState):
-    endpoint = f"{self.backend_base}/api/v1/rooms/create"
-    try:
-        async with aiohttp.ClientSession() as session:
-            payload = {
-                "validatorKey": self.wallet.hotkey.ss58_address,
-                "cards": [
-                    {
-                        "word": card.word,
-                        "color": card.color,
-                        "isRevealed": card.is_revealed,
-                        "wasRecentlyRevealed": card.was_recently_revealed,
-                    }
-                    for card in game_state.cards
-                ],
-                "chatHistory": [],  # Game just started, no chat history yet
-                "currentTeam": game_state.currentTeam.value,
-                "currentRole": game_state.currentRole.value,
-                "previousTeam": None,  # Game just started, no previous team
-                "previousRole": None,  # Game just started, no previous role
-                "remainingRed": game_state.remainingRed,
-                "remainingBlue": game_state.remainingBlue,
-                "currentClue": None,  # Game just started, no current clue
-                "currentGuesses": [],  # Game just started, no guesses yet
-                "gameWinner": None,  # Game just started, no winner
-                "participants": [
-                    {
-                        "name": p.name,
-                        "hotkey": p.hotkey,
-                        "team": p.team.value,
-                        "role": p.role.value,
-                    }
-                    for p in game_state.participants
-                ],
-            }
-            headers = self.build_signed_headers()
-            async with session.post(
-                endpoint, json=payload, headers=headers, timeout=10
-            ) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    bt.logging.error(
-                        f"Failed to create new room: HTTP {response.status} - {text}"
-                    )
-                    return None
-                else:
-                    response_text = await response.text()
-                    bt.logging.info(f"Room created successfully: {response_text}")
-                    try:
-                        return json.loads(response_text)["data"]["id"]
-                    except (json.JSONDecodeError, KeyError) as e:
-                        bt.logging.error(f"Failed to parse room creation response: {e}")
-                        return None
-    except aiohttp.ClientError as e:
-        bt.logging.error(f"Network error creating room: {e}")
-        return None
-    except asyncio.TimeoutError:
-        bt.logging.error(f"Timeout error creating room at {endpoint}")
-        return None
-    except Exception as e:
-        bt.logging.error(f"Unexpected error creating room: {e}")
-        return None
-
-
-async def update_room(self, game_state: GameState, roomId):
-    endpoint = f"{self.backend_base}/api/v1/rooms/{roomId}"
-    try:
-        async with aiohttp.ClientSession() as session:
-            payload = {
-                "validatorKey": self.wallet.hotkey.ss58_address,
-                "cards": [
-                    {
-                        "word": card.word,
-                        "color": card.color,
-                        "isRevealed": card.is_revealed,
-                        "wasRecentlyRevealed": card.was_recently_revealed,
-                    }
-                    for card in game_state.cards
-                ],
-                "chatHistory": [
-                    {
-                        "sender": msg.sender.value,
-                        "message": msg.message,
-                        "team": msg.team.value,
-                        "reasoning": msg.reasoning,
-                        "clueText": msg.clueText,
-                        "number": msg.number,
-                        "guesses": msg.guesses,
-                    }
-                    for msg in game_state.chatHistory
-                ],
-                "currentTeam": game_state.currentTeam.value,
-                "currentRole": game_state.currentRole.value,
-                "previousTeam": (
-                    game_state.previousTeam.value if game_state.previousTeam else None
-                ),
-                "previousRole": (
-                    game_state.previousRole.value if game_state.previousRole else None
-                ),
-                "remainingRed": game_state.remainingRed,
-                "remainingBlue": game_state.remainingBlue,
-                "currentClue": (
-                    {
-                        "clueText": game_state.currentClue.clueText,
-                        "number": game_state.currentClue.number,
-                    }
-                    if game_state.currentClue
-                    else None
-                ),
-                "currentGuesses": (
-                    game_state.currentGuesses if game_state.currentGuesses else []
-                ),
-                "gameWinner": (
-                    game_state.gameWinner.value if game_state.gameWinner else None
-                ),
-                "participants": [
-                    {
-                        "name": p.name,
-                        "hotkey": p.hotkey,
-                        "team": p.team.value,
-                        "role": p.role.value,
-                    }
-                    for p in game_state.participants
-                ],
-                # "createdAt": "2025-04-07T17:49:16.457Z"
-            }
-            headers = self.build_signed_headers()
-            async with session.patch(
-                endpoint, json=payload, headers=headers, timeout=10
-            ) as response:
-                if response.status != 200:
-                    response_text = await response.text()
-                    bt.logging.error(
-                        f"Failed to update room state: HTTP {response.status} - {response_text}"
-                    )
-                else:
-                    bt.logging.info("Room state updated successfully")
-    except aiohttp.ClientError as e:
-        bt.logging.error(f"Network error updating room {roomId}: {e}")
-    except asyncio.TimeoutError:
-        bt.logging.error(f"Timeout error updating room {roomId} at {endpoint}")
-    except Exception as e:
-        bt.logging.error(f"Unexpected error updating room {roomId}: {e}")
-
-
-async def remove_room(self, roomId):
-    # return
-    endpoint = f"{self.backend_base}/api/v1/rooms/{roomId}"
-    try:
-        async with aiohttp.ClientSession() as session:
-            payload = {
-                "validatorKey": self.wallet.hotkey.ss58_address,
-                "roomId": roomId,
-                "action": "delete_room",
-            }
-            headers = self.build_signed_headers()
-            async with session.delete(
-                endpoint, headers=headers, timeout=10
-            ) as response:
-                if response.status != 200:
-                    response_text = await response.text()
-                    bt.logging.error(
-                        f"Failed to delete room: HTTP {response.status} - {response_text}"
-                    )
-                else:
-                    bt.logging.info("Room deleted successfully")
-    except aiohttp.ClientError as e:
-        bt.logging.error(f"Network error deleting room {roomId}: {e}")
-    except asyncio.TimeoutError:
-        bt.logging.error(f"Timeout error deleting room {roomId} at {endpoint}")
-    except Exception as e:
-        bt.logging.error(f"Unexpected error deleting room {roomId}: {e}")
-
-
 async def forward(self):
     """
-    This method is invoked by the validator at each time step.
+    This method is invoked by the validator for every game.
 
     Its main function is to query the network and evaluate the responses.
 
@@ -259,15 +79,31 @@ async def forward(self):
         self (bittensor.neuron.Neuron): The neuron instance containing all necessary state information for the validator.
 
     """
-    # Select 4 miners randomly and organize 2 teams
-    miner_uids, selected_hotkeys = await get_random_uids(
-        self, k=self.config.neuron.sample_size
-    )
+    # Lease 4 miners that are not playing in any other running game
+    lease = await self.matchmaker.acquire()
     # Exeption handling when number of miners less than 4
-    if len(miner_uids) < 4:
+    if lease is None or len(lease.uids) < 4:
+        self.matchmaker.release(lease)
+        bt.logging.warning("Not enough available miners for a game, waiting.")
+        await asyncio.sleep(5)
         return
 
-    (red_team, blue_team) = organize_team(self, miner_uids)
+    try:
+        await play_game(self, lease.uids, lease.hotkeys)
+    finally:
+        self.matchmaker.release(lease)
+
+
+async def play_game(self, miner_uids, selected_hotkeys):
+    """
+    Plays a single game between the given miners and records the result.
+
+    Parameters:
+        self (bittensor.neuron.Neuron): The neuron instance containing all necessary state information for the validator.
+        miner_uids (list[int]): The 4 miner uids, in red spymaster, red operative, blue spymaster, blue operative order.
+        selected_hotkeys (list[str]): Hotkeys whose selection count is incremented once the game completes.
+    """
+    red_team, blue_team = organize_team(self, miner_uids)
     bt.logging.info(f"\033[91mRed Team: {red_team}\033[0m")
     bt.logging.info(f"\033[94mBlue Team: {blue_team}\033[0m")
 
@@ -303,372 +139,415 @@ async def forward(self):
     # * Initialize game
     game_step = 0
     started_at = time.time()
-    game_state = GameState(participants=participants)
+    budget = GameBudget(self.config.neuron.game_budget)
     end_reason = "completed"
-    # Create new room via API call
 
     # ===============🤞ROOM CREATE===================
-    roomId = await create_room(self, game_state)
+    # Rooms are created ahead of time by the room manager.
+    roomId, game_state = await self.room_manager.acquire(participants)
     if roomId is None:
         bt.logging.error("Failed to create room, exiting.")
         return
-    # ===============GAME LOOP=======================
-    while game_state.gameWinner is None:
-        # Prepare the query
-        if game_state.currentRole == Role.SPYMASTER:
-            cards = game_state.cards
-            if game_state.currentTeam == TeamColor.RED:
-                to_uid = red_team["spymaster"]
-            else:
-                to_uid = blue_team["spymaster"]
-        else:
-            # If receiver is operative, we need to send the cards without color
-            # This is because the operative doesn't know the color of the cards
-            cards = [
-                CardType(
-                    word=card.word,
-                    color=card.color if card.is_revealed else None,
-                    is_revealed=card.is_revealed,
-                    was_recently_revealed=card.was_recently_revealed,
+    try:
+        self.room_publisher.publish(roomId, game_state)
+        clue_rules = ClueRuleEngine([card.word for card in game_state.cards])
+        turn = None
+        # ===============GAME LOOP=======================
+        while game_state.gameWinner is None:
+            if budget.exhausted():
+                # Nobody is to blame for a game that ran out of time: void it.
+                end_reason = "budget_exhausted"
+                bt.logging.warning(
+                    f"Game {roomId} exceeded its {budget.seconds:.0f}s budget, voiding it."
                 )
-                for card in game_state.cards
-            ]
-            if game_state.currentTeam == TeamColor.RED:
-                to_uid = red_team["operative"]
-            else:
-                to_uid = blue_team["operative"]
-
-            # Remove animation of recently revealed cards
-            resetAnimations(self, game_state.cards)
-        your_team = game_state.currentTeam
-        your_role = game_state.currentRole
-        remaining_red = game_state.remainingRed
-        remaining_blue = game_state.remainingBlue
-        your_clue = (
-            game_state.currentClue.clueText
-            if game_state.currentClue is not None
-            else None
-        )
-        your_number = (
-            game_state.currentClue.number
-            if game_state.currentClue is not None
-            else None
-        )
-
-        synapse = GameSynapse(
-            your_team=your_team,
-            your_role=your_role,
-            remaining_red=remaining_red,
-            remaining_blue=remaining_blue,
-            your_clue=your_clue,
-            your_number=your_number,
-            cards=cards,
-        )
-
-        start_at = time.time()
-        axon = self.metagraph.axons[to_uid]
-        bt.logging.info(f"⏩ Sending query to miner {to_uid}, {axon}")
-        # retry 3 time to avoid broken pipe
-        for i in range(3):
-            started_at = time.time()
-            response = await self.dendrite(
-                axons=axon,
-                synapse=synapse,
-                deserialize=True,
-                timeout=30,
-            )
-            if response or (time.time() - start_at) > 10:
                 break
-            bt.logging.info(f"⏩ Retrying query to miner {to_uid}, attempt {i+2}/3")
+            if turn is not None:
+                self.turn_telemetry.record(**turn)
+            # Prepare the query
+            if game_state.currentRole == Role.SPYMASTER:
+                cards = game_state.cards
+                if game_state.currentTeam == TeamColor.RED:
+                    to_uid = red_team["spymaster"]
+                else:
+                    to_uid = blue_team["spymaster"]
+            else:
+                # If receiver is operative, we need to send the cards without color
+                # This is because the operative doesn't know the color of the cards
+                cards = [
+                    CardType(
+                        word=card.word,
+                        color=card.color if card.is_revealed else None,
+                        is_revealed=card.is_revealed,
+                        was_recently_revealed=card.was_recently_revealed,
+                    )
+                    for card in game_state.cards
+                ]
+                if game_state.currentTeam == TeamColor.RED:
+                    to_uid = red_team["operative"]
+                else:
+                    to_uid = blue_team["operative"]
 
-        bt.logging.info(
-            f"⏩ Received response from miner {to_uid} in {time.time() - start_at:.2f}s"
-        )
-        if response is None:
-            game_state.gameWinner = (
-                TeamColor.RED
-                if game_state.currentTeam == TeamColor.BLUE
-                else TeamColor.BLUE
+                # Remove animation of recently revealed cards
+                resetAnimations(self, game_state.cards)
+            your_team = game_state.currentTeam
+            your_role = game_state.currentRole
+            remaining_red = game_state.remainingRed
+            remaining_blue = game_state.remainingBlue
+            your_clue = (
+                game_state.currentClue.clueText
+                if game_state.currentClue is not None
+                else None
             )
-            resetAnimations(self, game_state.cards)
-            end_reason = "no_response"
-            bt.logging.info(
-                f"💀 No response received! Game over. Winner: {game_state.gameWinner}"
+            your_number = (
+                game_state.currentClue.number
+                if game_state.currentClue is not None
+                else None
             )
-            game_state.chatHistory.append(
-                ChatMessage(
-                    sender=your_role,
-                    message=f"❌ No response received! Game over.",
-                    team=game_state.currentTeam,
-                    reasoning="No response received.",
-                )
+
+            synapse = GameSynapse(
+                your_team=your_team,
+                your_role=your_role,
+                remaining_red=remaining_red,
+                remaining_blue=remaining_blue,
+                your_clue=your_clue,
+                your_number=your_number,
+                cards=cards,
             )
-            # End the game and remove from gameboard after 10 seconds
-            await update_room(self, game_state, roomId)
-            break
-
-        if game_state.currentRole == Role.SPYMASTER:
-            # * Get the clue and number from the responsehttps://game.shiftlayer.ai/
-            clue = response.clue_text
-            number = response.number
-            reasoning = response.reasoning
-
-            async def check_valid_clue(clue, number, board_words):
-                if clue is None or number is None:
-                    return False, "Clue or number is None"
-                # * Check if the clue is valid using opponent spymaster
-                if game_state.currentTeam == TeamColor.RED:
-                    to_uid = blue_team["spymaster"]
-                else:
-                    to_uid = red_team["spymaster"]
-                synapse = GameSynapse(
-                    your_team="red" if your_team == "blue" else "blue",
-                    your_role="clue_validator",
-                    remaining_red=remaining_red,
-                    remaining_blue=remaining_blue,
-                    your_clue=clue,
-                    your_number=number,
-                    cards=cards,
-                )
 
-                bt.logging.info(f"⏩ Sending clue check query to miner {to_uid}")
-                response: GameSynapseOutput = await self.dendrite(
-                    axons=self.metagraph.axons[to_uid],
+            start_at = time.time()
+            axon = self.metagraph.axons[to_uid]
+            bt.logging.info(f"⏩ Sending query to miner {to_uid}, {axon}")
+
+            async def send(timeout):
+                return await self.dendrite(
+                    axons=axon,
                     synapse=synapse,
                     deserialize=True,
-                    timeout=30,
-                )
-                if not response or response.clue_validity:
-                    return True, "Clue is valid"
-
-                bt.logging.warning(
-                    f"Miner {to_uid} reported that Clue '{clue}' with number {number} is invalid, reason: {response.reasoning}"
-                )
-                # * Check if the clue is valid using the ruleSysPrompt
-
-                messages = []
-                messages.append({"role": "system", "content": ruleSysPrompt})
-                messages.append(
-                    {
-                        "role": "user",
-                        "content": f"Clue: {clue}, Number: {number}, Board Words: {board_words}",
-                    }
+                    timeout=timeout,
                 )
 
-                result = client.responses.create(
-                    model="gpt-5",
-                    input=messages,
-                    reasoning={
-                        "effort": "medium"
-                    },  # Optional: control reasoning effort
-                )
-                result_json = json.loads(result.output_text)
-                bt.logging.info(f"Rule System Response: {result_json}")
-                if result_json["valid"] == False:
-                    return False, result_json["reasoning"]
-                return True, "Clue is valid"
-
-            bt.logging.info(f"Received clue from miner {to_uid}")
-            bt.logging.info(f"Clue: {clue}, Number: {number}")
-            bt.logging.info(f"Reasoning: {reasoning}")
-
-            board_words = [
-                card.word for card in game_state.cards if not card.is_revealed
-            ]
-
-            game_state.currentClue = Clue(clueText=clue, number=number)
-            game_state.currentClue.clueText = clue
-            game_state.currentClue.number = number
-
-            valid, reason = await check_valid_clue(clue, number, board_words)
+            # The timeout follows the miner's own latency; retries cover broken pipes.
+            trace = {}
+            response = await adaptive_query(
+                send,
+                to_uid,
+                self.metagraph.hotkeys[to_uid],
+                self.latency_model,
+                trace=trace,
+            )
+            turn = {
+                "room_id": roomId,
+                "uid": to_uid,
+                "hotkey": self.metagraph.hotkeys[to_uid],
+                "role": your_role.value,
+                "turn": game_step,
+                "latency": trace.get("latency"),
+                "attempts": trace.get("attempts", 0),
+                "request_bytes": len(synapse.model_dump_json()),
+                "response_bytes": len(response.model_dump_json()) if response else 0,
+                "adjudication": None,
+                "adjudicated_by": None,
+                "verdict": None,
+                "outcome": "ok" if response else "no_response",
+            }
 
-            if not valid:
-                bt.logging.info(
-                    f"❌ Invalid clue '{clue}' provided by miner {to_uid} for board words {board_words}. Reason: {reason}"
-                )
-                # If the clue is invalid, the other team wins
+            bt.logging.info(
+                f"⏩ Received response from miner {to_uid} in {time.time() - start_at:.2f}s"
+            )
+            if response is None:
                 game_state.gameWinner = (
                     TeamColor.RED
                     if game_state.currentTeam == TeamColor.BLUE
                     else TeamColor.BLUE
                 )
                 resetAnimations(self, game_state.cards)
-                end_reason = "invalid_clue"
+                end_reason = "no_response"
                 bt.logging.info(
-                    f"💀 Invalid clue! Game over. Winner: {game_state.gameWinner}"
+                    f"💀 No response received! Game over. Winner: {game_state.gameWinner}"
                 )
                 game_state.chatHistory.append(
                     ChatMessage(
-                        sender=Role.SPYMASTER,
-                        message=f"Gave invalid clue '{clue}' with number {number}. Reason: {reason}",
+                        sender=your_role,
+                        message=f"❌ No response received! Game over.",
                         team=game_state.currentTeam,
-                        clueText="null" if clue is None else clue,
-                        number=-1 if number is None else number,
-                        reasoning=reasoning,
+                        reasoning="No response received.",
                     )
                 )
-
-                await update_room(self, game_state, roomId)
-                # time.sleep(5)
+                # End the game and remove from gameboard after 10 seconds
+                self.room_publisher.publish(roomId, game_state)
                 break
 
-            game_state.chatHistory.append(
-                ChatMessage(
-                    sender=Role.SPYMASTER,
-                    message=f"Gave clue '{clue}' with number {number}",
-                    team=game_state.currentTeam,
-                    clueText=clue,
-                    number=number,
-                    reasoning=reasoning,
-                )
-            )
+            if game_state.currentRole == Role.SPYMASTER:
+                # * Get the clue and number from the responsehttps://game.shiftlayer.ai/
+                clue = response.clue_text
+                number = response.number
+                reasoning = response.reasoning
+
+                async def ask_opponent():
+                    # * Ask the opponent spymaster whether it objects to the clue
+                    if game_state.currentTeam == TeamColor.RED:
+                        to_uid = blue_team["spymaster"]
+                    else:
+                        to_uid = red_team["spymaster"]
+                    synapse = GameSynapse(
+                        your_team="red" if your_team == "blue" else "blue",
+                        your_role="clue_validator",
+                        remaining_red=remaining_red,
+                        remaining_blue=remaining_blue,
+                        your_clue=clue,
+                        your_number=number,
+                        cards=cards,
+                    )
 
-        elif game_state.currentRole == Role.OPERATIVE:
-            # * Get the guessed cards from the response
-            guesses = response.guesses
-            reasoning = response.reasoning
-            bt.logging.info(f"Guessed cards: {guesses}")
-            bt.logging.info(f"Reasoning: {reasoning}")
-            if guesses is None:
-                bt.logging.info(
-                    f"❌ Invalid guesses '{guesses}' provided by miner {to_uid}."
-                )
-                # If the guesses is invalid, the other team wins
-                game_state.gameWinner = (
-                    TeamColor.RED
-                    if game_state.currentTeam == TeamColor.BLUE
-                    else TeamColor.BLUE
-                )
-                resetAnimations(self, game_state.cards)
-                end_reason = "no_response"
-                bt.logging.info(
-                    f"❌ No guesses received! Game over. Winner: {game_state.gameWinner}"
-                )
-                game_state.chatHistory.append(
-                    ChatMessage(
-                        sender=Role.OPERATIVE,
-                        message=f"❌ No guesses provided.",
-                        team=game_state.currentTeam,
-                        guesses=[],
-                        reasoning="No guesses provided.",
+                    bt.logging.info(f"⏩ Sending clue check query to miner {to_uid}")
+                    response: GameSynapseOutput = await self.dendrite(
+                        axons=self.metagraph.axons[to_uid],
+                        synapse=synapse,
+                        deserialize=True,
+                        timeout=30,
+                    )
+                    if not response or response.clue_validity:
+                        return False, ""
+                    return (
+                        True,
+                        f"Miner {to_uid} reported that Clue '{clue}' with number {number} is invalid, reason: {response.reasoning}",
                     )
-                )
-                await update_room(self, game_state, roomId)
-                break
 
-            # * Update the game state
-            choose_assasin = False
-            for guess in guesses:
-                card = next((c for c in game_state.cards if c.word == guess), None)
-                if card is None or card.is_revealed:
-                    bt.logging.debug(f"Invalid guess: {guess}")
-                    continue
-                card.is_revealed = True
-                card.was_recently_revealed = True
-                if card.color == "red":
-                    game_state.remainingRed -= 1
-                elif card.color == "blue":
-                    game_state.remainingBlue -= 1
-                if game_state.remainingRed == 0:
-                    game_state.gameWinner = TeamColor.RED
-                    resetAnimations(self, game_state.cards)
-                    end_reason = "red_all_cards"
+                async def check_valid_clue(clue, number, board_words):
+                    if clue is None or number is None:
+                        return False, "Clue or number is None"
+
+                    def check_rules():
+                        ruling, rule_reason = clue_rules.check(clue, board_words)
+                        turn["adjudication"] = ruling.value
+                        bt.logging.info(f"Clue rules: {ruling.value} ({rule_reason})")
+                        return ruling, rule_reason
+
+                    # * The opponent's flag decides; the local rules run alongside it
+                    # * and can uphold a flag without the arbiter.
+                    valid, reason, source = await adjudicate_clue(
+                        check_rules,
+                        ask_opponent,
+                        lambda: self.clue_arbiter.check(clue, number, board_words),
+                        speculative=self.config.arbiter.speculative,
+                    )
+                    turn["adjudicated_by"] = source
+                    turn["verdict"] = "valid" if valid else "invalid"
+                    return valid, reason
+
+                bt.logging.info(f"Received clue from miner {to_uid}")
+                bt.logging.info(f"Clue: {clue}, Number: {number}")
+                bt.logging.info(f"Reasoning: {reasoning}")
+
+                board_words = [
+                    card.word for card in game_state.cards if not card.is_revealed
+                ]
+
+                game_state.currentClue = Clue(clueText=clue, number=number)
+                game_state.currentClue.clueText = clue
+                game_state.currentClue.number = number
+
+                valid, reason = await check_valid_clue(clue, number, board_words)
+
+                if not valid:
                     bt.logging.info(
-                        f"🎉 All red cards found! Winner: {game_state.gameWinner}"
+                        f"❌ Invalid clue '{clue}' provided by miner {to_uid} for board words {board_words}. Reason: {reason}"
                     )
-                    game_state.chatHistory.append(
-                        ChatMessage(
-                            sender=Role.OPERATIVE,
-                            message=f"🎉 All red cards found! Winner: {game_state.gameWinner.value.capitalize()} Team",
-                            team=game_state.currentTeam,
-                            guesses=guesses,
-                            reasoning=reasoning,
-                        )
+                    # If the clue is invalid, the other team wins
+                    game_state.gameWinner = (
+                        TeamColor.RED
+                        if game_state.currentTeam == TeamColor.BLUE
+                        else TeamColor.BLUE
                     )
-                    await update_room(self, game_state, roomId)
-                    break
-                elif game_state.remainingBlue == 0:
-                    game_state.gameWinner = TeamColor.BLUE
                     resetAnimations(self, game_state.cards)
-                    end_reason = "blue_all_cards"
+                    end_reason = "invalid_clue"
                     bt.logging.info(
-                        f"🎉 All blue cards found! Winner: {game_state.gameWinner}"
+                        f"💀 Invalid clue! Game over. Winner: {game_state.gameWinner}"
                     )
                     game_state.chatHistory.append(
                         ChatMessage(
-                            sender=Role.OPERATIVE,
-                            message=f"🎉 All blue cards found! Winner: {game_state.gameWinner.value.capitalize()} Team",
+                            sender=Role.SPYMASTER,
+                            message=f"Gave invalid clue '{clue}' with number {number}. Reason: {reason}",
                             team=game_state.currentTeam,
-                            guesses=guesses,
+                            clueText="null" if clue is None else clue,
+                            number=-1 if number is None else number,
                             reasoning=reasoning,
                         )
                     )
-                    await update_room(self, game_state, roomId)
+
+                    self.room_publisher.publish(roomId, game_state)
+                    # time.sleep(5)
                     break
-                if card.color == "assassin":
-                    choose_assasin = True
+
+                game_state.chatHistory.append(
+                    ChatMessage(
+                        sender=Role.SPYMASTER,
+                        message=f"Gave clue '{clue}' with number {number}",
+                        team=game_state.currentTeam,
+                        clueText=clue,
+                        number=number,
+                        reasoning=reasoning,
+                    )
+                )
+
+            elif game_state.currentRole == Role.OPERATIVE:
+                # * Get the guessed cards from the response
+                guesses = response.guesses
+                reasoning = response.reasoning
+                bt.logging.info(f"Guessed cards: {guesses}")
+                bt.logging.info(f"Reasoning: {reasoning}")
+                if guesses is None:
+                    bt.logging.info(
+                        f"❌ Invalid guesses '{guesses}' provided by miner {to_uid}."
+                    )
+                    # If the guesses is invalid, the other team wins
                     game_state.gameWinner = (
                         TeamColor.RED
                         if game_state.currentTeam == TeamColor.BLUE
                         else TeamColor.BLUE
                     )
                     resetAnimations(self, game_state.cards)
-                    end_reason = "assassin"
+                    end_reason = "no_response"
                     bt.logging.info(
-                        f"💀 Assassin card '{card.word}' found! Game over. Winner: {game_state.gameWinner}"
+                        f"❌ No guesses received! Game over. Winner: {game_state.gameWinner}"
                     )
                     game_state.chatHistory.append(
                         ChatMessage(
                             sender=Role.OPERATIVE,
-                            message=f"💀 Assassin card '{card.word}' found! Game over. Winner: {game_state.gameWinner.value.capitalize()} Team",
+                            message=f"❌ No guesses provided.",
                             team=game_state.currentTeam,
-                            guesses=guesses,
-                            reasoning=reasoning,
+                            guesses=[],
+                            reasoning="No guesses provided.",
                         )
                     )
-                    await update_room(self, game_state, roomId)
+                    self.room_publisher.publish(roomId, game_state)
                     break
-                if card.color != game_state.currentTeam.value:
-                    # If the card is not of our team color, we break
-                    # This is to ensure that the operative only guesses cards of their team color
-                    bt.logging.info(
-                        f"Card {card.word} is not of team color {game_state.currentTeam.value}, breaking."
-                    )
+
+                # * Update the game state
+                choose_assasin = False
+                for guess in guesses:
+                    card = next((c for c in game_state.cards if c.word == guess), None)
+                    if card is None or card.is_revealed:
+                        bt.logging.debug(f"Invalid guess: {guess}")
+                        continue
+                    card.is_revealed = True
+                    card.was_recently_revealed = True
+                    if card.color == "red":
+                        game_state.remainingRed -= 1
+                    elif card.color == "blue":
+                        game_state.remainingBlue -= 1
+                    if game_state.remainingRed == 0:
+                        game_state.gameWinner = TeamColor.RED
+                        resetAnimations(self, game_state.cards)
+                        end_reason = "red_all_cards"
+                        bt.logging.info(
+                            f"🎉 All red cards found! Winner: {game_state.gameWinner}"
+                        )
+                        game_state.chatHistory.append(
+                            ChatMessage(
+                                sender=Role.OPERATIVE,
+                                message=f"🎉 All red cards found! Winner: {game_state.gameWinner.value.capitalize()} Team",
+                                team=game_state.currentTeam,
+                                guesses=guesses,
+                                reasoning=reasoning,
+                            )
+                        )
+                        self.room_publisher.publish(roomId, game_state)
+                        break
+                    elif game_state.remainingBlue == 0:
+                        game_state.gameWinner = TeamColor.BLUE
+                        resetAnimations(self, game_state.cards)
+                        end_reason = "blue_all_cards"
+                        bt.logging.info(
+                            f"🎉 All blue cards found! Winner: {game_state.gameWinner}"
+                        )
+                        game_state.chatHistory.append(
+                            ChatMessage(
+                                sender=Role.OPERATIVE,
+                                message=f"🎉 All blue cards found! Winner: {game_state.gameWinner.value.capitalize()} Team",
+                                team=game_state.currentTeam,
+                                guesses=guesses,
+                                reasoning=reasoning,
+                            )
+                        )
+                        self.room_publisher.publish(roomId, game_state)
+                        break
+                    if card.color == "assassin":
+                        choose_assasin = True
+                        game_state.gameWinner = (
+                            TeamColor.RED
+                            if game_state.currentTeam == TeamColor.BLUE
+                            else TeamColor.BLUE
+                        )
+                        resetAnimations(self, game_state.cards)
+                        end_reason = "assassin"
+                        bt.logging.info(
+                            f"💀 Assassin card '{card.word}' found! Game over. Winner: {game_state.gameWinner}"
+                        )
+                        game_state.chatHistory.append(
+                            ChatMessage(
+                                sender=Role.OPERATIVE,
+                                message=f"💀 Assassin card '{card.word}' found! Game over. Winner: {game_state.gameWinner.value.capitalize()} Team",
+                                team=game_state.currentTeam,
+                                guesses=guesses,
+                                reasoning=reasoning,
+                            )
+                        )
+                        self.room_publisher.publish(roomId, game_state)
+                        break
+                    if card.color != game_state.currentTeam.value:
+                        # If the card is not of our team color, we break
+                        # This is to ensure that the operative only guesses cards of their team color
+                        bt.logging.info(
+                            f"Card {card.word} is not of team color {game_state.currentTeam.value}, breaking."
+                        )
+                        break
+                    # if the card isn't our team color, break
+                    # if card.color is not game_state.currentTeam:
+                    #     break
+                if choose_assasin or game_state.gameWinner is not None:
                     break
-                # if the card isn't our team color, break
-                # if card.color is not game_state.currentTeam:
-                #     break
-            if choose_assasin or game_state.gameWinner is not None:
-                break
-            game_state.currentGuesses = guesses
-            game_state.chatHistory.append(
-                ChatMessage(
-                    sender=Role.OPERATIVE,
-                    message=f"Guessed cards: {', '.join(guesses)}",
-                    team=game_state.currentTeam,
-                    reasoning=reasoning,
-                    guesses=guesses,
+                game_state.currentGuesses = guesses
+                game_state.chatHistory.append(
+                    ChatMessage(
+                        sender=Role.OPERATIVE,
+                        message=f"Guessed cards: {', '.join(guesses)}",
+                        team=game_state.currentTeam,
+                        reasoning=reasoning,
+                        guesses=guesses,
+                    )
                 )
-            )
-
-        # change the role
-        game_state.previousRole = game_state.currentRole
-        game_state.previousTeam = game_state.currentTeam
 
-        if game_state.currentRole == Role.SPYMASTER:
-            game_state.currentRole = Role.OPERATIVE
-        else:
-            game_state.currentRole = Role.SPYMASTER
+            # change the role
+            game_state.previousRole = game_state.currentRole
+            game_state.previousTeam = game_state.currentTeam
 
-            # change the team after operative moved
-
-            if game_state.currentTeam == TeamColor.RED:
-                game_state.currentTeam = TeamColor.BLUE
+            if game_state.currentRole == Role.SPYMASTER:
+                game_state.currentRole = Role.OPERATIVE
             else:
-                game_state.currentTeam = TeamColor.RED
-        game_step += 1
+                game_state.currentRole = Role.SPYMASTER
+
+                # change the team after operative moved
 
-        await update_room(self, game_state, roomId)
+                if game_state.currentTeam == TeamColor.RED:
+                    game_state.currentTeam = TeamColor.BLUE
+                else:
+                    game_state.currentTeam = TeamColor.RED
+            game_step += 1
+
+            self.room_publisher.publish(roomId, game_state)
+        if turn is not None:
+            # The last turn is the one that ended the game.
+            if turn["outcome"] == "ok" and game_state.gameWinner is not None:
+                turn["outcome"] = end_reason
+            self.turn_telemetry.record(**turn)
+    finally:
+        # The room must be handed back however the game ended.
+        self.room_publisher.finish(roomId)
+        self.room_manager.release(roomId)
+    if end_reason == "budget_exhausted":
+        bt.logging.info(f"Game {roomId} was voided; it is not scored.")
+        return
 
     # * Game over
     ended_at = time.time()
@@ -677,15 +556,24 @@ async def forward(self):
     )
     if winner_value and end_reason != "no_response":
         # Increase selection count
+        uid_by_hotkey = {
+            hotkey: uid for uid, hotkey in enumerate(self.metagraph.hotkeys)
+        }
+        selections = []
         for hotkey in selected_hotkeys:
-            try:
-                uid = self.metagraph.hotkeys.index(hotkey)
-                self.score_store.increment_selection_count(hotkey, uid)
-                bt.logging.info(f"Incremented selection count for {uid}")
-            except Exception as err:  # noqa: BLE001
+            if hotkey in uid_by_hotkey:
+                selections.append((hotkey, uid_by_hotkey[hotkey]))
+            else:
                 bt.logging.error(
-                    f"Failed to increment selection count for {hotkey}: {err}"
+                    f"Failed to increment selection count for {hotkey}: not in metagraph"
                 )
+        try:
+            await self.async_store.record_selections(selections)
+            bt.logging.info(
+                f"Incremented selection count for {[uid for _, uid in selections]}"
+            )
+        except Exception as err:  # noqa: BLE001
+            bt.logging.error(f"Failed to increment selection counts: {err}")
     # # Adjust the scores based on responses from miners.
     rewards = get_rewards(
         self,
@@ -705,7 +593,7 @@ async def forward(self):
         return float(rewards_list[index]) if index < len(rewards_list) else 0.0
 
     try:
-        self.score_store.record_game(
+        await self.async_store.record_game(
             room_id=roomId,
             rs=rs_hotkey,
             ro=ro_hotkey,
@@ -720,8 +608,6 @@ async def forward(self):
             score_bo=_score_at(3),
             reason=end_reason,
         )
-        synced = await self.score_store.sync_pending()
+        synced = await self.async_store.sync_pending()
     except Exception as err:  # noqa: BLE001
         bt.logging.error(f"Failed to persist game score {roomId}: {err}")
-
-    time.sleep(1)
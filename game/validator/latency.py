@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+import bittensor as bt
+
+SendFn = Callable[[float], Awaitable[Any]]
+
+
+class MinerLatency:
+    """Response-time record for a single uid."""
+
+    def __init__(self, hotkey: str, history: int):
+        self.hotkey = hotkey
+        self.ewma: Optional[float] = None
+        self.samples: Deque[float] = deque(maxlen=history)
+        self.failures = 0
+
+    def p95(self) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+
+class LatencyModel:
+    """Per-uid response-time model that sizes query timeouts.
+
+    Each successful query updates an EWMA and a window of recent samples. A
+    query that got no answer adds a censored sample at the timeout it was
+    given: the miner took at least that long. Repeated misses therefore
+    raise the p95, and the timeout, instead of cutting the miner off at the
+    same point every turn. Once a uid has ``min_samples`` samples, its timeout is ``headroom`` times
+    its p95, clamped to ``[min_timeout, max_timeout]``. Uids without enough
+    history get ``max_timeout``. The model is saved as JSON at ``path``.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        alpha: float = 0.2,
+        history: int = 50,
+        min_samples: int = 5,
+        headroom: float = 2.0,
+        min_timeout: float = 10.0,
+        max_timeout: float = 30.0,
+    ):
+        self.path = path
+        self.alpha = float(alpha)
+        self.history = int(history)
+        self.min_samples = int(min_samples)
+        self.headroom = float(headroom)
+        self.min_timeout = float(min_timeout)
+        self.max_timeout = float(max_timeout)
+        self.entries: Dict[int, MinerLatency] = {}
+
+    def entry(self, uid: int, hotkey: str) -> MinerLatency:
+        current = self.entries.get(int(uid))
+        if current is None or current.hotkey != hotkey:
+            # New uid or the hotkey was replaced: start from a clean record.
+            current = MinerLatency(hotkey, self.history)
+            self.entries[int(uid)] = current
+        return current
+
+    def record(self, uid: int, hotkey: str, seconds: float, ok: bool = True) -> None:
+        entry = self.entry(uid, hotkey)
+        entry.samples.append(float(seconds))
+        if not ok:
+            entry.failures += 1
+            return
+        if entry.ewma is None:
+            entry.ewma = float(seconds)
+        else:
+            entry.ewma += self.alpha * (float(seconds) - entry.ewma)
+
+    def seed(self, uid: int, hotkey: str, samples) -> bool:
+        """Fills an empty record from stored samples; returns True if it did."""
+        entry = self.entry(uid, hotkey)
+        if entry.samples or not samples:
+            return False
+        for seconds in samples:
+            self.record(uid, hotkey, seconds)
+        return True
+
+    def _known(self, uid: int, hotkey: str) -> Optional[MinerLatency]:
+        entry = self.entries.get(int(uid))
+        if entry is None or entry.hotkey != hotkey:
+            return None
+        if len(entry.samples) < self.min_samples:
+            return None
+        return entry
+
+    def timeout_for(self, uid: int, hotkey: str) -> float:
+        entry = self._known(uid, hotkey)
+        if entry is None:
+            return self.max_timeout
+        return min(self.max_timeout, max(self.min_timeout, entry.p95() * self.headroom))
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        data = {
+            str(uid): {
+                "hotkey": entry.hotkey,
+                "ewma": entry.ewma,
+                "samples": list(entry.samples),
+                "failures": entry.failures,
+            }
+            # Games keep recording while this runs in the sync thread.
+            for uid, entry in list(self.entries.items())
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError) as err:
+            bt.logging.warning(f"Could not load latency model from {self.path}: {err}")
+            return
+        for uid, saved in data.items():
+            entry = MinerLatency(saved["hotkey"], self.history)
+            entry.ewma = saved.get("ewma")
+            entry.samples.extend(saved.get("samples", []))
+            entry.failures = int(saved.get("failures", 0))
+            self.entries[int(uid)] = entry
+
+
+class GameBudget:
+    """Wall-clock allowance for all the miner queries of one game.
+
+    Query timeouts are never shrunk to fit it: the miner whose turn it is
+    should not pay for time the others used. A game that runs out of budget
+    is voided instead.
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = float(seconds)
+        self.started = time.monotonic()
+
+    def remaining(self) -> float:
+        return self.seconds - (time.monotonic() - self.started)
+
+    def exhausted(self) -> bool:
+        return self.remaining() <= 0
+
+
+async def adaptive_query(
+    send: SendFn,
+    uid: int,
+    hotkey: str,
+    model: LatencyModel,
+    max_attempts: int = 3,
+    trace: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """Queries a miner with a timeout sized from its own latency.
+
+    ``send(timeout)`` issues one attempt and returns the response, or a falsy
+    value on failure. An attempt that fails early (a broken pipe) is retried
+    within the same deadline; a slow attempt is never duplicated, so a miner
+    has at most one request from us in flight. Returns None if no attempt
+    succeeds. ``trace``, if given, receives the number of attempts sent and
+    the latency of the successful one.
+    """
+    timeout = model.timeout_for(uid, hotkey)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    sent = 0
+    while sent < max_attempts:
+        left = deadline - loop.time()
+        if left <= 0:
+            break
+        sent += 1
+        started = loop.time()
+        response = await send(max(left, 0.1))
+        if response:
+            latency = loop.time() - started
+            model.record(uid, hotkey, latency)
+            if trace is not None:
+                trace.update(attempts=sent, latency=latency)
+            return response
+        if sent < max_attempts and deadline - loop.time() > 0:
+            bt.logging.debug(f"Query to miner {uid} failed early, retrying")
+    model.record(uid, hotkey, timeout, ok=False)
+    if trace is not None:
+        trace.update(attempts=sent, latency=None)
+    return None
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, List, Optional, Set
+
+import bittensor as bt
+
+from game.utils.uids import get_random_uids
+
+
+class Lease:
+    """A team of miners handed to one game; released when that game ends."""
+
+    def __init__(self, uids: List[int], hotkeys: List[str]):
+        self.uids = list(uids)
+        # Hotkeys whose selection count is bumped once the game completes.
+        self.hotkeys = list(hotkeys)
+        self.created_at = time.time()
+
+
+class Matchmaker:
+    """Hands disjoint teams of miners to concurrently running games.
+
+    A single selection pass (ping plus the usual selection-count, score and
+    IP/coldkey rules from ``get_random_uids``) picks enough miners for every
+    slot at once and splits them into teams. Miners stay leased until their
+    game releases them, so no miner plays two concurrent games.
+    """
+
+    def __init__(
+        self,
+        validator,
+        team_size: int,
+        num_teams: int,
+        team_ttl: float = 60.0,
+    ):
+        self.validator = validator
+        self.team_size = int(team_size)
+        self.num_teams = max(1, int(num_teams))
+        # Prepared teams older than this are dropped; their ping results are stale.
+        self.team_ttl = float(team_ttl)
+        self._ready: Deque[Lease] = deque()
+        self._leased: Set[int] = set()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> Optional[Lease]:
+        """Returns a team for a new game, or None if not enough miners are available."""
+        async with self._lock:
+            lease = self._pop_ready()
+            if lease is None:
+                await self._refill()
+                lease = self._pop_ready()
+            if lease is not None:
+                self._leased.update(lease.uids)
+            return lease
+
+    def release(self, lease: Optional[Lease]) -> None:
+        if lease is None:
+            return
+        self._leased.difference_update(lease.uids)
+
+    def _pop_ready(self) -> Optional[Lease]:
+        now = time.time()
+        while self._ready:
+            lease = self._ready.popleft()
+            if now - lease.created_at > self.team_ttl:
+                continue
+            if self._leased.intersection(lease.uids):
+                continue
+            return lease
+        return None
+
+    async def _refill(self) -> None:
+        busy = len(self._leased) // max(1, self.team_size)
+        wanted = max(1, self.num_teams - busy)
+        selected, hotkeys_to_increase = await get_random_uids(
+            self.validator,
+            k=self.team_size * wanted,
+            exclude=list(self._leased),
+        )
+        hotkeys = self.validator.metagraph.hotkeys
+        selected_hotkeys = {hotkeys[uid] for uid in selected}
+        # Hotkeys that were passed over (unreachable, low score) still count as
+        # selected; charge them to the first team so the fairness rule holds.
+        passed_over = [hk for hk in hotkeys_to_increase if hk not in selected_hotkeys]
+
+        teams = [
+            selected[i : i + self.team_size]
+            for i in range(0, len(selected) - self.team_size + 1, self.team_size)
+        ]
+        for index, team in enumerate(teams):
+            team_hotkeys = [hotkeys[uid] for uid in team]
+            if index == 0:
+                team_hotkeys += passed_over
+            self._ready.append(Lease(team, team_hotkeys))
+        bt.logging.info(
+            f"Matchmaker prepared {len(teams)} team(s): {[lease.uids for lease in self._ready]}"
+        )
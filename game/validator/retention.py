@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+
+import bittensor as bt
+
+
+class RetentionService:
+    """Deletes score and selection history that has left the retention horizon.
+
+    Rows are kept for ``retention_multiple`` scoring windows (never less than
+    one), after which ``ScoreStore.compact`` removes them and reclaims the freed
+    pages. Cached clue verdicts are pruned in the same pass to at most
+    ``verdict_max_rows`` rows no older than ``verdict_max_age`` seconds. Runs
+    every ``interval`` seconds in a worker thread.
+    """
+
+    def __init__(
+        self,
+        validator,
+        retention_multiple: float = 2.0,
+        interval: float = 3600.0,
+        verdict_max_age: float = 30 * 86400.0,
+        verdict_max_rows: int = 100_000,
+    ):
+        self.validator = validator
+        self.retention_multiple = max(1.0, float(retention_multiple))
+        self.interval = float(interval)
+        self.verdict_max_age = float(verdict_max_age)
+        self.verdict_max_rows = int(verdict_max_rows)
+        self.last_stats = None
+
+    @property
+    def retain_seconds(self) -> float:
+        return self.retention_multiple * self.validator.scoring_window_seconds
+
+    def compact_once(self):
+        self.last_stats = self.validator.score_store.compact(self.retain_seconds)
+        self.last_stats["clue_verdicts"] = self.validator.clue_arbiter.cache.prune(
+            self.verdict_max_age, self.verdict_max_rows
+        )
+        bt.logging.info(
+            "Compacted score database: "
+            + ", ".join(f"{key}={value}" for key, value in self.last_stats.items())
+        )
+        return self.last_stats
+
+    async def run(self) -> None:
+        while not self.validator.should_exit:
+            await asyncio.sleep(self.interval)
+            try:
+                await asyncio.to_thread(self.compact_once)
+            except Exception as err:  # noqa: BLE001
+                bt.logging.error(f"Score database compaction failed: {err}")
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+import bittensor as bt
+
+from game.utils.game import GameState, TParticipant
+from game.validator.room_state import create_room, remove_room
+
+
+class RoomManager:
+    """Creates rooms ahead of time and cleans them up after their games.
+
+    ``run`` keeps ``pool_size`` rooms created and waiting, each with a fresh
+    board and no participants, retrying failed creations with backoff so games
+    never wait on the backend to start. Finished rooms are deleted in batches
+    once they are ``room_ttl`` seconds old, their score has synced and no room
+    update for them is still pending. Ready rooms left unused for
+    ``ready_ttl`` seconds are deleted in the same batches and replaced, and
+    ``close`` deletes the ones still waiting at shutdown.
+    """
+
+    def __init__(
+        self,
+        validator,
+        pool_size: int = 1,
+        room_ttl: float = 600.0,
+        cleanup_interval: float = 300.0,
+        cleanup_batch: int = 20,
+        retry_delay: float = 5.0,
+        max_retry_delay: float = 120.0,
+        ready_ttl: float = 1800.0,
+    ):
+        self.validator = validator
+        self.pool_size = max(1, int(pool_size))
+        self.room_ttl = float(room_ttl)
+        self.cleanup_interval = float(cleanup_interval)
+        self.cleanup_batch = max(1, int(cleanup_batch))
+        self.retry_delay = float(retry_delay)
+        self.max_retry_delay = float(max_retry_delay)
+        self.ready_ttl = float(ready_ttl)
+        self.rooms_created = 0
+        self.rooms_deleted = 0
+        self.pool_misses = 0
+        self._ready: Deque[Tuple[float, str, GameState]] = deque()
+        self._finished: Deque[Tuple[float, str]] = deque()
+        self._wanted = asyncio.Event()
+
+    @property
+    def ready_count(self) -> int:
+        return len(self._ready)
+
+    async def acquire(
+        self, participants: List[TParticipant]
+    ) -> Tuple[Optional[str], Optional[GameState]]:
+        """Hands out a ready room for a new game with ``participants``.
+
+        Falls back to creating one inline when the pool is empty. Returns
+        ``(None, None)`` if that fails too.
+        """
+        self._wanted.set()
+        if self._ready:
+            _, room_id, game_state = self._ready.popleft()
+        else:
+            self.pool_misses += 1
+            bt.logging.warning("No pre-provisioned room ready; creating one inline")
+            game_state = GameState(participants=[])
+            room_id = await create_room(self.validator, game_state)
+            if room_id is None:
+                return None, None
+            self.rooms_created += 1
+        game_state.participants = participants
+        return room_id, game_state
+
+    def release(self, room_id: str) -> None:
+        """Schedules a finished game's room for deletion."""
+        self._finished.append((time.time(), room_id))
+
+    async def run(self) -> None:
+        await asyncio.gather(self._provision_loop(), self._cleanup_loop())
+
+    async def close(self) -> int:
+        """Deletes the ready rooms no game will use; returns how many went."""
+        ready = [room_id for _, room_id, _ in self._ready]
+        self._ready.clear()
+        results = await asyncio.gather(
+            *[remove_room(self.validator, room_id) for room_id in ready]
+        )
+        deleted = sum(1 for ok in results if ok)
+        self.rooms_deleted += deleted
+        return deleted
+
+    async def _provision_loop(self) -> None:
+        delay = self.retry_delay
+        while not self.validator.should_exit:
+            if len(self._ready) >= self.pool_size:
+                self._wanted.clear()
+                try:
+                    await asyncio.wait_for(self._wanted.wait(), timeout=5.0)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            game_state = GameState(participants=[])
+            room_id = await create_room(self.validator, game_state)
+            if room_id is None:
+                bt.logging.warning(
+                    f"Room pre-provisioning failed; retrying in {delay:.0f}s"
+                )
+                await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+                delay = min(delay * 2, self.max_retry_delay)
+                continue
+            delay = self.retry_delay
+            self.rooms_created += 1
+            self._ready.append((time.time(), room_id, game_state))
+
+    async def _cleanup_loop(self) -> None:
+        while not self.validator.should_exit:
+            await asyncio.sleep(self.cleanup_interval)
+            await self.cleanup_once()
+
+    async def cleanup_once(self, now: float = None) -> int:
+        """Deletes up to ``cleanup_batch`` expired rooms; returns how many went."""
+        now = time.time() if now is None else now
+        stale = []
+        while self._ready and self._ready[0][0] + self.ready_ttl <= now:
+            _, room_id, _ = self._ready.popleft()
+            stale.append((now - self.room_ttl, room_id))
+        if stale:
+            # Unused rooms have nothing to wait for; delete them first.
+            self._finished.extendleft(reversed(stale))
+            self._wanted.set()
+        expired = []
+        while self._finished and self._finished[0][0] + self.room_ttl <= now:
+            expired.append(self._finished.popleft())
+        if not expired:
+            return 0
+
+        unsynced = {
+            row["room_id"] for row in await self.validator.async_store.pending()
+        }
+        publisher = self.validator.room_publisher
+        deletable, kept = [], []
+        for finished_at, room_id in expired:
+            if (
+                len(deletable) < self.cleanup_batch
+                and room_id not in unsynced
+                and not await publisher.has_pending(room_id)
+            ):
+                deletable.append((finished_at, room_id))
+            else:
+                kept.append((finished_at, room_id))
+
+        results = await asyncio.gather(
+            *[remove_room(self.validator, room_id) for _, room_id in deletable]
+        )
+        for entry, deleted in zip(deletable, results):
+            if not deleted:
+                kept.append(entry)
+        # Rooms we could not delete yet are retried on the next pass.
+        self._finished.extendleft(reversed(kept))
+        deleted = sum(1 for ok in results if ok)
+        self.rooms_deleted += deleted
+        if deleted:
+            bt.logging.info(f"Deleted {deleted} expired rooms")
+        return deleted
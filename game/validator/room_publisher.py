@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import bittensor as bt
+
+from game.utils.game import GameState
+from game.validator.room_state import room_payload, send_room_update
+
+SendFn = Callable[[Any, str, Dict[str, Any]], Awaitable[bool]]
+
+
+class RoomOutbox:
+    """SQLite-backed store for room states that did not reach the backend.
+
+    Keeps only the newest undelivered state per room, which is all the
+    backend needs to catch up.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        folder = os.path.dirname(db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            db_path, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL;")
+        self._conn.execute("PRAGMA synchronous=NORMAL;")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS room_outbox (
+                room_id TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL
+            );
+            """
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM room_outbox").fetchone()
+        return int(count)
+
+    def put(self, room_id: str, payload: Dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO room_outbox(room_id, payload, attempts, updated_at)
+                VALUES(?, ?, 0, ?)
+                ON CONFLICT(room_id) DO UPDATE SET
+                    payload=excluded.payload,
+                    attempts=0,
+                    updated_at=excluded.updated_at
+                """,
+                (room_id, json.dumps(payload), time.time()),
+            )
+
+    def due(self, limit: int) -> List[Tuple[str, Dict[str, Any], float]]:
+        """Oldest entries first, as ``(room_id, payload, updated_at)``."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT room_id, payload, updated_at FROM room_outbox "
+                "ORDER BY attempts ASC, updated_at ASC LIMIT ?",
+                (int(limit),),
+            ).fetchall()
+        return [(room_id, json.loads(payload), ts) for room_id, payload, ts in rows]
+
+    def remove(self, room_id: str, updated_at: Optional[float] = None) -> None:
+        """Removes a room's entry, or only the given version of it."""
+        with self._lock:
+            if updated_at is None:
+                self._conn.execute(
+                    "DELETE FROM room_outbox WHERE room_id=?", (room_id,)
+                )
+            else:
+                self._conn.execute(
+                    "DELETE FROM room_outbox WHERE room_id=? AND updated_at=?",
+                    (room_id, updated_at),
+                )
+
+    def room_ids(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT room_id FROM room_outbox").fetchall()
+        return [room_id for (room_id,) in rows]
+
+    def record_attempt(self, room_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE room_outbox SET attempts = attempts + 1 WHERE room_id=?",
+                (room_id,),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RoomPublisher:
+    """Publishes room states for spectators without holding up the game.
+
+    ``publish`` snapshots the game state and returns immediately. Each room has
+    at most one send in flight. Snapshots that arrive meanwhile replace each
+    other, so only the newest one is sent next. A state that cannot be
+    delivered goes to the outbox, and ``run`` replays it in the background
+    through the same per-room worker, so a replay never lands after a newer
+    state. The outbox is only touched for rooms that have an entry in it.
+    """
+
+    def __init__(
+        self,
+        validator,
+        outbox: RoomOutbox,
+        replay_interval: float = 30.0,
+        replay_batch: int = 20,
+        send: SendFn = send_room_update,
+    ):
+        self.validator = validator
+        self.outbox = outbox
+        self.replay_interval = float(replay_interval)
+        self.replay_batch = max(1, int(replay_batch))
+        self.send = send
+        self.sent = 0
+        self.coalesced = 0
+        self.failed = 0
+        self.replayed = 0
+        self._latest: Dict[str, Dict[str, Any]] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+        self._finished: Set[str] = set()
+        # Rooms with an outbox entry; read once, then kept in step with it.
+        self._stored: Set[str] = set(outbox.room_ids())
+
+    def publish(self, room_id: str, game_state: GameState) -> None:
+        payload = room_payload(self.validator.wallet.hotkey.ss58_address, game_state)
+        if room_id in self._latest:
+            self.coalesced += 1
+        self._latest[room_id] = payload
+        if room_id not in self._workers:
+            self._workers[room_id] = asyncio.ensure_future(self._drain(room_id))
+
+    def finish(self, room_id: str) -> None:
+        """Marks a room's game as over; its state is dropped once delivered."""
+        self._finished.add(room_id)
+        if room_id not in self._workers:
+            self._forget(room_id)
+
+    async def has_pending(self, room_id: str) -> bool:
+        """Whether an update for ``room_id`` is queued, in flight or in the outbox."""
+        return (
+            room_id in self._latest
+            or room_id in self._workers
+            or room_id in self._stored
+        )
+
+    async def flush(self) -> None:
+        """Waits for every in-flight room send to finish."""
+        while self._workers:
+            await asyncio.gather(*self._workers.values(), return_exceptions=True)
+
+    async def run(self) -> None:
+        while not self.validator.should_exit:
+            await asyncio.sleep(self.replay_interval)
+            await self.replay_once()
+
+    async def replay_once(self) -> int:
+        """Resends outbox entries for rooms with no send in flight."""
+        entries = await asyncio.to_thread(self.outbox.due, self.replay_batch)
+        replays = []
+        for room_id, payload, updated_at in entries:
+            if room_id in self._workers:
+                # The worker's next successful send supersedes this entry.
+                continue
+            worker = asyncio.ensure_future(self._drain(room_id, (payload, updated_at)))
+            self._workers[room_id] = worker
+            replays.append(worker)
+        delivered = sum(await asyncio.gather(*replays))
+        if delivered:
+            self.replayed += delivered
+            bt.logging.info(f"Replayed {delivered} room updates from the outbox")
+        return delivered
+
+    async def _drain(
+        self, room_id: str, replay: Optional[Tuple[Dict[str, Any], float]] = None
+    ) -> bool:
+        """Sends a room's queued states in order; ``replay`` goes first.
+
+        Returns whether the replayed state was delivered.
+        """
+        replayed = False
+        try:
+            if replay is not None:
+                payload, updated_at = replay
+                if await self.send(self.validator, room_id, payload):
+                    replayed = True
+                    self._stored.discard(room_id)
+                    await asyncio.to_thread(self.outbox.remove, room_id, updated_at)
+                else:
+                    await asyncio.to_thread(self.outbox.record_attempt, room_id)
+            while room_id in self._latest:
+                payload = self._latest.pop(room_id)
+                if await self.send(self.validator, room_id, payload):
+                    self.sent += 1
+                    if room_id in self._stored:
+                        self._stored.discard(room_id)
+                        await asyncio.to_thread(self.outbox.remove, room_id)
+                    continue
+                self.failed += 1
+                if room_id not in self._latest:
+                    # Nothing newer is queued, so keep this state for replay.
+                    self._stored.add(room_id)
+                    await asyncio.to_thread(self.outbox.put, room_id, payload)
+        except Exception as err:  # noqa: BLE001
+            bt.logging.error(f"Room publisher for {room_id} failed: {err}")
+        finally:
+            self._workers.pop(room_id, None)
+            if room_id in self._finished and room_id not in self._latest:
+                self._forget(room_id)
+        return replayed
+
+    def _forget(self, room_id: str) -> None:
+        self._finished.discard(room_id)
+        self.validator.room_states.forget(room_id)
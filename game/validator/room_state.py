@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+import bittensor as bt
+
+from game.utils.game import GameState
+
+# Keys handled by the list-aware parts of a delta; every other key is a scalar.
+_LIST_KEYS = ("cards", "chatHistory", "participants")
+
+
+def room_payload(validator_key: str, game_state: GameState) -> Dict[str, Any]:
+    """Full room state as sent to ``PATCH /api/v1/rooms/{id}``."""
+    return {
+        "validatorKey": validator_key,
+        "cards": [
+            {
+                "word": card.word,
+                "color": card.color,
+                "isRevealed": card.is_revealed,
+                "wasRecentlyRevealed": card.was_recently_revealed,
+            }
+            for card in game_state.cards
+        ],
+        "chatHistory": [
+            {
+                "sender": msg.sender.value,
+                "message": msg.message,
+                "team": msg.team.value,
+                "reasoning": msg.reasoning,
+                "clueText": msg.clueText,
+                "number": msg.number,
+                "guesses": list(msg.guesses) if msg.guesses is not None else None,
+            }
+            for msg in game_state.chatHistory
+        ],
+        "currentTeam": game_state.currentTeam.value,
+        "currentRole": game_state.currentRole.value,
+        "previousTeam": (
+            game_state.previousTeam.value if game_state.previousTeam else None
+        ),
+        "previousRole": (
+            game_state.previousRole.value if game_state.previousRole else None
+        ),
+        "remainingRed": game_state.remainingRed,
+        "remainingBlue": game_state.remainingBlue,
+        "currentClue": (
+            {
+                "clueText": game_state.currentClue.clueText,
+                "number": game_state.currentClue.number,
+            }
+            if game_state.currentClue
+            else None
+        ),
+        "currentGuesses": (
+            list(game_state.currentGuesses) if game_state.currentGuesses else []
+        ),
+        "gameWinner": (game_state.gameWinner.value if game_state.gameWinner else None),
+        "participants": [
+            {
+                "name": p.name,
+                "hotkey": p.hotkey,
+                "team": p.team.value,
+                "role": p.role.value,
+            }
+            for p in game_state.participants
+        ],
+    }
+
+
+def diff_room(base: Dict[str, Any], payload: Dict[str, Any]) -> Optional[Dict]:
+    """Changes that turn ``base`` into ``payload``.
+
+    The delta holds changed cards by index (``cards``), chat messages added
+    since ``base`` (``chatAppend``) and changed top-level fields (``set``).
+    Returns None when the change cannot be expressed that way, e.g. a
+    different board or a rewritten chat history, and a full snapshot is needed.
+    """
+    if len(base["cards"]) != len(payload["cards"]):
+        return None
+    if base["participants"] != payload["participants"]:
+        return None
+    base_chat = base["chatHistory"]
+    chat = payload["chatHistory"]
+    if len(chat) < len(base_chat) or chat[: len(base_chat)] != base_chat:
+        return None
+
+    delta: Dict[str, Any] = {}
+    cards = {
+        str(index): card
+        for index, (old, card) in enumerate(zip(base["cards"], payload["cards"]))
+        if old != card
+    }
+    if cards:
+        delta["cards"] = cards
+    if len(chat) > len(base_chat):
+        delta["chatAppend"] = chat[len(base_chat) :]
+    changed = {
+        key: value
+        for key, value in payload.items()
+        if key not in _LIST_KEYS and base.get(key) != value
+    }
+    if changed:
+        delta["set"] = changed
+    return delta
+
+
+def apply_room_delta(state: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Applies a ``diff_room`` delta to a room state and returns the new state."""
+    state = copy.deepcopy(state)
+    for index, card in delta.get("cards", {}).items():
+        state["cards"][int(index)] = card
+    state["chatHistory"].extend(delta.get("chatAppend", []))
+    state.update(delta.get("set", {}))
+    return state
+
+
+class RoomStateTracker:
+    """Remembers the last room state the backend acknowledged, per room.
+
+    Each acknowledged state carries a version. A delta names the version it
+    was built against (``baseVersion``), so the backend can reject it when its
+    copy has diverged, and the validator then resends a full snapshot.
+    """
+
+    def __init__(self):
+        self._acked: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+    def diff(self, room_id: str, payload: Dict[str, Any]) -> Tuple[Optional[Dict], int]:
+        """Returns ``(delta, base_version)``; the delta is None if a full snapshot is needed."""
+        acked = self._acked.get(room_id)
+        if acked is None:
+            return None, 0
+        version, base = acked
+        return diff_room(base, payload), version
+
+    def next_version(self, room_id: str) -> int:
+        acked = self._acked.get(room_id)
+        return acked[0] + 1 if acked else 1
+
+    def acknowledge(self, room_id: str, version: int, payload: Dict[str, Any]) -> None:
+        self._acked[room_id] = (version, payload)
+
+    def forget(self, room_id: str) -> None:
+        """Drops a room's state; its next update will be a full snapshot."""
+        self._acked.pop(room_id, None)
+
+
+async def send_room_update(self, roomId: str, payload: Dict[str, Any]) -> bool:
+    """PATCHes a ``room_payload`` to the backend, as a delta when enabled.
+
+    Returns True once the backend has the state, False if the update failed.
+    """
+    endpoint = f"{self.backend_base}/api/v1/rooms/{roomId}"
+    try:
+        tracker = self.room_states if self.config.neuron.room_delta_updates else None
+        if tracker is None:
+            body = payload
+        else:
+            delta, base_version = tracker.diff(roomId, payload)
+            if delta == {}:
+                bt.logging.debug(f"Room {roomId} unchanged; skipping update")
+                return True
+            if delta is not None:
+                response = await self.backend.patch(
+                    f"{endpoint}/delta",
+                    json={
+                        "validatorKey": payload["validatorKey"],
+                        "baseVersion": base_version,
+                        "version": base_version + 1,
+                        **delta,
+                    },
+                )
+                if response.status == 200:
+                    tracker.acknowledge(roomId, base_version + 1, payload)
+                    bt.logging.info("Room state delta applied successfully")
+                    return True
+                bt.logging.warning(
+                    f"Room {roomId} delta rejected: HTTP {response.status}; resending full state"
+                )
+            version = tracker.next_version(roomId)
+            body = dict(payload, version=version)
+        response = await self.backend.patch(endpoint, json=body)
+        if response.status != 200:
+            bt.logging.error(
+                f"Failed to update room state: HTTP {response.status} - {response.text}"
+            )
+            return False
+        if tracker is not None:
+            tracker.acknowledge(roomId, version, payload)
+        bt.logging.info("Room state updated successfully")
+        return True
+    except aiohttp.ClientError as e:
+        bt.logging.error(f"Network error updating room {roomId}: {e}")
+    except asyncio.TimeoutError:
+        bt.logging.error(f"Timeout error updating room {roomId} at {endpoint}")
+    except Exception as e:
+        bt.logging.error(f"Unexpected error updating room {roomId}: {e}")
+    return False
+
+
+async def create_room(self, game_state: GameState):
+    endpoint = f"{self.backend_base}/api/v1/rooms/create"
+    try:
+        payload = {
+            "validatorKey": self.wallet.hotkey.ss58_address,
+            "cards": [
+                {
+                    "word": card.word,
+                    "color": card.color,
+                    "isRevealed": card.is_revealed,
+                    "wasRecentlyRevealed": card.was_recently_revealed,
+                }
+                for card in game_state.cards
+            ],
+            "chatHistory": [],  # Game just started, no chat history yet
+            "currentTeam": game_state.currentTeam.value,
+            "currentRole": game_state.currentRole.value,
+            "previousTeam": None,  # Game just started, no previous team
+            "previousRole": None,  # Game just started, no previous role
+            "remainingRed": game_state.remainingRed,
+            "remainingBlue": game_state.remainingBlue,
+            "currentClue": None,  # Game just started, no current clue
+            "currentGuesses": [],  # Game just started, no guesses yet
+            "gameWinner": None,  # Game just started, no winner
+            "participants": [
+                {
+                    "name": p.name,
+                    "hotkey": p.hotkey,
+                    "team": p.team.value,
+                    "role": p.role.value,
+                }
+                for p in game_state.participants
+            ],
+        }
+        response = await self.backend.post(endpoint, json=payload)
+        if response.status != 200:
+            bt.logging.error(
+                f"Failed to create new room: HTTP {response.status} - {response.text}"
+            )
+            return None
+        else:
+            bt.logging.info(f"Room created successfully: {response.text}")
+            try:
+                return json.loads(response.text)["data"]["id"]
+            except (json.JSONDecodeError, KeyError) as e:
+                bt.logging.error(f"Failed to parse room creation response: {e}")
+                return None
+    except aiohttp.ClientError as e:
+        bt.logging.error(f"Network error creating room: {e}")
+        return None
+    except asyncio.TimeoutError:
+        bt.logging.error(f"Timeout error creating room at {endpoint}")
+        return None
+    except Exception as e:
+        bt.logging.error(f"Unexpected error creating room: {e}")
+        return None
+
+
+async def remove_room(self, roomId) -> bool:
+    """Deletes a room; returns True once the backend confirmed it."""
+    endpoint = f"{self.backend_base}/api/v1/rooms/{roomId}"
+    try:
+        response = await self.backend.delete(endpoint)
+        if response.status != 200:
+            bt.logging.error(
+                f"Failed to delete room: HTTP {response.status} - {response.text}"
+            )
+        else:
+            bt.logging.info("Room deleted successfully")
+            return True
+    except aiohttp.ClientError as e:
+        bt.logging.error(f"Network error deleting room {roomId}: {e}")
+    except asyncio.TimeoutError:
+        bt.logging.error(f"Timeout error deleting room {roomId} at {endpoint}")
+    except Exception as e:
+        bt.logging.error(f"Unexpected error deleting room {roomId}: {e}")
+    return False
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from traceback import print_exception
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+import bittensor as bt
+
+
+class GameScheduler:
+    """Keeps a fixed number of games in flight and syncs with the chain on its own cadence.
+
+    Every slot is refilled as soon as its game finishes, so one slow game no longer
+    holds back the others. Each game runs under a hard deadline and is cancelled
+    once it is exceeded. The chain sync (metagraph refresh, weight setting and
+    state saving) runs in worker threads every ``sync_interval`` seconds instead
+    of between batches.
+    """
+
+    def __init__(
+        self,
+        validator,
+        num_slots: int,
+        game_timeout: float,
+        sync_interval: float,
+    ):
+        self.validator = validator
+        self.num_slots = max(1, int(num_slots))
+        self.game_timeout = float(game_timeout)
+        self.sync_interval = float(sync_interval)
+        self.paused = False
+        self.games_started = 0
+        self.games_finished = 0
+        self.games_timed_out = 0
+        self.games_failed = 0
+        self._game_seconds = 0.0
+        self._service_factories: List[Tuple[str, Callable[[], Awaitable]]] = []
+        self._services: Set[asyncio.Task] = set()
+
+    def add_service(self, name: str, factory: Callable[[], Awaitable]) -> None:
+        """Registers a background service that runs alongside the games.
+
+        ``factory`` is called to create the service coroutine each time the
+        scheduler starts, and again if the service crashes.
+        """
+        self._service_factories.append((name, factory))
+
+    async def run(self) -> None:
+        """Runs games until ``validator.should_exit`` is set."""
+        await self._maintenance()
+        self._services = {
+            asyncio.ensure_future(self._supervise(name, factory))
+            for name, factory in [("sync", self._sync_loop)] + self._service_factories
+        }
+        games: Set[asyncio.Task] = set()
+        try:
+            while not self.validator.should_exit:
+                while len(games) < self.num_slots and not self.paused:
+                    games.add(asyncio.ensure_future(self._run_game()))
+                if not games:
+                    await asyncio.sleep(1)
+                    continue
+                _, games = await asyncio.wait(
+                    games, timeout=1.0, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            pending = list(games) + list(self._services)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _run_game(self) -> None:
+        self.games_started += 1
+        started_at = time.time()
+        try:
+            await asyncio.wait_for(self.validator.forward(), timeout=self.game_timeout)
+        except asyncio.TimeoutError:
+            self.games_timed_out += 1
+            bt.logging.warning(
+                f"Game exceeded its {self.game_timeout:.0f}s deadline and was cancelled."
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:  # noqa: BLE001
+            self.games_failed += 1
+            bt.logging.error(f"Error during game: {err}")
+            bt.logging.debug(str(print_exception(type(err), err, err.__traceback__)))
+        finally:
+            self.games_finished += 1
+            self._game_seconds += time.time() - started_at
+            self.validator.step += 1
+
+    async def _supervise(self, name: str, factory: Callable[[], Awaitable]) -> None:
+        while not self.validator.should_exit:
+            try:
+                await factory()
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:  # noqa: BLE001
+                bt.logging.error(f"Service {name} crashed, restarting: {err}")
+                bt.logging.debug(
+                    str(print_exception(type(err), err, err.__traceback__))
+                )
+                await asyncio.sleep(5)
+
+    async def _sync_loop(self) -> None:
+        while not self.validator.should_exit:
+            await asyncio.sleep(self.sync_interval)
+            await self._maintenance()
+            self.log_stats()
+
+    async def _maintenance(self) -> None:
+        try:
+            await self._sync()
+        except Exception as err:  # noqa: BLE001
+            bt.logging.error(f"Error during sync: {err}")
+            bt.logging.debug(str(print_exception(type(err), err, err.__traceback__)))
+
+    async def _sync(self) -> None:
+        """``validator.sync()`` with the chain I/O moved to worker threads.
+
+        Games read the metagraph while this runs, so the new metagraph is
+        synced as a copy in a thread and swapped in, together with the
+        hotkeys and scores that match it, back on the event loop.
+        """
+        validator = self.validator
+        matches, resync = await asyncio.to_thread(self._check_chain)
+        if matches != (not self.paused):
+            bt.logging.info(
+                "Resuming games." if matches else "Pausing new games until upgrade."
+            )
+        self.paused = not matches
+        if resync:
+            metagraph = await asyncio.to_thread(validator.fetch_metagraph)
+            validator.apply_metagraph(metagraph)
+        await asyncio.to_thread(self._publish_state, resync)
+
+    def _check_chain(self) -> Tuple[bool, bool]:
+        validator = self.validator
+        matches = validator.weights_version_matches()
+        # Ensure the validator hotkey is still registered on the network.
+        validator.check_registered()
+        return matches, validator.should_sync_metagraph()
+
+    def _publish_state(self, resynced: bool) -> None:
+        validator = self.validator
+        if resynced:
+            validator.last_metagraph_update = validator.block
+        if validator.should_set_weights():
+            validator.set_weights()
+        # Always save state.
+        validator.save_state()
+
+    def log_stats(self) -> None:
+        average: Optional[float] = (
+            self._game_seconds / self.games_finished if self.games_finished else None
+        )
+        average_text = f"{average:.1f}s" if average is not None else "n/a"
+        bt.logging.info(
+            f"Games started={self.games_started} finished={self.games_finished} "
+            f"timed_out={self.games_timed_out} failed={self.games_failed} "
+            f"avg_duration={average_text}"
+        )
+        arbiter = getattr(self.validator, "clue_arbiter", None)
+        if arbiter is not None:
+            bt.logging.info(f"Clue arbiter stats: {arbiter.stats()}")
@@ -1,19 +1,93 @@
 from __future__ import annotations
 
+import json
 import os
+import queue
 import sqlite3
 import time
 import threading
 from collections import defaultdict
-from typing import Dict, Iterable, Optional, Sequence
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-import aiohttp
 import bittensor as bt
 from game.utils.misc import parse_ts
+from game.validator.score_window import ScoreWindow
+
+# Width of the time buckets in the selection_counts counter table.
+SELECTION_BUCKET_SECONDS = 3600
+# Rows deleted per transaction during compaction.
+COMPACTION_BATCH_SIZE = 5000
+
+INSERT_GAME_SQL = """
+    INSERT INTO scores(
+        room_id, rs, ro, bs, bo, winner,
+        started_at, ended_at,
+        score_rs, score_ro, score_bs, score_bo,
+        reason, synced_at
+    ) VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?,NULL)
+    ON CONFLICT(room_id) DO UPDATE SET
+        rs=excluded.rs,
+        ro=excluded.ro,
+        bs=excluded.bs,
+        bo=excluded.bo,
+        winner=excluded.winner,
+        started_at=excluded.started_at,
+        ended_at=excluded.ended_at,
+        score_rs=excluded.score_rs,
+        score_ro=excluded.score_ro,
+        score_bs=excluded.score_bs,
+        score_bo=excluded.score_bo,
+        reason=excluded.reason,
+        synced_at=NULL
+    ;
+"""
+
+INSERT_SELECTION_SQL = """
+    INSERT INTO selection_events(hotkey, uid, ts)
+    VALUES(?, ?, ?)
+"""
+
+UPSERT_SCORES_ALL_SQL = """
+    INSERT INTO scores_all(
+        room_id, validator, rs, ro, bs, bo,
+        winner, started_at, ended_at,
+        score_rs, score_ro, score_bs, score_bo,
+        reason, synced_at
+    ) VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+    ON CONFLICT(room_id, validator) DO UPDATE SET
+        rs=excluded.rs,
+        ro=excluded.ro,
+        bs=excluded.bs,
+        bo=excluded.bo,
+        winner=excluded.winner,
+        started_at=excluded.started_at,
+        ended_at=excluded.ended_at,
+        score_rs=excluded.score_rs,
+        score_ro=excluded.score_ro,
+        score_bs=excluded.score_bs,
+        score_bo=excluded.score_bo,
+        reason=excluded.reason,
+        synced_at=excluded.synced_at
+    ;
+"""
+
+MARK_SYNCED_SQL = "UPDATE scores SET synced_at=? WHERE room_id=?"
+
+INSERT_TURN_SQL = """
+    INSERT INTO turn_telemetry(
+        room_id, uid, hotkey, role, turn, ts, latency, attempts,
+        request_bytes, response_bytes, adjudication, adjudicated_by, verdict,
+        outcome
+    ) VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+"""
 
 
 class ScoreStore:
-    """SQLite-backed store for finished game snapshots and backend synchronisation."""
+    """SQLite-backed store for finished game snapshots and miner selection history.
+
+    Backend synchronisation lives in ``AsyncScoreStore``.
+    """
 
     def __init__(
         self,
@@ -21,6 +95,8 @@ class ScoreStore:
         backend_url: str,
         fetch_url: Optional[str] = None,
         signer=None,
+        window_seconds: Optional[float] = None,
+        max_readers: int = 4,
     ):
         self.db_path = db_path
         self.backend_url = backend_url
@@ -30,7 +106,21 @@ class ScoreStore:
         if folder:
             os.makedirs(folder, exist_ok=True)
         self._conn: Optional[sqlite3.Connection] = None
+        # Serialises writes on ``conn``. Reads use their own WAL connections
+        # from the reader pool and never wait on it.
         self._lock = threading.RLock()
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._reader_conns = []
+        self._max_readers = max(1, int(max_readers))
+        self._reader_lock = threading.Lock()
+        self._window_lock = threading.Lock()
+        # In-memory totals for the scoring window; the local ``scores`` window
+        # only backs the game count fallback in ``games_in_window``.
+        self.window: Optional[ScoreWindow] = None
+        self._local_window: Optional[ScoreWindow] = None
+        if window_seconds:
+            self.window = ScoreWindow(window_seconds)
+            self._local_window = ScoreWindow(window_seconds)
 
     @property
     def conn(self) -> sqlite3.Connection:
@@ -42,10 +132,66 @@ class ScoreStore:
                         isolation_level=None,
                         check_same_thread=False,
                     )
+                    self._enable_incremental_vacuum(self._conn)
                     self._conn.execute("PRAGMA journal_mode=WAL;")
                     self._conn.execute("PRAGMA synchronous=NORMAL;")
         return self._conn
 
+    def _enable_incremental_vacuum(self, conn: sqlite3.Connection) -> None:
+        """Switches the database to incremental auto-vacuum.
+
+        The pragma alone only takes effect before the first table exists. A
+        database created without it is rebuilt once with VACUUM.
+        """
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL;")
+        (mode,) = conn.execute("PRAGMA auto_vacuum;").fetchone()
+        if mode == 0:
+            bt.logging.info(
+                f"Rebuilding {self.db_path} once to enable incremental vacuum"
+            )
+            conn.execute("VACUUM;")
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Cursor]:
+        """Checks a read-only connection out of the pool for the enclosed reads."""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._reader_lock:
+                if len(self._reader_conns) < self._max_readers:
+                    # The writer connection creates the database and enables WAL.
+                    self.conn
+                    conn = sqlite3.connect(
+                        self.db_path, isolation_level=None, check_same_thread=False
+                    )
+                    conn.execute("PRAGMA query_only=ON;")
+                    self._reader_conns.append(conn)
+            if conn is None:
+                conn = self._readers.get()
+        cur = conn.cursor()
+        try:
+            yield cur
+        finally:
+            cur.close()
+            self._readers.put(conn)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Runs the enclosed writes as one transaction with a single commit."""
+        with self._lock:
+            cur = self.conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                yield cur
+            except BaseException:
+                cur.execute("ROLLBACK")
+                raise
+            else:
+                cur.execute("COMMIT")
+            finally:
+                cur.close()
+
     def init(self, hotkeys):
         cur = self.conn.cursor()
         cur.execute(
@@ -119,22 +265,137 @@ class ScoreStore:
             except sqlite3.OperationalError:
                 pass
 
-            # Seed selection events to ensure every hotkey appears at least once.
-            now = int(time.time())
-            for uid, hotkey in enumerate(hotkeys):
+            cur.close()
+        self._init_selection_counts()
+        self._init_turn_telemetry()
+        self.seed_selection_events(hotkeys)
+        self._rebuild_windows()
+
+    def _init_selection_counts(self) -> None:
+        """Creates the per-(bucket, hotkey) selection counter table.
+
+        A trigger keeps it in step with every insert into ``selection_events``,
+        which stays the raw audit log. Existing events are counted once when
+        the table is first created.
+        """
+        with self._transaction() as cur:
+            cur.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='selection_counts'"
+            )
+            exists = cur.fetchone() is not None
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS selection_counts (
+                    bucket INTEGER NOT NULL,
+                    hotkey TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (bucket, hotkey)
+                ) WITHOUT ROWID;
+                """
+            )
+            cur.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS trg_selection_events_count
+                AFTER INSERT ON selection_events
+                BEGIN
+                    INSERT INTO selection_counts(bucket, hotkey, count)
+                    VALUES(NEW.ts / {SELECTION_BUCKET_SECONDS}, NEW.hotkey, 1)
+                    ON CONFLICT(bucket, hotkey) DO UPDATE SET count = count + 1;
+                END;
+                """
+            )
+            if not exists:
                 cur.execute(
-                    "SELECT 1 FROM selection_events WHERE hotkey=? LIMIT 1",
-                    (hotkey,),
+                    f"""
+                    INSERT INTO selection_counts(bucket, hotkey, count)
+                    SELECT ts / {SELECTION_BUCKET_SECONDS}, hotkey, COUNT(*)
+                    FROM selection_events
+                    GROUP BY ts / {SELECTION_BUCKET_SECONDS}, hotkey
+                    """
                 )
-                if cur.fetchone() is None:
-                    cur.execute(
-                        """
-                        INSERT INTO selection_events(hotkey, uid, ts)
-                        VALUES(?, ?, ?)
-                        """,
-                        (hotkey, uid, now),
-                    )
 
+    def _init_turn_telemetry(self) -> None:
+        """Creates the per-turn query telemetry table (one row per miner query).
+
+        For clues, ``adjudication`` is the local rule ruling, ``adjudicated_by``
+        the stage that decided (opponent, rules or arbiter) and ``verdict``
+        the final one.
+        """
+        with self._transaction() as cur:
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS turn_telemetry (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    room_id TEXT NOT NULL,
+                    uid INTEGER NOT NULL,
+                    hotkey TEXT NOT NULL,
+                    role TEXT NOT NULL,
+                    turn INTEGER NOT NULL,
+                    ts REAL NOT NULL,
+                    latency REAL,
+                    attempts INTEGER NOT NULL,
+                    request_bytes INTEGER NOT NULL,
+                    response_bytes INTEGER NOT NULL,
+                    adjudication TEXT,
+                    adjudicated_by TEXT,
+                    verdict TEXT,
+                    outcome TEXT NOT NULL
+                );
+                """
+            )
+            for column in ("adjudicated_by", "verdict"):
+                try:
+                    cur.execute(f"ALTER TABLE turn_telemetry ADD COLUMN {column} TEXT")
+                except sqlite3.OperationalError:
+                    pass
+            cur.execute(
+                "CREATE INDEX IF NOT EXISTS idx_turn_telemetry_hotkey_role_ts ON turn_telemetry(hotkey, role, ts);"
+            )
+            cur.execute(
+                "CREATE INDEX IF NOT EXISTS idx_turn_telemetry_ts ON turn_telemetry(ts);"
+            )
+
+    def seed_selection_events(self, hotkeys: Sequence[str]) -> None:
+        """Seeds one selection event for every hotkey that has none yet."""
+        with self._transaction() as cur:
+            cur.execute(
+                """
+                INSERT INTO selection_events(hotkey, uid, ts)
+                SELECT seed.value, CAST(seed.key AS INTEGER), ?
+                FROM json_each(?) AS seed
+                WHERE seed.value != ''
+                  AND NOT EXISTS (
+                      SELECT 1 FROM selection_events WHERE hotkey = seed.value
+                  )
+                """,
+                (int(time.time()), json.dumps(list(hotkeys))),
+            )
+
+    def _rebuild_windows(self) -> None:
+        if self.window is None:
+            return
+        with self._lock, self._window_lock:
+            covered_since = time.time() - self.window.horizon_seconds
+            self.window.reset(covered_since)
+            self._local_window.reset(covered_since)
+            cur = self.conn.cursor()
+            cur.execute(
+                """
+                SELECT room_id, validator, ended_at, rs, ro, bs, bo,
+                       score_rs, score_ro, score_bs, score_bo
+                FROM scores_all
+                WHERE ended_at >= ?
+                """,
+                (int(covered_since),),
+            )
+            for room_id, validator, ended_at, *rest in cur.fetchall():
+                self.window.add((room_id, validator), ended_at, _contributions(*rest))
+            cur.execute(
+                "SELECT room_id, ended_at FROM scores WHERE ended_at >= ?",
+                (int(covered_since),),
+            )
+            for room_id, ended_at in cur.fetchall():
+                self._local_window.add(room_id, ended_at, ())
             cur.close()
 
     def record_game(
@@ -154,49 +415,40 @@ class ScoreStore:
         score_bo: float,
         reason: Optional[str],
     ) -> None:
-        with self._lock:
-            cur = self.conn.cursor()
-            cur.execute(
-                """
-                INSERT INTO scores(
-                    room_id, rs, ro, bs, bo, winner,
-                    started_at, ended_at,
-                    score_rs, score_ro, score_bs, score_bo,
-                    reason, synced_at
-                ) VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?,NULL)
-                ON CONFLICT(room_id) DO UPDATE SET
-                    rs=excluded.rs,
-                    ro=excluded.ro,
-                    bs=excluded.bs,
-                    bo=excluded.bo,
-                    winner=excluded.winner,
-                    started_at=excluded.started_at,
-                    ended_at=excluded.ended_at,
-                    score_rs=excluded.score_rs,
-                    score_ro=excluded.score_ro,
-                    score_bs=excluded.score_bs,
-                    score_bo=excluded.score_bo,
-                    reason=excluded.reason,
-                    synced_at=NULL
-                ;
-                """,
-                (
-                    room_id,
-                    rs,
-                    ro,
-                    bs,
-                    bo,
-                    winner,
-                    int(started_at),
-                    int(ended_at),
-                    float(score_rs),
-                    float(score_ro),
-                    float(score_bs),
-                    float(score_bo),
-                    reason,
-                ),
-            )
-            cur.close()
+        row = game_row(
+            room_id=room_id,
+            rs=rs,
+            ro=ro,
+            bs=bs,
+            bo=bo,
+            winner=winner,
+            started_at=started_at,
+            ended_at=ended_at,
+            score_rs=score_rs,
+            score_ro=score_ro,
+            score_bs=score_bs,
+            score_bo=score_bo,
+            reason=reason,
+        )
+        with self._transaction() as cur:
+            cur.execute(INSERT_GAME_SQL, row)
+        self.note_local_game(row)
+
+    def note_local_game(self, row: tuple) -> None:
+        """Adds a committed ``game_row`` to the in-memory window."""
+        if self._local_window is not None:
+            with self._window_lock:
+                self._local_window.add(row[0], row[7], ())
+
+    def note_scores_all(self, mapped_rows: Sequence[tuple]) -> None:
+        """Adds committed ``scores_all_rows`` to the in-memory window."""
+        if self.window is None:
+            return
+        with self._window_lock:
+            for row in mapped_rows:
+                self.window.add(
+                    (row[0], row[1]), row[8], _contributions(*row[2:6], *row[9:13])
+                )
 
     def pending(self) -> Iterable[Dict[str, object]]:
         columns = [
@@ -214,21 +466,27 @@ class ScoreStore:
             "score_bo",
             "reason",
         ]
-        with self._lock:
-            cur = self.conn.cursor()
+        with self._reader() as cur:
             cur.execute(
                 "SELECT {} FROM scores WHERE synced_at IS NULL ORDER BY ended_at ASC".format(
                     ", ".join(columns)
                 )
             )
             rows = [dict(zip(columns, row)) for row in cur.fetchall()]
-            cur.close()
         return rows
 
     def window_scores_by_hotkey(self, since_ts: float) -> Dict[str, float]:
+        if self.window is not None:
+            with self._window_lock:
+                self.window.expire()
+                totals = self.window.totals_since(since_ts)
+            if totals is not None:
+                return totals
+        return self._window_scores_by_hotkey_sql(since_ts)
+
+    def _window_scores_by_hotkey_sql(self, since_ts: float) -> Dict[str, float]:
         totals: Dict[str, float] = defaultdict(float)
-        with self._lock:
-            cur = self.conn.cursor()
+        with self._reader() as cur:
             cur.execute(
                 """
                 SELECT rs, ro, bs, bo,
@@ -249,57 +507,157 @@ class ScoreStore:
                     totals[bs] += float(score_bs or 0.0)
                 if bo:
                     totals[bo] += float(score_bo or 0.0)
-            cur.close()
         return dict(totals)
 
     def increment_selection_count(self, hotkey: str, uid: int) -> None:
-        if not hotkey:
-            return
-        with self._lock:
-            cur = self.conn.cursor()
+        self.record_selections([(hotkey, uid)])
+
+    def record_selections(self, selections: Iterable[Tuple[str, int]]) -> int:
+        """Records a selection event per ``(hotkey, uid)`` in one transaction.
+
+        Returns the number of events written.
+        """
+        rows = selection_rows(selections)
+        if not rows:
+            return 0
+        with self._transaction() as cur:
+            cur.executemany(INSERT_SELECTION_SQL, rows)
+        return len(rows)
+
+    def selection_counts_since(self, since_ts: float) -> Dict[str, int]:
+        """Selection counts per hotkey for events at or after ``since_ts``.
+
+        Whole buckets come from the counter table; only the bucket containing
+        ``since_ts`` is counted from raw events so the cut-off stays exact.
+        """
+        since_ts = int(since_ts)
+        edge = since_ts // SELECTION_BUCKET_SECONDS
+        with self._reader() as cur:
             cur.execute(
                 """
-                INSERT INTO selection_events(hotkey, uid, ts)
-                VALUES(?, ?, ?)
+                SELECT hotkey, SUM(n) FROM (
+                    SELECT hotkey, count AS n
+                    FROM selection_counts
+                    WHERE bucket > ?
+                    UNION ALL
+                    SELECT hotkey, COUNT(*) AS n
+                    FROM selection_events
+                    WHERE ts >= ? AND ts < ?
+                    GROUP BY hotkey
+                )
+                GROUP BY hotkey
                 """,
-                (hotkey, uid, int(time.time())),
+                (edge, since_ts, (edge + 1) * SELECTION_BUCKET_SECONDS),
             )
-            cur.close()
+            rows = cur.fetchall()
+        return {hotkey: int(count) for hotkey, count in rows}
 
-    def selection_counts_since(self, since_ts: float) -> Dict[str, int]:
-        with self._lock:
-            cur = self.conn.cursor()
+    def record_turns(self, turns: Iterable[dict]) -> int:
+        rows = turn_rows(turns)
+        if not rows:
+            return 0
+        with self._transaction() as cur:
+            cur.executemany(INSERT_TURN_SQL, rows)
+        return len(rows)
+
+    def turn_latency_stats(
+        self, since_ts: float, role: Optional[str] = None
+    ) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """Latency p50/p95 and failure counts per ``(hotkey, role)`` since ``since_ts``.
+
+        Percentiles cover answered turns only; ``failures`` counts turns the
+        miner never answered.
+        """
+        with self._reader() as cur:
             cur.execute(
-                "SELECT hotkey, COUNT(*) FROM selection_events WHERE ts >= ? GROUP BY hotkey",
-                (int(since_ts),),
+                """
+                WITH ranked AS (
+                    SELECT hotkey, role, latency, outcome,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY hotkey, role, outcome = 'no_response'
+                               ORDER BY latency
+                           ) AS position,
+                           COUNT(*) OVER (
+                               PARTITION BY hotkey, role, outcome = 'no_response'
+                           ) AS n
+                    FROM turn_telemetry
+                    WHERE ts >= ? AND (? IS NULL OR role = ?)
+                )
+                SELECT hotkey, role, COUNT(*), SUM(outcome = 'no_response'),
+                       MIN(CASE WHEN outcome != 'no_response' AND position >= 0.50 * n
+                                THEN latency END),
+                       MIN(CASE WHEN outcome != 'no_response' AND position >= 0.95 * n
+                                THEN latency END)
+                FROM ranked
+                GROUP BY hotkey, role
+                """,
+                (float(since_ts), role, role),
             )
             rows = cur.fetchall()
-            cur.close()
-        return {hotkey: int(count) for hotkey, count in rows}
+        return {
+            (hotkey, role_name): {
+                "turns": int(turns),
+                "failures": int(failures or 0),
+                "p50": p50,
+                "p95": p95,
+            }
+            for hotkey, role_name, turns, failures, p50, p95 in rows
+        }
+
+    def recent_turn_latencies(self, per_hotkey: int = 50) -> Dict[str, List[float]]:
+        """Latest answered-turn latencies per hotkey, oldest first."""
+        with self._reader() as cur:
+            cur.execute(
+                """
+                SELECT hotkey, latency FROM (
+                    SELECT hotkey, latency, ts,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY hotkey ORDER BY ts DESC
+                           ) AS age
+                    FROM turn_telemetry
+                    WHERE outcome != 'no_response' AND latency IS NOT NULL
+                )
+                WHERE age <= ?
+                ORDER BY ts
+                """,
+                (int(per_hotkey),),
+            )
+            rows = cur.fetchall()
+        latencies: Dict[str, List[float]] = {}
+        for hotkey, latency in rows:
+            latencies.setdefault(hotkey, []).append(float(latency))
+        return latencies
 
     def max_scores_all_id(self) -> int:
-        with self._lock:
-            cur = self.conn.cursor()
+        with self._reader() as cur:
             cur.execute("SELECT MAX(id) FROM scores_all")
             row = cur.fetchone()
-            cur.close()
         if not row or row[0] is None:
             return 0
         return int(row[0])
 
     def latest_scores_all_timestamp(self) -> int:
-        with self._lock:
-            cur = self.conn.cursor()
+        with self._reader() as cur:
             cur.execute("SELECT MAX(ended_at) FROM scores_all")
             row = cur.fetchone()
-            cur.close()
         if not row or row[0] is None:
             return 0
         return int(row[0])
 
     def games_in_window(self, since_ts: float) -> int:
-        with self._lock:
-            cur = self.conn.cursor()
+        if self.window is not None:
+            with self._window_lock:
+                self.window.expire()
+                self._local_window.expire()
+                count = self.window.count_since(since_ts)
+                if not count:
+                    count = self._local_window.count_since(since_ts)
+            if count is not None:
+                return count
+        return self._games_in_window_sql(since_ts)
+
+    def _games_in_window_sql(self, since_ts: float) -> int:
+        with self._reader() as cur:
             cur.execute(
                 "SELECT COUNT(*) FROM scores_all WHERE ended_at >= ?",
                 (int(since_ts),),
@@ -313,192 +671,213 @@ class ScoreStore:
                     (int(since_ts),),
                 )
                 (count,) = cur.fetchone()
-            cur.close()
         return int(count)
 
     def mark_synced(self, room_id: str) -> None:
-        with self._lock:
-            cur = self.conn.cursor()
-            cur.execute(
-                "UPDATE scores SET synced_at=? WHERE room_id=?",
-                (int(time.time()), room_id),
-            )
-            cur.close()
-
-    async def sync_pending(self) -> int:
-        """Pushes unsynced rows to the backend API.
+        with self._transaction() as cur:
+            cur.execute(MARK_SYNCED_SQL, (int(time.time()), room_id))
 
-        Returns the number of rows marked as synced.
-        """
-
-        if not self.backend_url:
-            bt.logging.warning("No backend URL configured for score syncing.")
-            return 0
-
-        to_sync = list(self.pending())
-        if not to_sync:
-            return 0
+    def _upsert_scores_all(self, rows: Sequence[dict]) -> None:
+        mapped_rows = scores_all_rows(rows)
+        if not mapped_rows:
+            return
+        with self._transaction() as cur:
+            cur.executemany(UPSERT_SCORES_ALL_SQL, mapped_rows)
+        self.note_scores_all(mapped_rows)
 
-        synced = 0
-        async with aiohttp.ClientSession() as session:
-            for row in to_sync:
-                payload = {
-                    "red": {
-                        "spymaster": {
-                            "hotkey": row["rs"],
-                            "score": row["score_rs"],
-                        },
-                        "operative": {
-                            "hotkey": row["ro"],
-                            "score": row["score_ro"],
-                        },
-                    },
-                    "blue": {
-                        "spymaster": {
-                            "hotkey": row["bs"],
-                            "score": row["score_bs"],
-                        },
-                        "operative": {
-                            "hotkey": row["bo"],
-                            "score": row["score_bo"],
-                        },
-                    },
-                    "reason": row["reason"],
-                }
-                headers = self.signer() if self.signer else {}
-                try:
-                    async with session.patch(
-                        self.backend_url + "/" + row["room_id"],
-                        json=payload,
-                        headers=headers,
-                        timeout=10,
-                    ) as resp:
-                        if resp.status in (200, 201, 202, 204):
-                            self.mark_synced(row["room_id"])
-                            synced += 1
-                        else:
-                            text = await resp.text()
-                            bt.logging.error(
-                                f"Failed to sync score {row['room_id']}: {resp.status} {text}"
-                            )
-                except Exception as err:  # noqa: BLE001
-                    bt.logging.error(f"Exception syncing score {row['room_id']}: {err}")
-                bt.logging.info(f"Upload {synced} scores")
-            await self.sync_scores_all(session=session)
-        return synced
-
-    async def sync_scores_all(
-        self, session: Optional[aiohttp.ClientSession] = None
-    ) -> int:
-        if not self.fetch_url:
-            bt.logging.debug("No fetch URL configured; skipping scores_all sync.")
-            return 0
+    def compact(self, retain_seconds: float) -> Dict[str, int]:
+        """Deletes rows older than ``retain_seconds`` and reclaims their space.
 
-        close_session = False
-        if session is None:
-            session = aiohttp.ClientSession()
-            close_session = True
+        Never reaches into the scoring window: ``retain_seconds`` is raised to
+        the window length when a window is configured. Unsynced local games
+        and the newest ``scores_all`` row (the sync cursor) are always kept.
+        Returns the number of rows removed per table and the bytes reclaimed.
+        """
+        if self.window is not None:
+            retain_seconds = max(retain_seconds, self.window.horizon_seconds)
+        # One bucket of slack so a window computed moments earlier stays intact.
+        cutoff = int(time.time() - retain_seconds) - SELECTION_BUCKET_SECONDS
+        deleted = {
+            "scores_all": self._delete_in_batches(
+                "scores_all",
+                "ended_at < ? AND id < (SELECT MAX(id) FROM scores_all)",
+                (cutoff,),
+            ),
+            "scores": self._delete_in_batches(
+                "scores", "ended_at < ? AND synced_at IS NOT NULL", (cutoff,)
+            ),
+            "selection_events": self._delete_in_batches(
+                "selection_events", "ts < ?", (cutoff,)
+            ),
+            "turn_telemetry": self._delete_in_batches(
+                "turn_telemetry", "ts < ?", (cutoff,)
+            ),
+        }
+        with self._transaction() as cur:
+            cur.execute(
+                "DELETE FROM selection_counts WHERE bucket < ?",
+                (cutoff // SELECTION_BUCKET_SECONDS,),
+            )
+            deleted["selection_counts"] = cur.rowcount
 
-        try:
-            headers = self.signer() if self.signer else {}
-            params = {}
-            since_id = self.max_scores_all_id()
-            params["since_id"] = since_id
-            params["limit"] = 100
-            while True:
-                async with session.get(
-                    self.fetch_url, headers=headers, params=params, timeout=15
-                ) as resp:
-                    if resp.status != 200:
-                        text = await resp.text()
-                        bt.logging.error(
-                            f"Failed to sync scores_all: {resp.status} {text}"
-                        )
-                        return 0
-                    payload = await resp.json(content_type=None)
-                    if not isinstance(payload["data"], list):
-                        bt.logging.error(
-                            "Unexpected payload when syncing scores_all; expected list."
-                        )
-                        return
-                    self._upsert_scores_all(payload["data"])
-                    bt.logging.info(
-                        f"Synced Score: {params['since_id'] + payload['meta']['count']} / {payload['meta']['total']}"
-                    )
-                    if not payload["meta"]["has_more"]:
-                        break
-                    params["since_id"] = payload["meta"]["next_since_id"]
-        except Exception as err:  # noqa: BLE001
-            bt.logging.error(f"Exception refreshing scores_all: {err}")
-            return 0
-        finally:
-            if close_session:
-                await session.close()
+        with self._lock:
+            size_before = self._file_size()
+            # executescript steps the pragma to completion; execute() would free one page.
+            self.conn.executescript("PRAGMA incremental_vacuum;")
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE);").fetchall()
+            free_pages = self.conn.execute("PRAGMA freelist_count;").fetchone()[0]
+            page_size = self.conn.execute("PRAGMA page_size;").fetchone()[0]
+            size_after = self._file_size()
+        stats = dict(deleted)
+        stats["bytes_reclaimed"] = max(0, size_before - size_after)
+        stats["bytes_free_in_file"] = int(free_pages) * int(page_size)
+        stats["bytes_on_disk"] = size_after
+        return stats
 
-    def _upsert_scores_all(self, rows: Sequence[dict]) -> None:
-        mapped_rows = []
-        synced_at = int(time.time())
-        for row in rows:
-            try:
-                mapped_rows.append(
-                    (
-                        str(row.get("room_id") or ""),
-                        str(row.get("validator") or ""),
-                        str(row.get("rs") or ""),
-                        str(row.get("ro") or ""),
-                        str(row.get("bs") or ""),
-                        str(row.get("bo") or ""),
-                        row.get("winner"),
-                        parse_ts(row.get("started_at")),
-                        parse_ts(row.get("ended_at")),
-                        float(row.get("score_rs") or 0.0),
-                        float(row.get("score_ro") or 0.0),
-                        float(row.get("score_bs") or 0.0),
-                        float(row.get("score_bo") or 0.0),
-                        row.get("reason"),
-                        int(synced_at),
+    def _delete_in_batches(self, table: str, where: str, params: tuple) -> int:
+        total = 0
+        while True:
+            with self._transaction() as cur:
+                cur.execute(
+                    f"""
+                    DELETE FROM {table} WHERE id IN (
+                        SELECT id FROM {table} WHERE {where} LIMIT ?
                     )
+                    """,
+                    (*params, COMPACTION_BATCH_SIZE),
                 )
-            except Exception as err:  # noqa: BLE001
-                bt.logging.error(f"Skipping malformed scores_all row {row}: {err}")
-
-        if not mapped_rows:
-            return
+                removed = cur.rowcount
+            total += removed
+            if removed < COMPACTION_BATCH_SIZE:
+                return total
 
-        with self._lock:
-            cur = self.conn.cursor()
-            cur.executemany(
-                """
-                INSERT INTO scores_all(
-                    room_id, validator, rs, ro, bs, bo,
-                    winner, started_at, ended_at,
-                    score_rs, score_ro, score_bs, score_bo,
-                    reason, synced_at
-                ) VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-                ON CONFLICT(room_id, validator) DO UPDATE SET
-                    rs=excluded.rs,
-                    ro=excluded.ro,
-                    bs=excluded.bs,
-                    bo=excluded.bo,
-                    winner=excluded.winner,
-                    started_at=excluded.started_at,
-                    ended_at=excluded.ended_at,
-                    score_rs=excluded.score_rs,
-                    score_ro=excluded.score_ro,
-                    score_bs=excluded.score_bs,
-                    score_bo=excluded.score_bo,
-                    reason=excluded.reason,
-                    synced_at=excluded.synced_at
-                ;
-                """,
-                mapped_rows,
-            )
-            cur.close()
+    def _file_size(self) -> int:
+        return sum(
+            os.path.getsize(path)
+            for path in (self.db_path, self.db_path + "-wal")
+            if os.path.exists(path)
+        )
 
     def close(self):
+        with self._reader_lock:
+            for conn in self._reader_conns:
+                conn.close()
+            self._reader_conns = []
+            self._readers = queue.Queue()
         with self._lock:
             if self._conn is not None:
                 try:
                     self._conn.close()
                 finally:
                     self._conn = None
+
+
+def _contributions(
+    rs: str,
+    ro: str,
+    bs: str,
+    bo: str,
+    score_rs: Optional[float],
+    score_ro: Optional[float],
+    score_bs: Optional[float],
+    score_bo: Optional[float],
+):
+    return (
+        (rs, float(score_rs or 0.0)),
+        (ro, float(score_ro or 0.0)),
+        (bs, float(score_bs or 0.0)),
+        (bo, float(score_bo or 0.0)),
+    )
+
+
+def game_row(
+    *,
+    room_id: str,
+    rs: str,
+    ro: str,
+    bs: str,
+    bo: str,
+    winner: Optional[str],
+    started_at: float,
+    ended_at: float,
+    score_rs: float,
+    score_ro: float,
+    score_bs: float,
+    score_bo: float,
+    reason: Optional[str],
+) -> tuple:
+    """Parameters for ``INSERT_GAME_SQL``."""
+    return (
+        room_id,
+        rs,
+        ro,
+        bs,
+        bo,
+        winner,
+        int(started_at),
+        int(ended_at),
+        float(score_rs),
+        float(score_ro),
+        float(score_bs),
+        float(score_bo),
+        reason,
+    )
+
+
+def selection_rows(selections: Iterable[Tuple[str, int]]) -> list:
+    """Parameters for ``INSERT_SELECTION_SQL``, skipping empty hotkeys."""
+    now = int(time.time())
+    return [(hotkey, int(uid), now) for hotkey, uid in selections if hotkey]
+
+
+def turn_rows(turns: Iterable[dict]) -> list:
+    """Parameters for ``INSERT_TURN_SQL``."""
+    return [
+        (
+            str(turn["room_id"]),
+            int(turn["uid"]),
+            str(turn["hotkey"]),
+            str(turn["role"]),
+            int(turn["turn"]),
+            float(turn.get("ts") or time.time()),
+            None if turn.get("latency") is None else float(turn["latency"]),
+            int(turn.get("attempts") or 0),
+            int(turn.get("request_bytes") or 0),
+            int(turn.get("response_bytes") or 0),
+            turn.get("adjudication"),
+            turn.get("adjudicated_by"),
+            turn.get("verdict"),
+            str(turn.get("outcome") or "ok"),
+        )
+        for turn in turns
+    ]
+
+
+def scores_all_rows(rows: Sequence[dict]) -> list:
+    """Parameters for ``UPSERT_SCORES_ALL_SQL`` from backend rows."""
+    mapped_rows = []
+    synced_at = int(time.time())
+    for row in rows:
+        try:
+            mapped_rows.append(
+                (
+                    str(row.get("room_id") or ""),
+                    str(row.get("validator") or ""),
+                    str(row.get("rs") or ""),
+                    str(row.get("ro") or ""),
+                    str(row.get("bs") or ""),
+                    str(row.get("bo") or ""),
+                    row.get("winner"),
+                    parse_ts(row.get("started_at")),
+                    parse_ts(row.get("ended_at")),
+                    float(row.get("score_rs") or 0.0),
+                    float(row.get("score_ro") or 0.0),
+                    float(row.get("score_bs") or 0.0),
+                    float(row.get("score_bo") or 0.0),
+                    row.get("reason"),
+                    int(synced_at),
+                )
+            )
+        except Exception as err:  # noqa: BLE001
+            bt.logging.error(f"Skipping malformed scores_all row {row}: {err}")
+    return mapped_rows
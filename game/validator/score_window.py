@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from typing import Dict, Hashable, Optional, Sequence, Set, Tuple
+
+Contributions = Tuple[Tuple[str, float], ...]
+
+
+class ScoreWindow:
+    """In-memory, time-bucketed per-hotkey score totals for recent games.
+
+    Games are grouped into ``bucket_seconds``-wide buckets by ``ended_at`` and
+    each bucket keeps per-hotkey totals. A window query adds up the whole
+    buckets after ``since_ts`` and re-scans only the rows of the bucket that
+    contains ``since_ts``, so the result matches a ``WHERE ended_at >= ?`` query
+    exactly. Rows older than ``horizon_seconds`` expire as the window slides.
+    Queries reaching further back return None so callers fall back to SQL.
+    """
+
+    def __init__(self, horizon_seconds: float, bucket_seconds: int = 3600):
+        self.horizon_seconds = float(horizon_seconds)
+        self.bucket_seconds = max(1, int(bucket_seconds))
+        self.covered_since = time.time() - self.horizon_seconds
+        self._rows: Dict[Hashable, Tuple[int, Contributions]] = {}
+        self._bucket_rows: Dict[int, Set[Hashable]] = defaultdict(set)
+        self._bucket_totals: Dict[int, Dict[str, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def reset(self, covered_since: float) -> None:
+        self.covered_since = float(covered_since)
+        self._rows.clear()
+        self._bucket_rows.clear()
+        self._bucket_totals.clear()
+
+    def add(self, key: Hashable, ended_at: int, contributions: Contributions) -> None:
+        """Adds a game, replacing any earlier version stored under ``key``."""
+        self.remove(key)
+        ended_at = int(ended_at)
+        if ended_at < self.covered_since:
+            return
+        contributions = tuple((hk, float(score)) for hk, score in contributions if hk)
+        bucket = ended_at // self.bucket_seconds
+        self._rows[key] = (ended_at, contributions)
+        self._bucket_rows[bucket].add(key)
+        totals = self._bucket_totals.setdefault(bucket, {})
+        for hotkey, score in contributions:
+            totals[hotkey] = totals.get(hotkey, 0.0) + score
+
+    def remove(self, key: Hashable) -> None:
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+        bucket = row[0] // self.bucket_seconds
+        self._bucket_rows[bucket].discard(key)
+        # Rebuild the bucket rather than subtracting, so no float drift creeps in.
+        self._bucket_totals[bucket] = self._sum_rows(self._bucket_rows[bucket], None)
+
+    def expire(self, now: float = None) -> None:
+        now = time.time() if now is None else now
+        first_kept = int(now - self.horizon_seconds) // self.bucket_seconds
+        for bucket in [b for b in self._bucket_rows if b < first_kept]:
+            for key in self._bucket_rows.pop(bucket):
+                self._rows.pop(key, None)
+            self._bucket_totals.pop(bucket, None)
+        self.covered_since = max(self.covered_since, first_kept * self.bucket_seconds)
+
+    def totals_since(self, since_ts: float) -> Optional[Dict[str, float]]:
+        if since_ts < self.covered_since:
+            return None
+        since_ts = int(since_ts)
+        edge = since_ts // self.bucket_seconds
+        totals = self._sum_rows(self._bucket_rows.get(edge, ()), since_ts)
+        for bucket, bucket_totals in self._bucket_totals.items():
+            if bucket > edge:
+                for hotkey, score in bucket_totals.items():
+                    totals[hotkey] = totals.get(hotkey, 0.0) + score
+        return totals
+
+    def count_since(self, since_ts: float) -> Optional[int]:
+        if since_ts < self.covered_since:
+            return None
+        since_ts = int(since_ts)
+        edge = since_ts // self.bucket_seconds
+        count = sum(
+            1
+            for key in self._bucket_rows.get(edge, ())
+            if self._rows[key][0] >= since_ts
+        )
+        for bucket, keys in self._bucket_rows.items():
+            if bucket > edge:
+                count += len(keys)
+        return count
+
+    def _sum_rows(
+        self, keys: Sequence[Hashable], since_ts: Optional[int]
+    ) -> Dict[str, float]:
+        totals: Dict[str, float] = {}
+        for key in keys:
+            ended_at, contributions = self._rows[key]
+            if since_ts is not None and ended_at < since_ts:
+                continue
+            for hotkey, score in contributions:
+                totals[hotkey] = totals.get(hotkey, 0.0) + score
+        return totals
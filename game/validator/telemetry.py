@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+import bittensor as bt
+
+
+class TurnTelemetry:
+    """Buffers per-turn query telemetry and writes it to the score store in batches.
+
+    ``record`` only appends to memory, so a turn never waits on SQLite. The
+    buffer goes to ``AsyncScoreStore.record_turns`` every ``flush_interval``
+    seconds, or sooner once ``max_buffer`` rows are waiting. Each turn is also
+    reported to the availability tracker, so a miner that stops answering
+    games is re-probed right away.
+    """
+
+    def __init__(
+        self,
+        validator,
+        flush_interval: float = 10.0,
+        max_buffer: int = 200,
+        max_backlog: int = 10000,
+    ):
+        self.validator = validator
+        self.flush_interval = float(flush_interval)
+        self.max_buffer = max(1, int(max_buffer))
+        self.max_backlog = max(self.max_buffer, int(max_backlog))
+        self.recorded = 0
+        self.written = 0
+        self.dropped = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._flushing: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def record(self, **turn) -> None:
+        turn.setdefault("ts", time.time())
+        self._buffer.append(turn)
+        self.recorded += 1
+        availability = getattr(self.validator, "availability", None)
+        if availability is not None:
+            availability.note_turn(turn["uid"], turn.get("outcome") != "no_response")
+        if len(self._buffer) >= self.max_buffer and self._flushing is None:
+            self._flushing = asyncio.ensure_future(self.flush())
+
+    async def flush(self) -> int:
+        rows, self._buffer = self._buffer, []
+        try:
+            if not rows:
+                return 0
+            await self.validator.async_store.record_turns(rows)
+            self.written += len(rows)
+            return len(rows)
+        except Exception as err:  # noqa: BLE001
+            bt.logging.error(f"Failed to write {len(rows)} turn telemetry rows: {err}")
+            # Keep them for the next flush, but never grow without bound.
+            self._buffer = rows + self._buffer
+            overflow = len(self._buffer) - self.max_backlog
+            if overflow > 0:
+                self.dropped += overflow
+                del self._buffer[:overflow]
+            return 0
+        finally:
+            if self._flushing is asyncio.current_task():
+                self._flushing = None
+
+    async def run(self) -> None:
+        try:
+            while not self.validator.should_exit:
+                await asyncio.sleep(self.flush_interval)
+                await self.flush()
+        finally:
+            await self.flush()
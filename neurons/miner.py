@@ -22,7 +22,6 @@ import json
 import ast
 import bittensor as bt
 import os
-import httpx
 from dotenv import load_dotenv
 import game
 from game.utils.ruleSysPrompt import ruleSysPrompt
@@ -31,6 +30,11 @@ from game.utils.opSysPrompt import opSysPrompt
 
 # Bittensor Miner Template:
 from game.protocol import GameSynapse, GameSynapseOutput, Ping
+from game.miner.providers import ProviderPool
+from game.miner.responses import RejectedAnswer, clean_json, parse_completion
+from game.miner.retry import Deadline, RetryEngine
+from game.miner.router import HedgedRouter
+from game.miner.single_flight import SingleFlightCache, turn_digest
 
 from openai import OpenAI
 from openai import (
@@ -64,6 +68,28 @@ class Miner(BaseMinerNeuron):
             forward_fn=self.pong,
             blacklist_fn=self.blacklist_ping,
         )
+        # LLM providers with long-lived keep-alive clients, shared by all requests.
+        # They are warmed up on the axon's own event loop as it starts serving.
+        self.providers = ProviderPool.from_env(
+            max_concurrency=self.config.provider.max_concurrency,
+            timeout=self.config.provider.timeout,
+        )
+        self.axon.app.add_event_handler("startup", self.providers.warm_up)
+        self.axon.app.add_event_handler("shutdown", self.providers.close)
+        self.router = HedgedRouter(
+            self.providers,
+            hedge_after=self.config.provider.hedge_after,
+            max_hedge_ratio=self.config.provider.max_hedge_ratio,
+            health_options=dict(
+                open_for=self.config.provider.breaker_open_for,
+                slow_after=self.config.provider.slow_after,
+            ),
+        )
+        self.retry_engine = RetryEngine(
+            max_attempts=self.config.provider.max_attempts,
+            min_attempt=self.config.provider.min_attempt,
+        )
+        self.turn_cache = SingleFlightCache(ttl=self.config.provider.cache_ttl)
         # Track game history for strategic awareness
         self.game_history = {}
         # Cleanup old games periodically (keep last 100)
@@ -351,7 +377,24 @@ class Miner(BaseMinerNeuron):
                 reasoning=reasoning,
                 clue_validity=is_valid
             )))
-        
+
+        # Validator retries and identical boards from other validators share one LLM run
+        output, _ = await self.turn_cache.get_or_run(
+            turn_digest(synapse),
+            lambda: self.play_turn(synapse),
+            keep=lambda result: result[1],
+        )
+        synapse.output = output.model_copy(deep=True)
+        return synapse
+
+    async def play_turn(
+        self, synapse: game.protocol.GameSynapse
+    ) -> typing.Tuple[GameSynapseOutput, bool]:
+        """
+        Plays one spymaster or operative turn with the LLM.
+
+        Returns the turn's output and whether it came from the LLM rather than a fallback.
+        """
         # Cleanup old games periodically
         self.cleanup_old_games()
         
@@ -359,21 +402,6 @@ class Miner(BaseMinerNeuron):
         game_id = self.get_game_id(synapse.cards)
         game_context = self.get_game_context(game_id)
 
-        async def get_gpt5_response(messages):
-            try:
-                client = OpenAI(api_key=os.environ.get("OPENAI_KEY"))
-                result = client.responses.create(
-                    model="gpt-5",
-                    input=messages,
-                    reasoning={
-                        "effort": "minimal"
-                    },  # Optional: control reasoning effort
-                )
-                return result.output_text
-            except Exception as e:
-                bt.logging.error(f"Error fetching response from GPT-4: {e}")
-                return None
-
         # Build board and clue strings outside the f-string to avoid backslash-in-expression errors.
         messages = []
         if synapse.your_role == "operative":
@@ -764,155 +792,31 @@ For EACH potential guess, rate confidence 1-10 and only include if >= {confidenc
         messages.append({"role": "user", "content": userPrompt})
 
         async def get_gpt4_response(messages, role):
-            max_retries = 3
-            
             # Temperature tuning by role
             # Spymaster: Lower temp for safer, less risky clues (avoid creative assassin traps)
             # Operative: Conservative for reliable word associations
             base_temperature = 0.6 if role == "spymaster" else 0.5
-            
-            # Chutes.ai configuration
-            use_chutes = os.environ.get("USE_CHUTES_AI", "false").lower() == "true"
-            chutes_inference_url = "https://llm.chutes.ai/v1/chat/completions"
-            # Default to best available model: DeepSeek-V3 or DeepSeek-R1
-            chutes_model = os.environ.get("CHUTES_MODEL", "deepseek-ai/DeepSeek-V3")
-            
-            for attempt in range(max_retries):
-                try:
-                    # Reduce temperature on retries for more reliable output
-                    adjusted_temperature = base_temperature * (0.85 ** attempt)
-                    
-                    bt.logging.debug(f"API call attempt {attempt+1}/{max_retries}, temp={adjusted_temperature:.2f}")
-                    
-                    if use_chutes:
-                        # Use Chutes.ai NON-streaming API for reliability (streaming causes truncation)
-                        bt.logging.debug(f"Using Chutes.ai model: {chutes_model}")
-                        
-                        headers = {
-                            "Authorization": f"Bearer {os.environ.get('CHUTES_API_KEY')}",
-                            "Content-Type": "application/json"
-                        }
-                        
-                        # Increased max_tokens to prevent truncation (was 600, now 1200)
-                        # Reasoning strings can be long with assassin analysis
-                        body = {
-                            "model": chutes_model,
-                            "messages": messages,
-                            "temperature": adjusted_temperature,
-                            "max_tokens": 2400,  # Doubled to prevent truncation
-                            "stream": False,  # Non-streaming for reliability
-                            "response_format": {"type": "json_object"}  # Force JSON output
-                        }
-                        
-                        # Validator has 30s timeout with 3 retries, so we have ~25s per attempt
-                        async with httpx.AsyncClient(timeout=25.0) as client:
-                            response = await client.post(chutes_inference_url, headers=headers, json=body)
-                            
-                            if response.status_code != 200:
-                                error_text = response.text
-                                bt.logging.error(f"Chutes API request failed: {response.status_code} - {error_text}")
-                                raise Exception(f"Chutes API error: {error_text}")
-                            
-                            response_json = response.json()
-                            
-                            if "choices" not in response_json or len(response_json["choices"]) == 0:
-                                raise Exception("Chutes API returned no choices")
-                            
-                            response_text = response_json["choices"][0]["message"]["content"]
-                        
-                        # Debug: Log what we actually received
-                        bt.logging.debug(f"Raw response from Chutes.ai (first 200 chars): {response_text[:200] if response_text else 'EMPTY'}")
-                        
-                        if not response_text or not response_text.strip():
-                            bt.logging.error(f"Chutes API returned empty response. Full response_json: {response_json}")
-                            raise Exception("Chutes API returned empty response")
-                        
-                        # Clean response: Strip markdown code blocks and extract JSON
-                        cleaned_response = response_text.strip()
-                        
-                        # Handle markdown code blocks (Chutes.ai often wraps in ```json ... ```)
-                        if cleaned_response.startswith("```"):
-                            # Remove opening ``` and optional language identifier
-                            first_newline = cleaned_response.find('\n')
-                            if first_newline != -1:
-                                cleaned_response = cleaned_response[first_newline + 1:]
-                            # Remove closing ```
-                            if cleaned_response.endswith("```"):
-                                cleaned_response = cleaned_response[:-3].strip()
-                        
-                        # Handle case where response starts with markdown headers or text
-                        # Look for JSON object starting with { or array starting with [
-                        if not cleaned_response.startswith('{') and not cleaned_response.startswith('['):
-                            # Try to extract JSON from the response
-                            json_start = cleaned_response.find('{')
-                            if json_start != -1:
-                                # Find matching closing brace
-                                brace_count = 0
-                                json_end = -1
-                                for i in range(json_start, len(cleaned_response)):
-                                    if cleaned_response[i] == '{':
-                                        brace_count += 1
-                                    elif cleaned_response[i] == '}':
-                                        brace_count -= 1
-                                        if brace_count == 0:
-                                            json_end = i + 1
-                                            break
-                                if json_end != -1:
-                                    cleaned_response = cleaned_response[json_start:json_end]
-                                    bt.logging.warning(f"Extracted JSON from markdown response")
-                                else:
-                                    bt.logging.error(f"Could not find matching closing brace in response")
-                            else:
-                                bt.logging.error(f"No JSON object found in response starting with: {cleaned_response[:100]}")
-                        
-                        # Validate that cleaned response is valid JSON
-                        try:
-                            test_json = json.loads(cleaned_response)
-                            # Verify required fields exist
-                            if synapse.your_role == "spymaster":
-                                if "clue" not in test_json or "number" not in test_json:
-                                    bt.logging.warning(f"Incomplete JSON (missing fields), retrying...")
-                                    raise Exception("Incomplete JSON response")
-                            else:
-                                if "guesses" not in test_json:
-                                    bt.logging.warning(f"Incomplete JSON (missing guesses), retrying...")
-                                    raise Exception("Incomplete JSON response")
-                        except json.JSONDecodeError as e:
-                            bt.logging.warning(f"Invalid JSON from Chutes.ai, retrying: {e}")
-                            bt.logging.error(f"Problematic response text (first 500 chars): {cleaned_response[:500]}")
-                            raise Exception(f"Invalid JSON: {e}")
-                        
-                        # Return the CLEANED response (without markdown)
-                        bt.logging.debug(f"Successfully validated response, returning cleaned JSON")
-                        return cleaned_response
-                        
-                    else:
-                        # Use standard OpenAI API
-                        bt.logging.debug(f"Using OpenAI model: gpt-4o-mini")
-                        client = OpenAI(api_key=os.environ.get("OPENAI_KEY"))
-                                
-                        response = client.chat.completions.create(
-                                    model="gpt-4o-mini",
-                                    messages=messages,
-                                    temperature=adjusted_temperature,
-                                    max_tokens=600,
-                                    response_format={"type": "json_object"}
-                        )
-                        if not response.choices or len(response.choices) == 0:
-                            raise Exception("OpenAI API returned no choices")
-                        return response.choices[0].message.content
-                        
-                except json.JSONDecodeError as e:
-                    bt.logging.error(f"JSON decode error on attempt {attempt+1}: {e}")
-                    if attempt < max_retries - 1:
-                        time.sleep(0.5 * (attempt + 1))  # Exponential backoff
-                        continue
-                except Exception as e:
-                    bt.logging.error(f"Error fetching response on attempt {attempt+1}: {e}")
-                    if attempt < max_retries - 1:
-                        time.sleep(1 * (attempt + 1))  # Exponential backoff
-                        continue
-            return None
+
+            def accept(response_text):
+                # Strip markdown fences and check the fields this role needs
+                cleaned_response = clean_json(response_text)
+                parsed = parse_completion(cleaned_response, role)
+                if role == "spymaster" and not self.validate_clue(parsed.get("clue"), unrevealed_words):
+                    raise RejectedAnswer(f"Clue '{parsed.get('clue')}' breaks the board word rules")
+                return cleaned_response
+
+            async def attempt(number, seconds_left):
+                # Reduce temperature on retries for more reliable output
+                adjusted_temperature = base_temperature * (0.85 ** number)
+                bt.logging.debug(f"API call attempt {number+1}, temp={adjusted_temperature:.2f}, {seconds_left:.1f}s left")
+
+                # A slow provider is raced against the next one (see HedgedRouter)
+                return await self.router.complete(
+                    messages, adjusted_temperature, timeout=seconds_left, accept=accept
+                )
+
+            # Retries stop in time to answer before the validator's dendrite gives up
+            return await self.retry_engine.run(attempt, Deadline.from_synapse(synapse, margin=self.config.provider.deadline_margin))
 
         response_str = await get_gpt4_response(messages, synapse.your_role)
         
@@ -1110,7 +1014,7 @@ For EACH potential guess, rate confidence 1-10 and only include if >= {confidenc
             self.update_game_history(game_id, "operative", guesses=guesses, is_our_turn=True)
             bt.logging.debug(f"Updated game history: operative guesses {guesses}")
 
-        return synapse
+        return synapse.output, response_str is not None
 
     async def _blacklist(self, synapse: bt.Synapse) -> typing.Tuple[bool, str]:
         """
@@ -1232,6 +1136,9 @@ if __name__ == "__main__":
         with Miner() as miner:
             while True:
                 bt.logging.info(f"Miner running... {time.time()}")
+                bt.logging.debug(f"Inference stats: {miner.retry_engine.stats()}")
+                bt.logging.debug(f"Turn cache stats: {miner.turn_cache.stats()}")
+                bt.logging.info(f"Provider stats: {miner.router.stats()}")
                 time.sleep(10)
     except Exception as e:
         bt.logging.error(f"Miner failed with exception: {e}")
@@ -0,0 +1,155 @@
+"""
+Benchmarks miner selection in ``get_random_uids`` on stand-in metagraphs.
+
+Compares the SelectionIndex-based selection against the previous list-scan
+implementation at several metagraph sizes. The metagraph only carries the
+fields selection reads, so no subtensor or registered subnet is needed. The
+defaults draw 4 teams (k=16) with 5% of miners reachable and selection
+counts in 0..200. Usage:
+
+    python scripts/benchmark_selection.py --sizes 256 1024 4096 --rounds 50
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bittensor as bt
+import numpy as np
+
+from game.utils.uids import get_random_uids
+
+
+class _Store:
+    def __init__(self, hotkeys, spread):
+        self.counts = {hotkey: random.randint(0, spread) for hotkey in hotkeys}
+        self.scores = {hotkey: random.uniform(-3.0, 3.0) for hotkey in hotkeys}
+
+    async def window_scores_by_hotkey(self, since_ts):
+        return self.scores
+
+    async def selection_counts_since(self, since_ts):
+        return self.counts
+
+
+class _Availability:
+    is_warm = True
+
+    def __init__(self, uids, fraction):
+        self.uids = [uid for uid in uids if random.random() < fraction]
+
+    def available_uids(self):
+        return self.uids
+
+
+def build_validator(n: int, spread: int, available: float):
+    metagraph = SimpleNamespace(
+        uids=np.arange(n),
+        hotkeys=[f"hotkey-{uid}" for uid in range(n)],
+        coldkeys=[f"coldkey-{uid}" for uid in range(n)],
+        # Every miner gets its own IP so IP de-duplication does not end the draw early.
+        axons=[
+            SimpleNamespace(ip=f"10.{uid // 65536}.{(uid // 256) % 256}.{uid % 256}")
+            for uid in range(n)
+        ],
+    )
+    uids = [int(uid) for uid in metagraph.uids]
+    return SimpleNamespace(
+        metagraph=metagraph,
+        scoring_window_seconds=86400,
+        async_store=_Store(metagraph.hotkeys, spread),
+        availability=_Availability(uids, available),
+        config=SimpleNamespace(neuron=SimpleNamespace(ping_quorum_factor=0)),
+    )
+
+
+def legacy_select(validator, k):
+    """The list-scan selection loop that SelectionIndex replaced."""
+    metagraph = validator.metagraph
+    selection_counts = validator.async_store.counts
+    window_scores = validator.async_store.scores
+    successful_set = set(validator.availability.available_uids())
+    available_pool = [int(uid) for uid in metagraph.uids]
+    random.shuffle(available_pool)
+    selected, hotkeys_to_increase, selected_ips = [], [], []
+    while len(selected) < k and len(available_pool) > 0:
+        counts = [
+            selection_counts.get(metagraph.hotkeys[uid])
+            for uid in available_pool
+            if metagraph.hotkeys[uid] in selection_counts
+        ]
+        min_selection_count = min(counts) if counts else 0
+        for uid in available_pool:
+            if len(selected) >= k:
+                break
+            if uid in selected:
+                continue
+            hotkey = metagraph.hotkeys[uid]
+            if selection_counts.get(hotkey, min_selection_count) > min_selection_count:
+                continue
+            available_pool.remove(uid)
+            ip = metagraph.axons[uid].ip
+            if ip in selected_ips:
+                continue
+            hotkeys_to_increase.append(hotkey)
+            if uid not in successful_set:
+                continue
+            if float(window_scores.get(hotkey, 0.0)) < -2.0:
+                continue
+            selected.append(uid)
+            selected_ips.append(ip)
+    return selected, hotkeys_to_increase
+
+
+def run(sizes, rounds, teams, spread, available):
+    loop = asyncio.new_event_loop()
+    for n in sizes:
+        validator = build_validator(n, spread, available)
+        k = 4 * teams
+
+        started = time.perf_counter()
+        for _ in range(rounds):
+            legacy_select(validator, k)
+        legacy = (time.perf_counter() - started) / rounds
+
+        started = time.perf_counter()
+        for _ in range(rounds):
+            loop.run_until_complete(get_random_uids(validator, k=k))
+        indexed = (time.perf_counter() - started) / rounds
+
+        print(
+            f"n={n:5d} k={k:3d} legacy={legacy * 1e3:8.2f}ms "
+            f"indexed={indexed * 1e3:8.2f}ms speedup={legacy / indexed:6.1f}x"
+        )
+    loop.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[256, 1024, 4096])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument(
+        "--teams", type=int, default=4, help="Teams of 4 drawn per selection pass."
+    )
+    parser.add_argument(
+        "--spread",
+        type=int,
+        default=200,
+        help="Selection counts are drawn from 0..spread.",
+    )
+    parser.add_argument(
+        "--available",
+        type=float,
+        default=0.05,
+        help="Fraction of miners that answer pings.",
+    )
+    args = parser.parse_args()
+    bt.logging.off()
+    random.seed(0)
+    run(args.sizes, args.rounds, args.teams, args.spread, args.available)
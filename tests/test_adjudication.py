@@ -0,0 +1,108 @@
+import asyncio
+import time
+
+from game.validator.adjudication import adjudicate_clue
+from game.validator.clue_rules import Ruling
+
+
+class Stage:
+    def __init__(self, delay, result):
+        self.delay = delay
+        self.result = result
+        self.started = False
+        self.cancelled = False
+
+    async def __call__(self):
+        self.started = True
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return self.result
+
+
+class Rules:
+    def __init__(self, ruling, delay=0.0):
+        self.ruling = ruling
+        self.delay = delay
+        self.opponent_started = None
+
+    def __call__(self):
+        time.sleep(self.delay)
+        return self.ruling, "rule reason"
+
+
+def _run(ruling, opponent, arbiter, speculative=False, rules_delay=0.0):
+    rules = Rules(ruling, rules_delay)
+
+    def check_rules():
+        rules.opponent_started = opponent.started
+        return rules()
+
+    async def main():
+        started = time.perf_counter()
+        verdict = await adjudicate_clue(
+            check_rules, opponent, arbiter, speculative=speculative
+        )
+        elapsed = time.perf_counter() - started
+        await asyncio.sleep(0)  # let cancellations land
+        return verdict, elapsed
+
+    verdict, elapsed = asyncio.run(main())
+    return verdict, elapsed, rules
+
+
+def test_unflagged_clue_stands_whatever_the_rules_say():
+    for ruling in Ruling:
+        opponent = Stage(0.01, (False, ""))
+        arbiter = Stage(0.01, (False, "on the board"))
+        verdict = _run(ruling, opponent, arbiter)[0]
+        assert verdict == (True, "Clue is valid", "opponent")
+        assert opponent.started and not arbiter.started
+
+
+def test_rules_uphold_a_flag_without_the_arbiter():
+    opponent = Stage(0.01, (True, "flagged"))
+    arbiter = Stage(0.01, (True, "Clue is valid"))
+    verdict = _run(Ruling.INVALID, opponent, arbiter)[0]
+    assert verdict == (False, "rule reason", "rules")
+    assert not arbiter.started
+
+
+def test_flag_the_rules_cannot_confirm_goes_to_the_arbiter():
+    for ruling in (Ruling.VALID, Ruling.AMBIGUOUS):
+        opponent = Stage(0.01, (True, "broke is a form of BREAK"))
+        arbiter = Stage(0.01, (False, "irregular form"))
+        verdict = _run(ruling, opponent, arbiter)[0]
+        assert verdict == (False, "irregular form", "arbiter")
+        assert arbiter.started
+
+
+def test_rules_run_while_the_opponent_is_asked():
+    opponent = Stage(0.2, (True, "flagged"))
+    arbiter = Stage(0.01, (False, ""))
+    verdict, elapsed, rules = _run(Ruling.INVALID, opponent, arbiter, rules_delay=0.1)
+    assert verdict == (False, "rule reason", "rules")
+    assert rules.opponent_started
+    assert elapsed < 0.28
+
+
+def test_speculative_arbiter_overlaps_the_opponent():
+    opponent = Stage(0.2, (True, "flagged"))
+    arbiter = Stage(0.2, (False, "on the board"))
+    verdict, elapsed, _ = _run(Ruling.AMBIGUOUS, opponent, arbiter, True)
+    assert verdict == (False, "on the board", "arbiter")
+    assert elapsed < 0.35
+
+    sequential = _run(Ruling.AMBIGUOUS, Stage(0.2, (True, "")), Stage(0.2, (False, "")))
+    assert sequential[1] >= 0.4
+
+
+def test_speculative_approval_cancels_the_opponent():
+    opponent = Stage(1.0, (True, "flagged"))
+    arbiter = Stage(0.05, (True, "Clue is valid"))
+    verdict, elapsed, _ = _run(Ruling.AMBIGUOUS, opponent, arbiter, True)
+    assert verdict == (True, "Clue is valid", "arbiter")
+    assert elapsed < 0.5
+    assert opponent.cancelled
@@ -0,0 +1,94 @@
+import asyncio
+import time
+
+import pytest
+
+from game.validator.async_score_store import AsyncScoreStore
+from game.validator.score_store import ScoreStore
+
+WINDOW = 86400
+
+
+def _game(room_id, ended_at):
+    return dict(
+        room_id=room_id,
+        rs="hk0",
+        ro="hk1",
+        bs="hk2",
+        bo="hk3",
+        winner="red",
+        started_at=ended_at - 600,
+        ended_at=ended_at,
+        score_rs=1.0,
+        score_ro=1.0,
+        score_bs=0.0,
+        score_bo=0.0,
+        reason="",
+    )
+
+
+@pytest.fixture
+def stores(tmp_path):
+    store = ScoreStore(
+        str(tmp_path / "scores.db"), backend_url="", window_seconds=WINDOW
+    )
+    store.init(["hk0", "hk1", "hk2", "hk3"])
+    async_store = AsyncScoreStore(store)
+    yield store, async_store
+    async_store.close()
+    store.close()
+
+
+def test_concurrent_writes_are_group_committed(stores):
+    store, async_store = stores
+    now = int(time.time())
+
+    async def main():
+        await asyncio.gather(
+            *[async_store.record_game(**_game(f"room{i}", now)) for i in range(50)],
+            *[
+                async_store.record_selections([("hk0", 0), ("hk1", 1)])
+                for _ in range(10)
+            ],
+        )
+        return await async_store.games_in_window(now - WINDOW)
+
+    assert asyncio.run(main()) == 50
+    assert len(store.pending()) == 50
+    assert store.selection_counts_since(now - WINDOW)["hk0"] == 11
+    assert async_store.jobs_committed == 60
+    assert async_store.batches_committed < 60
+
+
+def test_failed_job_does_not_undo_its_batch(stores):
+    store, async_store = stores
+    now = int(time.time())
+
+    async def main():
+        return await asyncio.gather(
+            async_store.record_game(**_game("ok", now)),
+            async_store._submit(
+                lambda cur: cur.execute("INSERT INTO missing VALUES(1)")
+            ),
+            async_store.mark_synced("ok"),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], Exception)
+    assert store.pending() == []
+    assert store.games_in_window(now - WINDOW) == 1
+
+
+def test_reads_do_not_wait_for_writes(stores):
+    store, async_store = stores
+
+    async def main():
+        # Hold the writer lock as a long write transaction would.
+        with store._transaction():
+            return await asyncio.wait_for(
+                async_store.selection_counts_since(0), timeout=2
+            )
+
+    assert asyncio.run(main()) == {"hk0": 1, "hk1": 1, "hk2": 1, "hk3": 1}
@@ -0,0 +1,93 @@
+import asyncio
+from types import SimpleNamespace
+
+import game
+from game.validator.availability import AvailabilityTracker
+
+
+class StubDendrite:
+    """Answers pings from a table of uid -> version; missing uids time out."""
+
+    def __init__(self, versions):
+        self.versions = versions
+        self.pinged = []
+
+    async def forward(self, axons, synapse, timeout, deserialize):
+        uids = [axon.uid for axon in axons]
+        self.pinged.append(uids)
+        return [
+            (
+                SimpleNamespace(is_available=True, version=self.versions[uid])
+                if uid in self.versions
+                else None
+            )
+            for uid in uids
+        ]
+
+
+def _tracker(versions, n=6, **kwargs):
+    metagraph = SimpleNamespace(
+        uids=list(range(n)),
+        hotkeys=[f"hk{uid}" for uid in range(n)],
+        axons=[SimpleNamespace(uid=uid) for uid in range(n)],
+    )
+    validator = SimpleNamespace(
+        metagraph=metagraph, dendrite=StubDendrite(versions), should_exit=False
+    )
+    return AvailabilityTracker(validator, **kwargs), validator
+
+
+def test_probe_marks_only_current_version_miners_available():
+    current = game.__version__
+    tracker, validator = _tracker({0: current, 1: current, 2: "0.0.1"})
+    asyncio.run(tracker.probe(range(6)))
+    assert sorted(tracker.available_uids()) == [0, 1]
+    assert tracker.entries[2].last_ok and tracker.entries[2].version == "0.0.1"
+    assert not tracker.entries[3].last_ok
+
+
+def test_replaced_hotkey_starts_a_clean_record():
+    tracker, validator = _tracker({0: game.__version__})
+    asyncio.run(tracker.probe([0]))
+    assert tracker.available_uids() == [0]
+    validator.metagraph.hotkeys[0] = "new"
+    assert tracker.available_uids() == []
+    assert not tracker.entry(0).outcomes
+
+
+def test_flaky_miners_fall_below_the_success_rate():
+    tracker, _ = _tracker({}, min_success_rate=0.5)
+    for ok in (False, False, True):
+        tracker.record(0, ok, game.__version__)
+    assert tracker.available_uids() == []
+    tracker.record(0, True, game.__version__)
+    assert tracker.available_uids() == [0]
+
+
+def test_due_uids_are_capped_and_missed_turns_jump_the_queue():
+    tracker, _ = _tracker({}, batch_size=2, stale_after=100)
+    for uid in range(6):
+        tracker.record(uid, True, game.__version__, now=1000.0 + 100 * uid)
+    assert tracker.due_uids(now=1000.0) == []
+    # Entries go stale after roughly stale_after seconds, oldest first.
+    assert tracker.due_uids(now=1500.0) == [0, 1]
+
+    tracker.note_turn(4, answered=False, now=1010.0)
+    assert tracker.due_uids(now=1010.0) == [4]
+    assert tracker.entries[4].outcomes[-1] is False
+
+
+def test_run_warms_up_on_every_uid_then_probes_due_ones():
+    tracker, validator = _tracker({0: game.__version__}, interval=0.01)
+
+    async def main():
+        running = asyncio.ensure_future(tracker.run())
+        await asyncio.sleep(0.05)
+        validator.should_exit = True
+        await running
+
+    asyncio.run(main())
+    assert tracker.is_warm
+    assert validator.dendrite.pinged[0] == list(range(6))
+    # Nothing went stale, so the background loop sent no further pings.
+    assert len(validator.dendrite.pinged) == 1
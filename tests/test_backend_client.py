@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from game.validator.backend_client import BackendClient, CircuitOpenError
+
+
+async def _serve(statuses, delay=0.0):
+    """Serves ``statuses`` in order (then 200s) and records each request."""
+    seen = []
+
+    async def handler(request):
+        seen.append((request.method, dict(request.headers)))
+        status = statuses.pop(0) if statuses else 200
+        await asyncio.sleep(delay)
+        return web.json_response({"data": {"id": "room"}}, status=status)
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}", seen
+
+
+def _signer():
+    calls = []
+
+    def sign():
+        calls.append(1)
+        return {"X-Validator-Signature": str(len(calls))}
+
+    return sign, calls
+
+
+def test_reuses_connection_and_signed_headers():
+    async def main():
+        runner, base, seen = await _serve([])
+        sign, calls = _signer()
+        client = BackendClient(base, signer=sign, header_ttl=60)
+        try:
+            for _ in range(5):
+                response = await client.patch("/api/v1/rooms/1", json={})
+                assert response.ok
+            connector = (await client.session()).connector
+            return seen, calls, len(connector._conns)
+        finally:
+            await client.close()
+            await runner.cleanup()
+
+    seen, calls, pooled_hosts = asyncio.run(main())
+    assert len(seen) == 5
+    assert len(calls) == 1
+    assert {headers["X-Validator-Signature"] for _, headers in seen} == {"1"}
+    assert pooled_hosts == 1
+
+
+def test_retries_idempotent_calls_only():
+    async def main():
+        runner, base, seen = await _serve([503, 503, 503])
+        client = BackendClient(base, retries=2, backoff=0.01)
+        try:
+            patched = await client.patch("/api/v1/rooms/1", json={})
+            posted = await client.post("/api/v1/rooms/create", json={})
+            return patched.status, posted.status, [method for method, _ in seen]
+        finally:
+            await client.close()
+            await runner.cleanup()
+
+    patched, posted, methods = asyncio.run(main())
+    assert patched == 503
+    assert methods == ["PATCH", "PATCH", "PATCH", "POST"]
+    assert posted == 200
+
+
+def test_circuit_opens_after_repeated_failures():
+    async def main():
+        runner, base, seen = await _serve([500] * 10)
+        client = BackendClient(
+            base, retries=0, failure_threshold=3, reset_after=60, backoff=0.01
+        )
+        try:
+            for _ in range(3):
+                assert (await client.get("/api/v1/rooms/sync")).status == 500
+            with pytest.raises(CircuitOpenError):
+                await client.get("/api/v1/rooms/sync")
+            return len(seen)
+        finally:
+            await client.close()
+            await runner.cleanup()
+
+    assert asyncio.run(main()) == 3
+
+
+def test_half_open_circuit_lets_one_trial_through():
+    async def main():
+        runner, base, seen = await _serve([500, 500, 500], delay=0.05)
+        client = BackendClient(
+            base, retries=0, failure_threshold=2, reset_after=0.1, backoff=0.01
+        )
+        try:
+            for _ in range(2):
+                await client.get("/api/v1/rooms/sync")
+            assert client.is_open
+            await asyncio.sleep(0.1)
+            # The failed trial re-opens the circuit at once.
+            assert (await client.get("/api/v1/rooms/sync")).status == 500
+            assert client.is_open
+            await asyncio.sleep(0.1)
+            results = await asyncio.gather(
+                client.get("/api/v1/rooms/sync"),
+                client.get("/api/v1/rooms/sync"),
+                return_exceptions=True,
+            )
+            refused = [r for r in results if isinstance(r, CircuitOpenError)]
+            assert len(refused) == 1
+            assert not client.is_open and not client.is_half_open
+            return len(seen)
+        finally:
+            await client.close()
+            await runner.cleanup()
+
+    assert asyncio.run(main()) == 4
+
+
+def test_resigns_once_on_unauthorized():
+    async def main():
+        runner, base, seen = await _serve([401])
+        sign, calls = _signer()
+        client = BackendClient(base, signer=sign, header_ttl=60)
+        try:
+            response = await client.delete("/api/v1/rooms/1")
+            return response.status, len(calls), len(seen)
+        finally:
+            await client.close()
+            await runner.cleanup()
+
+    assert asyncio.run(main()) == (200, 2, 2)
@@ -0,0 +1,272 @@
+import asyncio
+import json
+import time
+
+from game.validator.clue_arbiter import ClueArbiter, ClueVerdictCache, verdict_key
+
+
+class StubModel:
+    """Stands in for the rules model; flags clues that appear on the board."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = 0
+        self.running = 0
+        self.max_running = 0
+
+    async def respond(self, messages):
+        self.calls += 1
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        content = messages[-1]["content"]
+        clue = content.split(",")[0].removeprefix("Clue: ")
+        valid = clue.upper() not in content.split("Board Words: ")[1]
+        return json.dumps({"valid": valid, "reasoning": "clue is on the board"})
+
+
+def test_verdict_key_ignores_case_spacing_and_word_order():
+    assert verdict_key(" Ocean ", 2, ["FISH", "TREE"]) == verdict_key(
+        "ocean", 2, ["tree", "fish"]
+    )
+    assert verdict_key("ocean", 2, ["FISH"]) != verdict_key("ocean", 3, ["FISH"])
+
+
+def test_verdicts_are_cached_across_restarts(tmp_path):
+    db_path = str(tmp_path / "arbiter.db")
+    model = StubModel()
+
+    async def main():
+        arbiter = ClueArbiter(ClueVerdictCache(db_path), respond=model.respond)
+        first = await arbiter.check("fish", 1, ["FISH", "TREE"])
+        second = await arbiter.check("FISH", 1, ["TREE", "FISH"])
+        await arbiter.close()
+
+        restarted = ClueArbiter(ClueVerdictCache(db_path), respond=model.respond)
+        third = await restarted.check("fish", 1, ["FISH", "TREE"])
+        stats = restarted.stats()
+        await restarted.close()
+        return first, second, third, arbiter.stats(), stats
+
+    first, second, third, before, after = asyncio.run(main())
+    assert first == second == third == (False, "clue is on the board")
+    assert model.calls == 1
+    assert before["hit_rate"] == 0.5
+    assert after["hit_rate"] == 1.0
+
+
+def test_concurrency_limit_and_shared_inflight_checks(tmp_path):
+    model = StubModel(delay=0.05)
+
+    async def main():
+        arbiter = ClueArbiter(
+            ClueVerdictCache(str(tmp_path / "arbiter.db")),
+            max_concurrency=2,
+            respond=model.respond,
+        )
+        clues = [f"clue{i}" for i in range(6)] + ["clue0"] * 4
+        verdicts = await asyncio.gather(
+            *[arbiter.check(clue, 1, ["FISH"]) for clue in clues]
+        )
+        await arbiter.close()
+        return verdicts
+
+    verdicts = asyncio.run(main())
+    assert all(valid for valid, _ in verdicts)
+    assert model.calls == 6
+    assert model.max_running == 2
+
+
+def test_deadline_accepts_the_clue_without_caching(tmp_path):
+    model = StubModel(delay=1.0)
+
+    async def main():
+        arbiter = ClueArbiter(
+            ClueVerdictCache(str(tmp_path / "arbiter.db")),
+            timeout=0.05,
+            respond=model.respond,
+        )
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticking = asyncio.ensure_future(ticker())
+        verdict = await arbiter.check("fish", 1, ["FISH"])
+        ticking.cancel()
+        cached = len(arbiter.cache)
+        stats = arbiter.stats()
+        await arbiter.close()
+        return verdict, cached, stats, ticks
+
+    verdict, cached, stats, ticks = asyncio.run(main())
+    assert verdict == (True, "Clue is valid")
+    assert cached == 0
+    assert stats["timeouts"] == 1
+    # The event loop kept running while the arbiter was busy.
+    assert ticks >= 3
+
+
+def test_cancelling_one_waiter_keeps_the_shared_call(tmp_path):
+    model = StubModel(delay=0.1)
+
+    async def main():
+        arbiter = ClueArbiter(
+            ClueVerdictCache(str(tmp_path / "arbiter.db")), respond=model.respond
+        )
+        first = asyncio.ensure_future(arbiter.check("fish", 1, ["FISH"]))
+        second = asyncio.ensure_future(arbiter.check("fish", 1, ["FISH"]))
+        await asyncio.sleep(0.02)
+        first.cancel()
+        verdict = await second
+
+        lonely = asyncio.ensure_future(arbiter.check("tree", 1, ["FISH"]))
+        await asyncio.sleep(0.02)
+        lonely.cancel()
+        await asyncio.sleep(0.01)
+        running = model.running
+        await arbiter.close()
+        return verdict, running
+
+    verdict, running = asyncio.run(main())
+    assert verdict == (False, "clue is on the board")
+    assert model.calls == 2
+    # With its only waiter gone, the second call was cancelled.
+    assert running == 0
+
+
+class StubBatchModel:
+    """Answers single and batched requests; flags clues found on their board."""
+
+    def __init__(self, drop_ids=(), garble=False):
+        self.drop_ids = set(drop_ids)
+        self.garble = garble
+        self.requests = []
+
+    @staticmethod
+    def _rule(case):
+        clue = case.split(",")[0].split("Clue: ")[1]
+        valid = clue.upper() not in case.split("Board Words: ")[1]
+        return {"valid": valid, "reasoning": f"{clue} is on the board"}
+
+    async def respond(self, messages):
+        await asyncio.sleep(0.01)
+        content = messages[-1]["content"]
+        self.requests.append(content)
+        if not content.startswith("Case "):
+            return json.dumps(self._rule(content))
+        if self.garble:
+            return "not json"
+        verdicts = []
+        for line in content.splitlines():
+            case_id = int(line.split(":")[0].removeprefix("Case "))
+            if case_id not in self.drop_ids:
+                verdicts.append({"id": case_id, **self._rule(line)})
+        return json.dumps({"verdicts": verdicts})
+
+
+def _batched_arbiter(tmp_path, model, **kwargs):
+    return ClueArbiter(
+        ClueVerdictCache(str(tmp_path / "arbiter.db")),
+        respond=model.respond,
+        batch_window=0.05,
+        **kwargs,
+    )
+
+
+CASES = [
+    ("fish", ["FISH", "TREE"]),
+    ("sea", ["FISH", "TREE"]),
+    ("tree", ["OAK", "TREE"]),
+    ("wood", ["OAK", "TREE"]),
+    ("oak", ["OAK"]),
+]
+
+
+def _check_all(arbiter):
+    async def main():
+        verdicts = await asyncio.gather(
+            *[arbiter.check(clue, 1, board) for clue, board in CASES]
+        )
+        await arbiter.close()
+        return verdicts
+
+    return asyncio.run(main())
+
+
+def test_batcher_routes_verdicts_back_to_each_check(tmp_path):
+    model = StubBatchModel()
+    arbiter = _batched_arbiter(tmp_path, model)
+    verdicts = _check_all(arbiter)
+    assert [valid for valid, _ in verdicts] == [False, True, False, True, False]
+    assert verdicts[2] == (False, "tree is on the board")
+    # The first check goes out alone; the rest arrive while it is in flight.
+    assert len(model.requests) == 2
+    assert arbiter.stats()["batched_cases"] == 4
+
+
+def test_batcher_splits_at_the_size_cap(tmp_path):
+    model = StubBatchModel()
+    arbiter = _batched_arbiter(tmp_path, model, max_batch=2)
+    verdicts = _check_all(arbiter)
+    assert [valid for valid, _ in verdicts] == [False, True, False, True, False]
+    # The first check alone, then two full batches.
+    assert len(model.requests) == 3
+    assert not model.requests[0].startswith("Case ")
+    assert all(request.startswith("Case ") for request in model.requests[1:])
+
+
+def test_batcher_falls_back_to_single_requests(tmp_path):
+    model = StubBatchModel(drop_ids={1, 3})
+    arbiter = _batched_arbiter(tmp_path, model)
+    verdicts = _check_all(arbiter)
+    assert [valid for valid, _ in verdicts] == [False, True, False, True, False]
+    assert len(model.requests) == 4
+    assert arbiter.stats()["batch_fallbacks"] == 2
+
+    garbled = StubBatchModel(garble=True)
+    arbiter = _batched_arbiter(tmp_path / "garbled", garbled)
+    verdicts = _check_all(arbiter)
+    assert [valid for valid, _ in verdicts] == [False, True, False, True, False]
+    assert len(garbled.requests) == 2 + len(CASES) - 1
+
+
+def test_batcher_sends_a_lone_check_at_once(tmp_path):
+    model = StubBatchModel()
+    arbiter = ClueArbiter(
+        ClueVerdictCache(str(tmp_path / "arbiter.db")),
+        respond=model.respond,
+        batch_window=5.0,
+    )
+
+    async def main():
+        started = time.perf_counter()
+        verdict = await arbiter.check("fish", 1, ["FISH", "TREE"])
+        await arbiter.close()
+        return verdict, time.perf_counter() - started
+
+    verdict, elapsed = asyncio.run(main())
+    assert verdict == (False, "fish is on the board")
+    assert elapsed < 1.0
+
+
+def test_cache_prune_drops_old_and_excess_verdicts(tmp_path):
+    cache = ClueVerdictCache(str(tmp_path / "arbiter.db"))
+    for index in range(6):
+        cache.put(f"key{index}", f"clue{index}", (True, "Clue is valid"))
+    now = time.time()
+    cache._conn.execute(
+        "UPDATE clue_verdicts SET created_at = ? WHERE key IN ('key0', 'key1')",
+        (now - 100,),
+    )
+    assert cache.prune(max_age=50, max_rows=10, now=now) == 2
+    assert cache.get("key0") is None and cache.get("key2") is not None
+    assert cache.prune(max_age=50, max_rows=3, now=now) == 1
+    assert len(cache) == 3
+    cache.close()
@@ -0,0 +1,87 @@
+import json
+import os
+
+from game.validator.clue_rules import ClueRuleEngine, Ruling, stem
+
+CORPUS = os.path.join(os.path.dirname(__file__), "clue_corpus.json")
+
+
+def _corpus():
+    with open(CORPUS) as f:
+        return json.load(f)
+
+
+def _rulings():
+    """Each corpus case with its ruling, on the case's own board if it has one."""
+    corpus = _corpus()
+    for case in corpus["cases"]:
+        board = case.get("board", corpus["board"])
+        yield case, ClueRuleEngine(board).check(case["clue"], board)
+
+
+def test_decided_rulings_agree_with_the_labelled_corpus():
+    main = [
+        (case, ruling, reason)
+        for case, (ruling, reason) in _rulings()
+        if "board" not in case
+    ]
+    decided = 0
+    for case, ruling, reason in main:
+        if ruling == Ruling.AMBIGUOUS:
+            continue
+        decided += 1
+        assert (ruling == Ruling.VALID) == case["valid"], (case, reason)
+    # Only genuinely unclear clues should need the arbiter.
+    assert decided / len(main) >= 0.75
+
+
+def test_mechanical_violations_are_never_escalated():
+    mechanical = ("board word", "superset", "substring", "plural", "form of")
+    for case, (ruling, reason) in _rulings():
+        if case["rule"].startswith(mechanical):
+            assert ruling == Ruling.INVALID, (case, reason)
+
+
+def test_valid_clues_are_never_ruled_invalid():
+    # Includes words that start, end or inflect like a board word without
+    # being built from it (penguin for PEN, news for NEW).
+    for case, (ruling, reason) in _rulings():
+        if case["valid"]:
+            assert ruling != Ruling.INVALID, (case, reason)
+
+
+def test_bare_substrings_are_left_to_a_judge():
+    pairs = [
+        ("pen", "OPEN"),
+        ("art", "PARTY"),
+        ("ice", "POLICE"),
+        ("hat", "CHAT"),
+        ("ear", "BEAR"),
+        ("ant", "PLANT"),
+        ("net", "PLANET"),
+        ("tea", "STEAM"),
+        ("arm", "CHARM"),
+        ("bus", "BUSH"),
+        ("ace", "SPACE"),
+        ("war", "WARD"),
+    ]
+    for clue, word in pairs:
+        ruling, reason = ClueRuleEngine([word]).check(clue, [word])
+        assert ruling == Ruling.AMBIGUOUS, (clue, word, reason)
+        ruling, reason = ClueRuleEngine([clue]).check(word, [clue])
+        assert ruling != Ruling.INVALID, (word, clue, reason)
+
+
+def test_revealed_words_no_longer_restrict_clues():
+    board = ["OCEAN", "TREE"]
+    engine = ClueRuleEngine(board)
+    assert engine.check("treehouse", board)[0] == Ruling.INVALID
+    assert engine.check("treehouse", ["OCEAN"])[0] == Ruling.VALID
+
+
+def test_stem():
+    assert stem("babies") == stem("baby")
+    assert stem("stopped") == stem("stop")
+    assert stem("hoping") == stem("hope")
+    assert stem("glasses") == stem("glass")
+    assert stem("glass") == "glass"
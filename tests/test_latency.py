@@ -0,0 +1,104 @@
+import asyncio
+import time
+
+from game.validator.latency import GameBudget, LatencyModel, adaptive_query
+
+
+class StubMiner:
+    """Answers after the next scripted delay.
+
+    None never answers and "fail" fails at once, like a broken pipe.
+    """
+
+    def __init__(self, delays):
+        self.delays = list(delays)
+        self.sent = []
+
+    async def send(self, timeout):
+        self.sent.append(timeout)
+        delay = self.delays.pop(0) if self.delays else 0.01
+        if delay == "fail":
+            return None
+        if delay is None or delay > timeout:
+            await asyncio.sleep(timeout)
+            return None
+        await asyncio.sleep(delay)
+        return f"response after {delay}"
+
+
+def _model(**kwargs):
+    kwargs.setdefault("min_timeout", 0.1)
+    kwargs.setdefault("max_timeout", 1.0)
+    return LatencyModel(**kwargs)
+
+
+def _warm(model, uid, seconds, count=10):
+    for _ in range(count):
+        model.record(uid, "hotkey", seconds)
+
+
+def test_timeout_follows_the_miner_p95():
+    model = _model()
+    assert model.timeout_for(1, "hotkey") == 1.0
+    _warm(model, 1, 0.1)
+    assert abs(model.timeout_for(1, "hotkey") - 0.2) < 1e-9
+    # A new hotkey on the uid starts over.
+    assert model.timeout_for(1, "other") == 1.0
+
+
+def test_slow_miner_gets_a_single_request():
+    model = _model()
+    _warm(model, 1, 0.05)
+    miner = StubMiner([None, 0.01])
+
+    response = asyncio.run(adaptive_query(miner.send, 1, "hotkey", model))
+    assert response is None
+    assert len(miner.sent) == 1
+    assert model.entries[1].failures == 1
+
+
+def test_missed_queries_raise_the_timeout():
+    model = _model()
+    _warm(model, 1, 0.05)
+    timeouts = [model.timeout_for(1, "hotkey")]
+    for _ in range(4):
+        model.record(1, "hotkey", timeouts[-1], ok=False)
+        timeouts.append(model.timeout_for(1, "hotkey"))
+    # Each miss counts as taking the whole timeout, so the next one is longer.
+    assert timeouts == sorted(timeouts)
+    assert timeouts[1] > timeouts[0]
+    assert timeouts[-1] == 1.0
+    assert model.entries[1].ewma == 0.05
+
+
+def test_fast_failures_are_retried():
+    model = _model()
+    miner = StubMiner(["fail", "fail", 0.01])
+
+    response = asyncio.run(adaptive_query(miner.send, 2, "hotkey", model))
+    assert response == "response after 0.01"
+    assert len(miner.sent) == 3
+
+    miner = StubMiner(["fail", "fail", "fail", 0.01])
+    assert asyncio.run(adaptive_query(miner.send, 2, "hotkey", model)) is None
+    assert len(miner.sent) == 3
+
+
+def test_budget_runs_out_without_touching_timeouts():
+    budget = GameBudget(0.05)
+    assert not budget.exhausted()
+    time.sleep(0.06)
+    assert budget.exhausted()
+    assert budget.remaining() < 0
+
+
+def test_model_persists_across_restarts(tmp_path):
+    path = str(tmp_path / "latency.json")
+    model = _model(path=path)
+    _warm(model, 4, 0.25)
+    model.save()
+
+    restored = _model(path=path)
+    restored.load()
+    assert restored.timeout_for(4, "hotkey") == model.timeout_for(4, "hotkey")
+    assert restored.entries[4].ewma == model.entries[4].ewma
@@ -0,0 +1,75 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+from game.validator import matchmaker as matchmaker_module
+from game.validator.matchmaker import Matchmaker
+
+
+class StubSelection:
+    """Picks the lowest free uids, like a selection pass where every miner answers."""
+
+    def __init__(self, n):
+        self.n = n
+        self.calls = []
+
+    async def __call__(self, validator, k, exclude=None):
+        exclude = set(exclude or [])
+        self.calls.append((k, exclude))
+        selected = [uid for uid in range(self.n) if uid not in exclude][:k]
+        return selected, [f"hk{uid}" for uid in selected]
+
+
+def _matchmaker(monkeypatch, n=16, **kwargs):
+    selection = StubSelection(n)
+    monkeypatch.setattr(matchmaker_module, "get_random_uids", selection)
+    validator = SimpleNamespace(
+        metagraph=SimpleNamespace(hotkeys=[f"hk{uid}" for uid in range(n)])
+    )
+    kwargs.setdefault("team_size", 4)
+    kwargs.setdefault("num_teams", 3)
+    return Matchmaker(validator, **kwargs), selection
+
+
+def test_concurrent_games_get_disjoint_teams(monkeypatch):
+    matchmaker, selection = _matchmaker(monkeypatch)
+
+    async def main():
+        return await asyncio.gather(*[matchmaker.acquire() for _ in range(3)])
+
+    leases = asyncio.run(main())
+    uids = [uid for lease in leases for uid in lease.uids]
+    assert len(uids) == len(set(uids)) == 12
+    # One selection pass prepared every team.
+    assert len(selection.calls) == 1
+
+    # A fourth game only gets miners nobody is playing with.
+    fourth = asyncio.run(matchmaker.acquire())
+    assert fourth.uids == [12, 13, 14, 15]
+    assert selection.calls[-1] == (4, set(uids))
+
+    # Once a game releases its team, those miners can be selected again.
+    matchmaker.release(leases[0])
+    fifth = asyncio.run(matchmaker.acquire())
+    assert fifth.uids == leases[0].uids
+    assert selection.calls[-1][1] == set(uids[4:]) | set(fourth.uids)
+
+
+def test_released_miners_can_play_again(monkeypatch):
+    matchmaker, selection = _matchmaker(monkeypatch, n=4, num_teams=1)
+    first = asyncio.run(matchmaker.acquire())
+    assert first.uids == [0, 1, 2, 3]
+    assert asyncio.run(matchmaker.acquire()) is None
+    matchmaker.release(first)
+    assert asyncio.run(matchmaker.acquire()).uids == [0, 1, 2, 3]
+
+
+def test_stale_prepared_teams_are_dropped(monkeypatch):
+    matchmaker, selection = _matchmaker(monkeypatch, team_ttl=0.05)
+    asyncio.run(matchmaker.acquire())
+    assert len(selection.calls) == 1
+    time.sleep(0.06)
+    # The two teams prepared alongside the first are stale now.
+    lease = asyncio.run(matchmaker.acquire())
+    assert len(selection.calls) == 2
+    assert lease is not None and time.time() - lease.created_at < 0.05
@@ -0,0 +1,62 @@
+import asyncio
+
+from game.miner.health import CircuitState, ProviderHealth, classify
+from game.miner.providers import ProviderError
+
+
+def test_consecutive_failures_open_the_circuit_at_once():
+    health = ProviderHealth("chutes:model", trip_after=3)
+    for second in range(3):
+        assert health.allows(now=second)
+        health.finished("error", now=second)
+    assert health.state is CircuitState.OPEN
+    assert not health.allows(now=5)
+
+
+def test_bad_responses_and_slow_answers_degrade_a_provider():
+    empty = ProviderHealth("chutes:model", min_calls=4, trip_after=100)
+    for outcome in ("ok", "empty", "ok", "truncated"):
+        empty.finished(outcome, 1.0, now=0)
+    assert empty.state is CircuitState.OPEN
+    assert empty.rates(now=0)["bad_response_rate"] == 0.5
+
+    slow = ProviderHealth("chutes:model", min_calls=4, slow_after=10.0)
+    for latency in (2.0, 3.0, 2.0, 15.0):
+        slow.finished("ok", latency, now=0)
+    assert slow.state is CircuitState.OPEN
+
+    old = ProviderHealth("chutes:model", window=60, min_calls=4)
+    for _ in range(3):
+        old.finished("timeout", now=0)
+        old.finished("ok", 1.0, now=0)
+    # Failures age out of the window.
+    assert old.rates(now=100)["calls"] == 0
+
+
+def test_half_open_trial_closes_or_reopens_for_longer():
+    health = ProviderHealth("chutes:model", trip_after=1, open_for=10)
+    health.finished("error", now=0)
+    assert not health.allows(now=9)
+    assert health.allows(now=10)
+    assert health.state is CircuitState.HALF_OPEN
+    health.started()
+    # Only one trial at a time.
+    assert not health.allows(now=10)
+    health.finished("timeout", now=11)
+    assert health.state is CircuitState.OPEN
+    assert health.open_until == 31
+
+    assert health.allows(now=31)
+    health.started()
+    health.finished(None, now=31)  # trial cancelled: slot freed, no verdict
+    assert health.allows(now=31)
+    health.started()
+    health.finished("ok", 2.0, now=32)
+    assert health.state is CircuitState.CLOSED
+    assert health.open_for == 10
+
+
+def test_classify_failed_calls():
+    assert classify(ProviderError("no choices", "empty")) == "empty"
+    assert classify(asyncio.TimeoutError()) == "timeout"
+    assert classify(RuntimeError("boom")) == "error"
@@ -0,0 +1,107 @@
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+
+from game.miner.providers import ChutesProvider, ProviderError, ProviderPool
+from game.miner.responses import clean_json, parse_completion
+
+
+class ChutesServer:
+    """Stand-in for the Chutes chat-completions API."""
+
+    def __init__(self, delay=0.05, content='{"clue": "SEA", "number": 2}'):
+        self.delay = delay
+        self.content = content
+        self.status = 200
+        self.running = 0
+        self.max_running = 0
+        self.peers = set()
+        self.warmed = 0
+
+    async def complete(self, request):
+        self.peers.add(request.transport.get_extra_info("peername"))
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        if self.status != 200:
+            return web.Response(text="overloaded", status=self.status)
+        choices = [{"message": {"content": self.content}}] if self.content else []
+        return web.json_response({"choices": choices})
+
+    async def models(self, request):
+        self.peers.add(request.transport.get_extra_info("peername"))
+        self.warmed += 1
+        return web.json_response({"data": []})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self.complete)
+        app.router.add_get("/v1/models", self.models)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/v1/chat/completions"
+
+
+MESSAGES = [{"role": "user", "content": "board"}]
+
+
+def test_requests_share_a_pooled_client_under_the_concurrency_limit():
+    server = ChutesServer()
+
+    async def main():
+        provider = ChutesProvider("key", url=await server.start(), max_concurrency=3)
+        pool = ProviderPool({"chutes": provider}, default="chutes")
+        await pool.warm_up()
+        texts = await asyncio.gather(
+            *[pool.get().complete(MESSAGES, 0.5) for _ in range(9)]
+        )
+        await pool.close()
+        await server.runner.cleanup()
+        return texts
+
+    texts = asyncio.run(main())
+    assert texts == ['{"clue": "SEA", "number": 2}'] * 9
+    assert server.warmed == 1
+    assert server.max_running == 3
+    # Nine requests over at most three keep-alive connections.
+    assert len(server.peers) <= 3
+
+
+def test_failed_and_empty_responses_raise():
+    server = ChutesServer(delay=0)
+
+    async def main():
+        provider = ChutesProvider("key", url=await server.start())
+        errors = []
+        for status, content in ((503, "{}"), (200, ""), (200, "  ")):
+            server.status, server.content = status, content
+            with pytest.raises(ProviderError) as err:
+                await provider.complete(MESSAGES, 0.5)
+            errors.append(str(err.value))
+        await provider.close()
+        await server.runner.cleanup()
+        return errors
+
+    errors = asyncio.run(main())
+    assert "503" in errors[0]
+    assert "no choices" in errors[1]
+    assert "empty response" in errors[2]
+
+
+def test_clean_json_strips_fences_and_prose():
+    fenced = '```json\n{"clue": "SEA", "number": 2}\n```'
+    assert json.loads(clean_json(fenced)) == {"clue": "SEA", "number": 2}
+    prose = 'Here you go: {"guesses": ["FISH"], "note": {"a": 1}} hope it helps'
+    assert parse_completion(prose, "operative")["guesses"] == ["FISH"]
+    with pytest.raises(ValueError):
+        parse_completion('{"clue": "SEA"}', "spymaster")
+    with pytest.raises(ValueError):
+        parse_completion("no json here", "operative")
@@ -0,0 +1,112 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+from game.miner.retry import Deadline, RetryEngine
+
+
+class Script:
+    """Attempts that fail, hang or answer in a scripted order."""
+
+    def __init__(self, steps):
+        self.steps = list(steps)
+        self.calls = []
+
+    async def __call__(self, number, seconds_left):
+        self.calls.append((number, seconds_left))
+        delay, result = self.steps.pop(0)
+        await asyncio.sleep(delay)
+        if result is None:
+            raise RuntimeError("provider error")
+        return result
+
+
+def _engine(**kwargs):
+    kwargs.setdefault("backoff", 0.02)
+    kwargs.setdefault("min_attempt", 0.05)
+    return RetryEngine(**kwargs)
+
+
+def test_deadline_follows_the_validator_send_time():
+    sent = time.time() - 4
+    synapse = SimpleNamespace(timeout=12.0, dendrite=SimpleNamespace(nonce=sent * 1e9))
+    assert abs(Deadline.from_synapse(synapse, margin=1.0).remaining() - 7.0) < 0.1
+    # A nonce from a skewed clock falls back to the arrival time.
+    skewed = SimpleNamespace(timeout=12.0, dendrite=SimpleNamespace(nonce=1e9))
+    assert abs(Deadline.from_synapse(skewed, margin=1.0).remaining() - 11.0) < 0.1
+
+
+def test_failed_attempts_back_off_without_blocking_the_loop():
+    engine = _engine()
+    script = Script([(0.01, None), (0.01, None), (0.01, "answer")])
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticking = asyncio.ensure_future(ticker())
+        result = await engine.run(script, Deadline(5.0))
+        ticking.cancel()
+        return result, ticks
+
+    result, ticks = asyncio.run(main())
+    assert result == "answer"
+    assert [number for number, _ in script.calls] == [0, 1, 2]
+    assert ticks >= 5
+    stats = engine.stats()
+    assert stats["outcomes"] == {"error": 2, "ok": 1}
+    assert len(stats["attempt_share"]) == 3
+
+
+def test_slow_attempt_is_cut_off_at_the_deadline():
+    engine = _engine()
+    script = Script([(5.0, "too late")])
+
+    async def main():
+        started = time.perf_counter()
+        result = await engine.run(script, Deadline(0.2))
+        return result, time.perf_counter() - started
+
+    result, elapsed = asyncio.run(main())
+    assert result is None
+    assert elapsed < 0.4
+    assert engine.fallbacks == 1
+    assert engine.stats()["budget_used"] > 0.9
+
+
+def test_attempt_that_cannot_finish_is_not_started():
+    engine = _engine(backoff=0.1)
+    engine.expected = 1.0  # attempts usually take a second
+    script = Script([(0.01, None), (0.01, "answer")])
+
+    async def main():
+        started = time.perf_counter()
+        result = await engine.run(script, Deadline(1.05))
+        return result, time.perf_counter() - started
+
+    result, elapsed = asyncio.run(main())
+    assert result is None
+    assert len(script.calls) == 1
+    assert elapsed < 0.2
+    assert engine.outcomes["skipped"] == 1
+
+
+def test_one_slow_answer_does_not_keep_later_requests_from_retrying():
+    engine = _engine(backoff=0.01, alpha=0.5)
+    assert asyncio.run(engine.run(Script([(0.3, "slow")]), Deadline(5.0))) == "slow"
+    assert engine.expected >= 0.3
+
+    # Shorter deadlines than that answer took still get their first attempt.
+    results = []
+    for _ in range(6):
+        script = Script([(0.01, None), (0.01, "answer")])
+        results.append(asyncio.run(engine.run(script, Deadline(0.2))))
+    assert results[0] is None
+    # Skipped retries pulled the estimate back until retries fit again.
+    assert results[-1] == "answer"
+    assert engine.expected < 0.2
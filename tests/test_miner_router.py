@@ -0,0 +1,144 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from game.miner.providers import ChatProvider, ProviderError, ProviderPool
+from game.miner.router import HedgedRouter
+from game.miner.responses import parse_completion
+
+
+class StubProvider(ChatProvider):
+    """Answers each call after the next scripted delay."""
+
+    def __init__(self, name, steps):
+        super().__init__(name)
+        self.name = name
+        self.steps = list(steps)
+        self.calls = 0
+        self.cancelled = 0
+
+    async def _complete(self, messages, temperature, timeout):
+        self.calls += 1
+        delay, text = self.steps.pop(0) if self.steps else (0.01, "{}")
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return text
+
+
+def _answer(clue):
+    return json.dumps({"clue": clue, "number": 1})
+
+
+def accept(text):
+    parsed = parse_completion(text, "spymaster")
+    if parsed["clue"] == "FISH":
+        raise ValueError("clue is on the board")
+    return parsed["clue"]
+
+
+def _route(router, timeout=2.0):
+    async def main():
+        started = time.perf_counter()
+        result = await router.complete([], 0.5, timeout, accept)
+        elapsed = time.perf_counter() - started
+        await asyncio.sleep(0)  # let cancellations land
+        return result, elapsed
+
+    return asyncio.run(main())
+
+
+def _router(primary, backup, **kwargs):
+    pool = ProviderPool({"primary": primary, "backup": backup}, default="primary")
+    kwargs.setdefault("hedge_after", 0.05)
+    return HedgedRouter(pool, **kwargs)
+
+
+def test_slow_primary_is_raced_and_the_loser_cancelled():
+    primary = StubProvider("primary", [(1.0, _answer("SEA"))])
+    backup = StubProvider("backup", [(0.02, _answer("OCEAN"))])
+    router = _router(primary, backup)
+    result, elapsed = _route(router)
+    assert result == "OCEAN"
+    assert elapsed < 0.3
+    assert primary.cancelled == 1
+    assert router.stats()["wins"] == {"backup:backup": 1}
+
+
+def test_fast_primary_is_not_hedged():
+    primary = StubProvider("primary", [(0.01, _answer("SEA"))])
+    backup = StubProvider("backup", [])
+    router = _router(primary, backup)
+    assert _route(router)[0] == "SEA"
+    assert backup.calls == 0
+    assert router.hedges == 0
+
+
+def test_rejected_answer_brings_in_the_backup_at_once():
+    primary = StubProvider("primary", [(0.01, _answer("FISH"))])
+    backup = StubProvider("backup", [(0.01, _answer("SEA"))])
+    router = _router(primary, backup, hedge_after=5.0)
+    result, elapsed = _route(router)
+    assert result == "SEA"
+    assert elapsed < 0.5
+    # A fallback after a rejected answer is not a hedge.
+    assert router.hedges == 0
+
+    primary.steps = [(0.01, "not json")]
+    backup.steps = [(0.01, _answer("FISH"))]
+    with pytest.raises(ProviderError):
+        _route(router)
+
+
+def test_hedges_are_capped_by_the_budget():
+    primary = StubProvider("primary", [(0.1, _answer("SEA"))] * 10)
+    backup = StubProvider("backup", [(0.5, _answer("OCEAN"))] * 10)
+    router = _router(primary, backup, max_hedge_ratio=0.3, min_samples=100)
+    results = [_route(router)[0] for _ in range(10)]
+    assert results == ["SEA"] * 10
+    assert router.hedges == 3
+    assert backup.calls == 3
+
+
+def test_router_steers_around_an_open_circuit():
+    answer = _answer("SEA")
+    primary = StubProvider("primary", [])
+    backup = StubProvider("backup", [(0.01, answer)] * 3)
+    pool = ProviderPool({"primary": primary, "backup": backup}, default="primary")
+    router = HedgedRouter(pool, health_options=dict(open_for=60))
+    for _ in range(3):
+        router.health[primary.key].finished("error")
+
+    async def main():
+        return [await router.complete([], 0.5, 1.0, str) for _ in range(3)]
+
+    assert asyncio.run(main()) == [answer] * 3
+    assert primary.calls == 0
+    assert router.stats()["health"]["primary:primary"]["state"] == "open"
+
+
+def test_backup_whose_circuit_opened_mid_call_is_skipped():
+    primary = StubProvider("primary", [(0.05, "not json")])
+    backup = StubProvider("backup", [])
+    router = _router(primary, backup, hedge_after=5.0)
+
+    async def trip_backup():
+        await asyncio.sleep(0.01)
+        for _ in range(3):
+            router.health[backup.key].finished("error")
+
+    async def main():
+        tripping = asyncio.ensure_future(trip_backup())
+        try:
+            with pytest.raises(ProviderError, match="circuit open"):
+                await router.complete([], 0.5, 1.0, accept)
+        finally:
+            await tripping
+
+    asyncio.run(main())
+    assert primary.calls == 1
+    assert backup.calls == 0
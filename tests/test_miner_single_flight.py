@@ -0,0 +1,98 @@
+import asyncio
+from types import SimpleNamespace
+
+from game.miner.single_flight import SingleFlightCache, turn_digest
+
+
+def _card(word, color="red", revealed=False):
+    return SimpleNamespace(word=word, color=color, is_revealed=revealed)
+
+
+def _turn(cards, clue=None, number=None, role="operative"):
+    return SimpleNamespace(
+        your_role=role,
+        your_team="red",
+        cards=cards,
+        your_clue=clue,
+        your_number=number,
+    )
+
+
+class SlowCall:
+    def __init__(self, result="answer", delay=0.05):
+        self.result = result
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.result
+
+
+def test_digest_is_canonical_over_board_order_and_case():
+    board = [_card("FISH"), _card("TREE", "blue", True)]
+    same = [_card("tree", "BLUE", True), _card("fish")]
+    assert turn_digest(_turn(board, "sea", 2)) == turn_digest(_turn(same, "SEA", 2))
+    assert turn_digest(_turn(board, "sea", 2)) != turn_digest(_turn(board, "sea", 3))
+    revealed = [_card("FISH", revealed=True), _card("TREE", "blue", True)]
+    assert turn_digest(_turn(board, "sea", 2)) != turn_digest(_turn(revealed, "sea", 2))
+
+
+def test_concurrent_duplicates_share_one_call():
+    cache = SingleFlightCache(ttl=10)
+    call = SlowCall()
+
+    async def main():
+        results = await asyncio.gather(
+            *[cache.get_or_run("turn", call) for _ in range(5)]
+        )
+        again = await cache.get_or_run("turn", call)
+        return results, again
+
+    results, again = asyncio.run(main())
+    assert results == ["answer"] * 5
+    assert again == "answer"
+    assert call.calls == 1
+    assert cache.stats()["coalesced"] == 4
+    assert cache.stats()["hits"] == 1
+
+
+def test_abandoned_call_still_fills_the_cache():
+    cache = SingleFlightCache(ttl=10)
+    call = SlowCall(delay=0.1)
+
+    async def main():
+        first = asyncio.ensure_future(cache.get_or_run("turn", call))
+        await asyncio.sleep(0.02)
+        first.cancel()  # the validator gave up on this copy
+        await asyncio.sleep(0.15)
+        return await cache.get_or_run("turn", call)
+
+    assert asyncio.run(main()) == "answer"
+    assert call.calls == 1
+
+
+def test_results_expire_and_are_evicted():
+    cache = SingleFlightCache(ttl=10, max_entries=2)
+    cache.put("a", 1, now=0)
+    cache.put("b", 2, now=0)
+    assert cache.get("a", now=5) == 1  # "a" is now the most recent
+    cache.put("c", 3, now=5)
+    assert cache.get("b", now=5) is None
+    assert cache.get("a", now=9) == 1
+    assert cache.get("a", now=11) is None
+    assert len(cache) == 1
+
+
+def test_fallback_results_are_not_kept():
+    cache = SingleFlightCache(ttl=10)
+    call = SlowCall(result=("fallback", False), delay=0)
+
+    async def main():
+        for _ in range(2):
+            await cache.get_or_run("turn", call, keep=lambda result: result[1])
+
+    asyncio.run(main())
+    assert call.calls == 2
+    assert len(cache) == 0
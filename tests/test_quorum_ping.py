@@ -0,0 +1,61 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import game
+from game.api.get_query_axons import ping_until_quorum
+
+
+class StubDendrite:
+    """Answers each uid's ping after its scripted delay and counts cancellations."""
+
+    def __init__(self, delays, versions=None):
+        self.delays = delays
+        self.versions = versions or {}
+        self.cancelled = 0
+
+    async def forward(self, axons, synapse, timeout, deserialize):
+        uid = axons[0].uid
+        try:
+            await asyncio.sleep(self.delays[uid])
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        version = self.versions.get(uid, game.__version__)
+        return [SimpleNamespace(is_available=True, version=version)]
+
+
+def _metagraph(n):
+    return SimpleNamespace(axons=[SimpleNamespace(uid=uid) for uid in range(n)])
+
+
+def test_returns_once_the_quorum_answers():
+    delays = {0: 5.0, 1: 0.02, 2: 5.0, 3: 0.01, 4: 0.03}
+    dendrite = StubDendrite(delays, versions={3: "0.0.1"})
+
+    async def main():
+        started = time.perf_counter()
+        result = await ping_until_quorum(
+            dendrite, _metagraph(5), [4, 0, 1, 2, 3], quorum=2, timeout=10
+        )
+        await asyncio.sleep(0)  # let cancellations land
+        return result, time.perf_counter() - started
+
+    (successful, answered), elapsed = asyncio.run(main())
+    assert elapsed < 1.0
+    # Uid 3 answered first but on the wrong version, so it does not count.
+    assert answered == {1, 3, 4}
+    # Healthy uids come back in the caller's priority order.
+    assert successful == [4, 1]
+    assert dendrite.cancelled == 2
+
+
+def test_short_of_quorum_waits_for_every_ping():
+    dendrite = StubDendrite({0: 0.01, 1: 0.02, 2: 0.03})
+
+    successful, answered = asyncio.run(
+        ping_until_quorum(dendrite, _metagraph(3), [2, 1, 0], quorum=5, timeout=10)
+    )
+    assert successful == [2, 1, 0]
+    assert answered == {0, 1, 2}
+    assert dendrite.cancelled == 0
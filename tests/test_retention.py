@@ -0,0 +1,112 @@
+import sqlite3
+import time
+from types import SimpleNamespace
+
+from game.validator.clue_arbiter import ClueVerdictCache
+from game.validator.retention import RetentionService
+from game.validator.score_store import ScoreStore
+
+WINDOW = 86400
+
+
+def _game(room_id, ended_at):
+    return {
+        "room_id": room_id,
+        "validator": "val",
+        "rs": "hk0",
+        "ro": "hk1",
+        "bs": "hk2",
+        "bo": "hk3",
+        "started_at": ended_at - 600,
+        "ended_at": ended_at,
+        "score_rs": 1.0,
+        "score_ro": 0.5,
+        "score_bs": -0.5,
+        "score_bo": 0.0,
+    }
+
+
+def test_compact_keeps_the_scoring_window(tmp_path):
+    now = int(time.time())
+    store = ScoreStore(
+        str(tmp_path / "scores.db"), backend_url="", window_seconds=WINDOW
+    )
+    store.init(["hk0", "hk1", "hk2", "hk3"])
+    ages = list(range(0, 6 * WINDOW, 1800))
+    store._upsert_scores_all([_game(f"room{age}", now - age) for age in reversed(ages)])
+    with store._transaction() as cur:
+        cur.executemany(
+            "INSERT INTO selection_events(hotkey, uid, ts) VALUES(?, ?, ?)",
+            [("hk0", 0, now - age) for age in ages],
+        )
+    since_ts = now - WINDOW
+    scores = store._window_scores_by_hotkey_sql(since_ts)
+    counts = store.selection_counts_since(since_ts)
+    games = store.games_in_window(since_ts)
+
+    # Asking for less than one window is clamped to the window.
+    stats = store.compact(retain_seconds=0)
+
+    assert stats["scores_all"] > 0 and stats["selection_events"] > 0
+    assert store._window_scores_by_hotkey_sql(since_ts) == scores
+    assert store.window_scores_by_hotkey(since_ts) == scores
+    assert store.selection_counts_since(since_ts) == counts
+    assert store.games_in_window(since_ts) == games
+    oldest = store.conn.execute("SELECT MIN(ended_at) FROM scores_all").fetchone()[0]
+    assert oldest >= now - 2 * WINDOW
+    store.close()
+
+
+def test_compact_keeps_the_sync_cursor(tmp_path):
+    now = int(time.time())
+    store = ScoreStore(
+        str(tmp_path / "scores.db"), backend_url="", window_seconds=WINDOW
+    )
+    store.init([])
+    store._upsert_scores_all([_game("old", now - 10 * WINDOW)])
+    cursor = store.max_scores_all_id()
+
+    store.compact(retain_seconds=WINDOW)
+
+    assert store.max_scores_all_id() == cursor
+    store.close()
+
+
+def test_existing_database_is_switched_to_incremental_vacuum(tmp_path):
+    path = str(tmp_path / "scores.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE legacy (id INTEGER PRIMARY KEY, payload TEXT)")
+    conn.executemany(
+        "INSERT INTO legacy(payload) VALUES(?)", [("x" * 500,) for _ in range(100)]
+    )
+    conn.commit()
+    assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+    conn.close()
+
+    store = ScoreStore(path, backend_url="")
+    store.init(["hk0"])
+    assert store.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    assert store.conn.execute("SELECT COUNT(*) FROM legacy").fetchone()[0] == 100
+    store.close()
+
+
+def test_retention_prunes_the_verdict_cache(tmp_path):
+    store = ScoreStore(
+        str(tmp_path / "scores.db"), backend_url="", window_seconds=WINDOW
+    )
+    store.init([])
+    cache = ClueVerdictCache(str(tmp_path / "arbiter.db"))
+    for index in range(5):
+        cache.put(f"key{index}", f"clue{index}", (True, "Clue is valid"))
+    validator = SimpleNamespace(
+        score_store=store,
+        scoring_window_seconds=WINDOW,
+        clue_arbiter=SimpleNamespace(cache=cache),
+    )
+
+    stats = RetentionService(validator, verdict_max_rows=2).compact_once()
+
+    assert stats["clue_verdicts"] == 3
+    assert len(cache) == 2
+    cache.close()
+    store.close()
@@ -0,0 +1,177 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+from aiohttp import web
+
+from game.validator.backend_client import BackendClient
+from game.validator.room_manager import RoomManager
+
+
+class RoomsServer:
+    """Stand-in for the rooms API with a configurable create latency."""
+
+    def __init__(self, create_delay=0.0):
+        self.create_delay = create_delay
+        self.failures_left = 0
+        self.created = 0
+        self.deleted = []
+
+    async def create(self, request):
+        await asyncio.sleep(self.create_delay)
+        if self.failures_left:
+            self.failures_left -= 1
+            return web.json_response({}, status=503)
+        self.created += 1
+        return web.json_response({"data": {"id": f"room{self.created}"}})
+
+    async def delete(self, request):
+        self.deleted.append(request.match_info["room_id"])
+        return web.json_response({})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/api/v1/rooms/create", self.create)
+        app.router.add_delete("/api/v1/rooms/{room_id}", self.delete)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        return f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+
+class FakeStore:
+    def __init__(self):
+        self.unsynced = set()
+
+    async def pending(self):
+        return [{"room_id": room_id} for room_id in self.unsynced]
+
+
+class FakePublisher:
+    def __init__(self):
+        self.busy = set()
+
+    async def has_pending(self, room_id):
+        return room_id in self.busy
+
+
+def _validator(base):
+    return SimpleNamespace(
+        backend_base=base,
+        backend=BackendClient(base, retries=0),
+        wallet=SimpleNamespace(hotkey=SimpleNamespace(ss58_address="validator")),
+        async_store=FakeStore(),
+        room_publisher=FakePublisher(),
+        should_exit=False,
+    )
+
+
+def test_acquire_uses_a_pre_provisioned_room():
+    async def main():
+        server = RoomsServer(create_delay=0.2)
+        validator = _validator(await server.start())
+        manager = RoomManager(validator, pool_size=2, retry_delay=0.01)
+        runner = asyncio.ensure_future(manager.run())
+        try:
+            while manager.ready_count < 2:
+                await asyncio.sleep(0.01)
+            started = time.perf_counter()
+            room_id, game_state = await manager.acquire(["participant"])
+            elapsed = time.perf_counter() - started
+        finally:
+            validator.should_exit = True
+            runner.cancel()
+            await validator.backend.close()
+            await server.runner.cleanup()
+        return manager, room_id, game_state, elapsed
+
+    manager, room_id, game_state, elapsed = asyncio.run(main())
+    assert room_id == "room1"
+    assert game_state.participants == ["participant"]
+    assert elapsed < 0.05
+    assert manager.pool_misses == 0
+
+
+def test_provisioning_retries_failed_creates():
+    async def main():
+        server = RoomsServer()
+        server.failures_left = 2
+        validator = _validator(await server.start())
+        manager = RoomManager(validator, pool_size=1, retry_delay=0.01)
+        runner = asyncio.ensure_future(manager.run())
+        try:
+            await asyncio.wait_for(_until(lambda: manager.ready_count == 1), 5)
+        finally:
+            validator.should_exit = True
+            runner.cancel()
+            await validator.backend.close()
+            await server.runner.cleanup()
+        return server
+
+    server = asyncio.run(main())
+    assert server.failures_left == 0
+    assert server.created == 1
+
+
+def test_cleanup_skips_rooms_with_pending_work():
+    async def main():
+        server = RoomsServer()
+        validator = _validator(await server.start())
+        manager = RoomManager(validator, room_ttl=60, cleanup_batch=2)
+        try:
+            for room_id in ("a", "b", "c", "d", "e"):
+                manager.release(room_id)
+            validator.async_store.unsynced.add("b")
+            validator.room_publisher.busy.add("c")
+            now = time.time()
+            assert await manager.cleanup_once(now=now) == 0  # nothing expired yet
+            first = await manager.cleanup_once(now=now + 61)
+            deleted_first = list(server.deleted)
+            validator.async_store.unsynced.clear()
+            validator.room_publisher.busy.clear()
+            second = await manager.cleanup_once(now=now + 61)
+            third = await manager.cleanup_once(now=now + 61)
+        finally:
+            await validator.backend.close()
+            await server.runner.cleanup()
+        return server, (first, second, third), deleted_first
+
+    server, counts, deleted_first = asyncio.run(main())
+    assert counts == (2, 2, 1)
+    assert sorted(deleted_first) == ["a", "d"]
+    assert sorted(server.deleted) == ["a", "b", "c", "d", "e"]
+
+
+def test_unused_ready_rooms_expire_and_are_deleted_at_shutdown():
+    async def main():
+        server = RoomsServer()
+        validator = _validator(await server.start())
+        manager = RoomManager(
+            validator, pool_size=2, retry_delay=0.01, room_ttl=60, ready_ttl=120
+        )
+        runner = asyncio.ensure_future(manager.run())
+        try:
+            await asyncio.wait_for(_until(lambda: manager.ready_count == 2), 5)
+            now = time.time()
+            assert await manager.cleanup_once(now=now + 60) == 0
+            # Both waited past ready_ttl: deleted in the batch pass and replaced.
+            assert await manager.cleanup_once(now=now + 121) == 2
+            await asyncio.wait_for(_until(lambda: manager.ready_count == 2), 5)
+            closed = await manager.close()
+        finally:
+            validator.should_exit = True
+            runner.cancel()
+            await validator.backend.close()
+            await server.runner.cleanup()
+        return manager, server, closed
+
+    manager, server, closed = asyncio.run(main())
+    assert closed == 2
+    assert manager.ready_count == 0
+    assert sorted(server.deleted) == ["room1", "room2", "room3", "room4"]
+
+
+async def _until(predicate):
+    while not predicate():
+        await asyncio.sleep(0.01)
@@ -0,0 +1,133 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+from game.utils.game import GameState, TeamColor
+from game.validator.room_publisher import RoomOutbox, RoomPublisher
+from game.validator.room_state import RoomStateTracker
+
+
+class FakeBackend:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.up = True
+        self.received = []
+
+    async def send(self, validator, room_id, payload):
+        await asyncio.sleep(self.delay)
+        if not self.up:
+            return False
+        self.received.append((room_id, payload["remainingRed"]))
+        return True
+
+
+def _publisher(tmp_path, backend):
+    validator = SimpleNamespace(
+        wallet=SimpleNamespace(hotkey=SimpleNamespace(ss58_address="validator")),
+        room_states=RoomStateTracker(),
+        should_exit=False,
+    )
+    outbox = RoomOutbox(str(tmp_path / "room_outbox.db"))
+    return RoomPublisher(validator, outbox, send=backend.send), outbox
+
+
+def test_publish_does_not_block_and_coalesces(tmp_path):
+    backend = FakeBackend(delay=0.2)
+    publisher, outbox = _publisher(tmp_path, backend)
+    game_state = GameState(participants=[])
+
+    async def main():
+        started = time.perf_counter()
+        for remaining in range(9, 0, -1):
+            game_state.remainingRed = remaining
+            publisher.publish("room", game_state)
+            if remaining == 9:
+                await asyncio.sleep(0)  # let the first send start
+        elapsed = time.perf_counter() - started
+        await publisher.flush()
+        return elapsed
+
+    assert asyncio.run(main()) < 0.1
+    # The first snapshot was in flight; the other eight collapsed into the newest.
+    assert backend.received == [("room", 9), ("room", 1)]
+    assert publisher.coalesced == 7
+    assert len(outbox) == 0
+    outbox.close()
+
+
+def test_failed_updates_are_kept_and_replayed(tmp_path):
+    backend = FakeBackend()
+    publisher, outbox = _publisher(tmp_path, backend)
+    game_state = GameState(participants=[])
+
+    async def main():
+        backend.up = False
+        for remaining in (8, 7):
+            game_state.remainingRed = remaining
+            publisher.publish("room", game_state)
+            await publisher.flush()
+        game_state.gameWinner = TeamColor.RED
+        publisher.finish("room")
+        assert len(outbox) == 1
+        assert await publisher.replay_once() == 0
+
+        backend.up = True
+        return await publisher.replay_once()
+
+    assert asyncio.run(main()) == 1
+    assert backend.received == [("room", 7)]
+    assert len(outbox) == 0
+    outbox.close()
+
+
+def test_outbox_survives_restart(tmp_path):
+    outbox = RoomOutbox(str(tmp_path / "room_outbox.db"))
+    outbox.put("room", {"remainingRed": 3})
+    outbox.close()
+
+    reopened = RoomOutbox(str(tmp_path / "room_outbox.db"))
+    [(room_id, payload, _)] = reopened.due(10)
+    assert (room_id, payload) == ("room", {"remainingRed": 3})
+    reopened.close()
+
+
+def test_replay_never_lands_after_a_newer_state(tmp_path):
+    earlier = RoomOutbox(str(tmp_path / "room_outbox.db"))
+    earlier.put("room", {"remainingRed": 5})
+    earlier.close()
+    backend = FakeBackend(delay=0.05)
+    publisher, outbox = _publisher(tmp_path, backend)
+    game_state = GameState(participants=[])
+
+    async def main():
+        replaying = asyncio.ensure_future(publisher.replay_once())
+        await asyncio.sleep(0.01)  # the replay is in flight
+        game_state.remainingRed = 4
+        publisher.publish("room", game_state)
+        delivered = await replaying
+        await publisher.flush()
+        return delivered
+
+    assert asyncio.run(main()) == 1
+    assert backend.received == [("room", 5), ("room", 4)]
+    assert len(outbox) == 0
+    outbox.close()
+
+
+def test_delivered_turns_leave_an_empty_outbox_alone(tmp_path, monkeypatch):
+    backend = FakeBackend()
+    publisher, outbox = _publisher(tmp_path, backend)
+    removed = []
+    monkeypatch.setattr(outbox, "remove", lambda *args: removed.append(args))
+    game_state = GameState(participants=[])
+
+    async def main():
+        for remaining in (3, 2, 1):
+            game_state.remainingRed = remaining
+            publisher.publish("room", game_state)
+            await publisher.flush()
+
+    asyncio.run(main())
+    assert [count for _, count in backend.received] == [3, 2, 1]
+    assert removed == []
+    outbox.close()
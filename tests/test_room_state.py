@@ -0,0 +1,144 @@
+import asyncio
+import json
+import os
+from types import SimpleNamespace
+
+from aiohttp import web
+
+os.environ.setdefault("OPENAI_KEY", "test")
+
+from game.utils.game import ChatMessage, Clue, GameState, Role, TeamColor
+from game.validator.backend_client import BackendClient
+from game.validator.room_state import (
+    RoomStateTracker,
+    apply_room_delta,
+    room_payload,
+    send_room_update,
+)
+
+META_KEYS = ("validatorKey", "version", "baseVersion")
+
+
+class RoomServer:
+    """Stand-in for the rooms API that understands full and delta updates."""
+
+    def __init__(self):
+        self.rooms = {}
+        self.versions = {}
+        self.bytes_received = 0
+        self.rejected = 0
+
+    async def full(self, request):
+        body = await request.read()
+        self.bytes_received += len(body)
+        payload = json.loads(body)
+        room_id = request.match_info["room_id"]
+        self.versions[room_id] = payload.get("version")
+        self.rooms[room_id] = {k: v for k, v in payload.items() if k not in META_KEYS}
+        return web.json_response({})
+
+    async def delta(self, request):
+        body = await request.read()
+        self.bytes_received += len(body)
+        delta = json.loads(body)
+        room_id = request.match_info["room_id"]
+        if self.versions.get(room_id) != delta["baseVersion"]:
+            self.rejected += 1
+            return web.json_response({}, status=409)
+        self.rooms[room_id] = apply_room_delta(self.rooms[room_id], delta)
+        self.versions[room_id] = delta["version"]
+        return web.json_response({})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_patch("/api/v1/rooms/{room_id}", self.full)
+        app.router.add_patch("/api/v1/rooms/{room_id}/delta", self.delta)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        return f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+
+def _validator(base, delta_updates):
+    return SimpleNamespace(
+        backend_base=base,
+        backend=BackendClient(base),
+        wallet=SimpleNamespace(hotkey=SimpleNamespace(ss58_address="validator")),
+        config=SimpleNamespace(
+            neuron=SimpleNamespace(room_delta_updates=delta_updates)
+        ),
+        room_states=RoomStateTracker(),
+    )
+
+
+def _turns(game_state):
+    """Mutates the game state the way forward() does and yields after each turn."""
+    for turn in range(12):
+        team = game_state.currentTeam
+        if game_state.currentRole == Role.SPYMASTER:
+            game_state.currentClue = Clue(clueText=f"clue{turn}", number=2)
+            game_state.chatHistory.append(
+                ChatMessage(
+                    sender=Role.SPYMASTER,
+                    message=f"clue{turn} 2",
+                    team=team,
+                    clueText=f"clue{turn}",
+                    number=2,
+                    reasoning="a long reasoning string " * 20,
+                )
+            )
+            game_state.currentRole = Role.OPERATIVE
+        else:
+            card = game_state.cards[turn]
+            card.is_revealed = True
+            card.was_recently_revealed = True
+            game_state.currentGuesses = [card.word]
+            game_state.chatHistory.append(
+                ChatMessage(
+                    sender=Role.OPERATIVE,
+                    message=card.word,
+                    team=team,
+                    guesses=[card.word],
+                    reasoning="more reasoning " * 20,
+                )
+            )
+            game_state.previousTeam, game_state.previousRole = team, Role.OPERATIVE
+            game_state.currentRole = Role.SPYMASTER
+            game_state.currentTeam = (
+                TeamColor.BLUE if team == TeamColor.RED else TeamColor.RED
+            )
+        if turn == 11:
+            game_state.gameWinner = TeamColor.RED
+        yield turn
+
+
+async def _publish(validator, game_state, room_id):
+    payload = room_payload(validator.wallet.hotkey.ss58_address, game_state)
+    await send_room_update(validator, room_id, payload)
+
+
+def test_delta_and_full_updates_produce_the_same_room():
+    async def main():
+        delta_server, full_server = RoomServer(), RoomServer()
+        delta_validator = _validator(await delta_server.start(), True)
+        full_validator = _validator(await full_server.start(), False)
+        game_state = GameState(participants=[])
+        try:
+            for turn in _turns(game_state):
+                await _publish(delta_validator, game_state, "room")
+                await _publish(full_validator, game_state, "room")
+                if turn == 6:
+                    # The backend lost our version; the next delta must resync.
+                    delta_server.versions["room"] = None
+                assert delta_server.rooms["room"] == full_server.rooms["room"]
+        finally:
+            for validator in (delta_validator, full_validator):
+                await validator.backend.close()
+            await delta_server.runner.cleanup()
+            await full_server.runner.cleanup()
+        return delta_server, full_server
+
+    delta_server, full_server = asyncio.run(main())
+    assert delta_server.rejected == 1
+    assert delta_server.bytes_received < full_server.bytes_received / 2
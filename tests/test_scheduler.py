@@ -0,0 +1,104 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+from game.validator.scheduler import GameScheduler
+
+
+class StubValidator:
+    """Plays games of scripted length and records how the scheduler drives it."""
+
+    def __init__(self, durations, default=0.02):
+        self.durations = list(durations)
+        self.default = default
+        self.should_exit = False
+        self.step = 0
+        self.running = 0
+        self.max_running = 0
+        self.cancelled = 0
+        self.block = 100
+        self.last_metagraph_update = 0
+        self.metagraph = SimpleNamespace(version=0)
+        self.threads = {}
+
+    async def forward(self):
+        duration = self.durations.pop(0) if self.durations else self.default
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(duration)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.running -= 1
+
+    def weights_version_matches(self):
+        return True
+
+    def check_registered(self):
+        self.threads["check"] = threading.get_ident()
+
+    def should_sync_metagraph(self):
+        return True
+
+    def fetch_metagraph(self):
+        self.threads["fetch"] = threading.get_ident()
+        return SimpleNamespace(version=self.metagraph.version + 1)
+
+    def apply_metagraph(self, metagraph):
+        self.threads["apply"] = threading.get_ident()
+        self.metagraph = metagraph
+
+    def should_set_weights(self):
+        return False
+
+    def save_state(self):
+        self.threads["save"] = threading.get_ident()
+
+
+def _run(validator, seconds, **kwargs):
+    kwargs.setdefault("num_slots", 2)
+    kwargs.setdefault("game_timeout", 5.0)
+    kwargs.setdefault("sync_interval", 60.0)
+    scheduler = GameScheduler(validator, **kwargs)
+
+    async def main():
+        running = asyncio.ensure_future(scheduler.run())
+        await asyncio.sleep(seconds)
+        validator.should_exit = True
+        await running
+
+    asyncio.run(main())
+    return scheduler
+
+
+def test_free_slot_is_refilled_while_a_slow_game_runs():
+    validator = StubValidator([1.5])
+    scheduler = _run(validator, 0.5)
+    # The fast slot kept turning over instead of waiting for the slow game.
+    assert scheduler.games_finished > 10
+    assert validator.max_running == 2
+    assert scheduler.games_timed_out == 0
+
+
+def test_game_past_its_deadline_is_cancelled():
+    validator = StubValidator([10.0])
+    scheduler = _run(validator, 0.3, num_slots=1, game_timeout=0.1)
+    assert scheduler.games_timed_out == 1
+    assert validator.cancelled == 1
+    # The slot went on to the next game after the cancellation.
+    assert scheduler.games_finished > 1
+    assert validator.step == scheduler.games_finished
+
+
+def test_sync_does_chain_io_off_the_loop_and_swaps_on_it():
+    validator = StubValidator([])
+    _run(validator, 0.05, num_slots=1)
+    loop_thread = threading.get_ident()
+    assert validator.threads["fetch"] != loop_thread
+    assert validator.threads["check"] != loop_thread
+    assert validator.threads["save"] != loop_thread
+    assert validator.threads["apply"] == loop_thread
+    assert validator.metagraph.version == 1
+    assert validator.last_metagraph_update == 100
@@ -0,0 +1,113 @@
+import random
+import time
+
+import pytest
+
+from game.validator.score_store import ScoreStore
+from game.validator.score_window import ScoreWindow
+
+WINDOW = 3 * 86400
+HOTKEYS = [f"hk{i}" for i in range(12)]
+
+
+def _row(room_id, validator, ended_at, rng):
+    rs, ro, bs, bo = rng.sample(HOTKEYS, 4)
+    return {
+        "room_id": room_id,
+        "validator": validator,
+        "rs": rs,
+        "ro": ro,
+        "bs": bs,
+        "bo": bo if rng.random() > 0.1 else "",
+        "winner": "red",
+        "started_at": ended_at - 600,
+        "ended_at": ended_at,
+        "score_rs": rng.uniform(-3, 3),
+        "score_ro": rng.uniform(-3, 3),
+        "score_bs": rng.uniform(-3, 3),
+        "score_bo": rng.uniform(-3, 3),
+        "reason": "",
+    }
+
+
+def _assert_matches_sql(store, since_ts):
+    expected = store._window_scores_by_hotkey_sql(since_ts)
+    actual = store.window_scores_by_hotkey(since_ts)
+    assert actual.keys() == expected.keys()
+    for hotkey, total in expected.items():
+        assert actual[hotkey] == pytest.approx(total)
+    assert store.games_in_window(since_ts) == store._games_in_window_sql(since_ts)
+
+
+def test_window_matches_sql(tmp_path):
+    rng = random.Random(7)
+    now = int(time.time())
+    db_path = str(tmp_path / "scores.db")
+    store = ScoreStore(db_path, backend_url="", window_seconds=WINDOW)
+    store.init(HOTKEYS)
+
+    # Includes rows older than the window, which must never be counted.
+    rows = [
+        _row(f"room{i}", f"val{i % 3}", now - rng.randint(0, 2 * WINDOW), rng)
+        for i in range(400)
+    ]
+    store._upsert_scores_all(rows)
+    # Re-synced rows replace their earlier version, possibly moving buckets.
+    store._upsert_scores_all(
+        [
+            _row(row["room_id"], row["validator"], now - rng.randint(0, WINDOW), rng)
+            for row in rng.sample(rows, 60)
+        ]
+    )
+
+    for offset in (WINDOW, WINDOW - 1, WINDOW // 2, 3601, 1):
+        _assert_matches_sql(store, now - offset)
+
+    # A fresh store rebuilds the same totals from SQLite.
+    store.close()
+    rebuilt = ScoreStore(db_path, backend_url="", window_seconds=WINDOW)
+    rebuilt.init(HOTKEYS)
+    for offset in (WINDOW, WINDOW // 3, 7):
+        _assert_matches_sql(rebuilt, now - offset)
+    rebuilt.close()
+
+
+def test_games_in_window_falls_back_to_local_games(tmp_path):
+    store = ScoreStore(
+        str(tmp_path / "scores.db"), backend_url="", window_seconds=WINDOW
+    )
+    store.init(HOTKEYS)
+    now = int(time.time())
+    store.record_game(
+        room_id="local",
+        rs="hk0",
+        ro="hk1",
+        bs="hk2",
+        bo="hk3",
+        winner="red",
+        started_at=now - 60,
+        ended_at=now,
+        score_rs=1.0,
+        score_ro=1.0,
+        score_bs=0.0,
+        score_bo=0.0,
+        reason="",
+    )
+    assert store.games_in_window(now - WINDOW) == 1
+    assert store.window_scores_by_hotkey(now - WINDOW) == {}
+    store.close()
+
+
+def test_expired_buckets_fall_back():
+    window = ScoreWindow(horizon_seconds=7200, bucket_seconds=3600)
+    now = 10 * 3600
+    window.reset(covered_since=now - 7200)
+    window.add("a", now - 7000, (("hk0", 1.0),))
+    window.add("b", now - 100, (("hk0", 2.0), ("hk1", 0.5)))
+    assert window.totals_since(now - 7200) == {"hk0": 3.0, "hk1": 0.5}
+
+    window.expire(now + 3600)
+    assert "a" not in window._rows
+    assert window.totals_since(now - 7200) is None
+    assert window.totals_since(now - 3600) == {"hk0": 2.0, "hk1": 0.5}
+    assert window.count_since(now - 3600) == 1
@@ -0,0 +1,68 @@
+import random
+import sqlite3
+import time
+
+from game.validator.score_store import SELECTION_BUCKET_SECONDS, ScoreStore
+
+HOTKEYS = [f"hk{i}" for i in range(20)]
+
+
+def _raw_counts(store, since_ts):
+    cur = store.conn.execute(
+        "SELECT hotkey, COUNT(*) FROM selection_events WHERE ts >= ? GROUP BY hotkey",
+        (int(since_ts),),
+    )
+    return dict(cur.fetchall())
+
+
+def _insert_events(db_path, events):
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO selection_events(hotkey, uid, ts) VALUES(?, ?, ?)", events
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_counter_table_matches_raw_events(tmp_path):
+    rng = random.Random(3)
+    now = int(time.time())
+    db_path = str(tmp_path / "scores.db")
+    store = ScoreStore(db_path, backend_url="")
+    store.init(HOTKEYS)
+
+    events = [
+        (hotkey, HOTKEYS.index(hotkey), now - rng.randint(0, 5 * 86400))
+        for hotkey in rng.choices(HOTKEYS, k=2000)
+    ]
+    _insert_events(db_path, events)
+    store.record_selections([(hotkey, uid) for hotkey, uid, _ in events[:50]])
+
+    for offset in (5 * 86400, 86400 + 17, SELECTION_BUCKET_SECONDS, 1, 0):
+        assert store.selection_counts_since(now - offset) == _raw_counts(
+            store, now - offset
+        )
+    store.close()
+
+
+def test_counter_table_backfills_existing_events(tmp_path):
+    now = int(time.time())
+    db_path = str(tmp_path / "scores.db")
+    store = ScoreStore(db_path, backend_url="")
+    store.init(HOTKEYS)
+    store.close()
+
+    # Simulate a database created before the counter table existed.
+    conn = sqlite3.connect(db_path)
+    conn.execute("DROP TRIGGER trg_selection_events_count")
+    conn.execute("DROP TABLE selection_counts")
+    conn.commit()
+    conn.close()
+    _insert_events(db_path, [("hk1", 1, now - 7200), ("hk2", 2, now - 60)])
+
+    store = ScoreStore(db_path, backend_url="")
+    store.init(HOTKEYS)
+    since_ts = now - 86400
+    assert store.selection_counts_since(since_ts) == _raw_counts(store, since_ts)
+    assert store.selection_counts_since(since_ts)["hk1"] == 2
+    store.close()
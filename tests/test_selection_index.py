@@ -0,0 +1,128 @@
+import asyncio
+import random
+from collections import Counter
+from types import SimpleNamespace
+
+import numpy as np
+
+from game.utils.uids import SelectionIndex, get_random_uids
+
+
+def _eligible(pool, counts):
+    """The old selection rule: uids at the lowest known count, plus unknown ones."""
+    known = [counts[uid] for uid in pool if counts[uid] is not None]
+    lowest = min(known) if known else 0
+    return {uid for uid in pool if counts[uid] is None or counts[uid] == lowest}
+
+
+def test_every_draw_follows_the_old_selection_rule():
+    for seed in range(200):
+        rng = random.Random(seed)
+        uids = list(range(rng.randint(1, 30)))
+        counts = {
+            uid: None if rng.random() < 0.2 else rng.randint(0, 4) for uid in uids
+        }
+        index = SelectionIndex(uids, [counts[uid] for uid in uids], rng=rng)
+        pool = set(uids)
+        while pool:
+            uid = index.draw()
+            assert uid in _eligible(pool, counts)
+            pool.remove(uid)
+        assert index.draw() is None
+        assert len(index) == 0
+
+
+def test_ties_are_broken_uniformly():
+    uids = [10, 11, 12, 13, 14, 15]
+    counts = [2, 1, 1, None, 1, 3]
+    first = Counter(
+        SelectionIndex(uids, counts, rng=random.Random(seed)).draw()
+        for seed in range(800)
+    )
+    # The three uids at count 1 and the one without a count share the draw.
+    assert set(first) == {11, 12, 13, 14}
+    assert min(first.values()) > 150
+
+
+def _legacy_select(validator, k):
+    """The list scan SelectionIndex replaced, kept as a reference."""
+    metagraph = validator.metagraph
+    counts = validator.score_store.counts
+    scores = validator.score_store.scores
+    successful = set(validator.availability.available_uids())
+    pool = [int(uid) for uid in metagraph.uids]
+    selected, hotkeys_to_increase, selected_ips = [], [], []
+    while len(selected) < k and pool:
+        known = [counts[metagraph.hotkeys[uid]] for uid in pool]
+        lowest = min(known)
+        for uid in list(pool):
+            if len(selected) >= k:
+                break
+            hotkey = metagraph.hotkeys[uid]
+            if counts[hotkey] > lowest:
+                continue
+            pool.remove(uid)
+            ip = metagraph.axons[uid].ip
+            if ip in selected_ips:
+                continue
+            hotkeys_to_increase.append(hotkey)
+            if uid not in successful:
+                continue
+            if float(scores.get(hotkey, 0.0)) < -2.0:
+                continue
+            selected.append(uid)
+            selected_ips.append(ip)
+    return selected, hotkeys_to_increase
+
+
+class _Store:
+    def __init__(self, counts, scores):
+        self.counts = counts
+        self.scores = scores
+
+    def window_scores_by_hotkey(self, since_ts):
+        return self.scores
+
+    def selection_counts_since(self, since_ts):
+        return self.counts
+
+
+class _AsyncStore:
+    def __init__(self, store):
+        self.store = store
+
+    async def window_scores_by_hotkey(self, since_ts):
+        return self.store.window_scores_by_hotkey(since_ts)
+
+    async def selection_counts_since(self, since_ts):
+        return self.store.selection_counts_since(since_ts)
+
+
+def test_selection_matches_the_old_scan_when_counts_are_distinct():
+    rng = random.Random(7)
+    for _ in range(20):
+        n = 24
+        hotkeys = [f"hk{uid}" for uid in range(n)]
+        order = rng.sample(range(100), n)
+        store = _Store(
+            {hk: count for hk, count in zip(hotkeys, order)},
+            {hk: rng.uniform(-3.0, 1.0) for hk in hotkeys},
+        )
+        validator = SimpleNamespace(
+            metagraph=SimpleNamespace(
+                uids=np.arange(n),
+                hotkeys=hotkeys,
+                coldkeys=[f"ck{uid}" for uid in range(n)],
+                axons=[SimpleNamespace(ip=f"10.0.0.{uid % 18}") for uid in range(n)],
+            ),
+            scoring_window_seconds=86400,
+            score_store=store,
+            async_store=_AsyncStore(store),
+            availability=SimpleNamespace(
+                is_warm=True,
+                available_uids=lambda: [uid for uid in range(n) if uid % 3],
+            ),
+            config=SimpleNamespace(neuron=SimpleNamespace(ping_quorum_factor=0)),
+        )
+        expected = _legacy_select(validator, 8)
+        assert asyncio.run(get_random_uids(validator, k=8)) == expected
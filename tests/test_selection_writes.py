@@ -0,0 +1,69 @@
+import sqlite3
+
+import pytest
+
+from game.validator.score_store import ScoreStore
+
+HOTKEYS = [f"hk{i}" for i in range(6)]
+
+
+def _events(store):
+    cur = store.conn.execute(
+        "SELECT hotkey, uid FROM selection_events ORDER BY id",
+    )
+    return cur.fetchall()
+
+
+def _store(tmp_path, hotkeys=HOTKEYS):
+    store = ScoreStore(str(tmp_path / "scores.db"), backend_url="")
+    store.init(hotkeys)
+    return store
+
+
+def test_init_seeds_each_new_hotkey_once(tmp_path):
+    store = _store(tmp_path, HOTKEYS[:3] + [""] + HOTKEYS[4:])
+    # One event per hotkey at its uid; empty slots are skipped.
+    assert _events(store) == [
+        ("hk0", 0),
+        ("hk1", 1),
+        ("hk2", 2),
+        ("hk4", 4),
+        ("hk5", 5),
+    ]
+    store.close()
+
+    store = _store(tmp_path, HOTKEYS + ["hk6"])
+    assert _events(store)[5:] == [("hk3", 3), ("hk6", 6)]
+    assert store.selection_counts_since(0) == {
+        hotkey: 1 for hotkey in HOTKEYS + ["hk6"]
+    }
+    store.close()
+
+
+def test_record_selections_writes_a_game_in_one_batch(tmp_path):
+    store = _store(tmp_path)
+    seeded = len(_events(store))
+    written = store.record_selections([("hk1", 1), ("hk2", 2), ("", 9), ("hk1", 1)])
+    assert written == 3
+    assert _events(store)[seeded:] == [("hk1", 1), ("hk2", 2), ("hk1", 1)]
+    assert store.selection_counts_since(0)["hk1"] == 3
+    assert store.record_selections([]) == 0
+    store.close()
+
+
+def test_record_selections_is_all_or_nothing(tmp_path):
+    store = _store(tmp_path)
+    store.conn.execute(
+        """
+        CREATE TRIGGER reject_bad BEFORE INSERT ON selection_events
+        WHEN NEW.hotkey = 'bad'
+        BEGIN
+            SELECT RAISE(ABORT, 'bad hotkey');
+        END;
+        """
+    )
+    before = _events(store)
+    with pytest.raises(sqlite3.Error):
+        store.record_selections([("hk1", 1), ("hk2", 2), ("bad", 3)])
+    assert _events(store) == before
+    store.close()
@@ -0,0 +1,163 @@
+import asyncio
+import sqlite3
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from game.validator.async_score_store import AsyncScoreStore
+from game.validator.latency import LatencyModel
+from game.validator.score_store import ScoreStore
+from game.validator.telemetry import TurnTelemetry
+
+
+class StubAvailability:
+    def __init__(self):
+        self.turns = []
+
+    def note_turn(self, uid, answered, now=None):
+        self.turns.append((uid, answered))
+
+
+@pytest.fixture
+def validator(tmp_path):
+    store = ScoreStore(str(tmp_path / "scores.db"), backend_url="", window_seconds=60)
+    store.init([])
+    async_store = AsyncScoreStore(store)
+    yield SimpleNamespace(
+        score_store=store,
+        async_store=async_store,
+        availability=StubAvailability(),
+        should_exit=False,
+    )
+    async_store.close()
+    store.close()
+
+
+def _turn(hotkey, role, turn, latency, outcome="ok", uid=1):
+    return dict(
+        ts=time.time() - 30 + turn,
+        room_id="room",
+        uid=uid,
+        hotkey=hotkey,
+        role=role,
+        turn=turn,
+        latency=latency,
+        attempts=1,
+        request_bytes=100,
+        response_bytes=50 if latency else 0,
+        outcome=outcome,
+    )
+
+
+def test_turns_are_buffered_and_flushed_in_one_batch(validator):
+    telemetry = TurnTelemetry(validator, max_buffer=100)
+
+    async def main():
+        for step in range(20):
+            telemetry.record(**_turn("hk0", "spymaster", step, 0.1 * (step + 1)))
+        telemetry.record(**_turn("hk0", "spymaster", 20, None, "no_response"))
+        telemetry.record(**_turn("hk1", "operative", 0, 2.0, uid=2))
+        buffered = len(telemetry)
+        written = await telemetry.flush()
+        return buffered, written
+
+    buffered, written = asyncio.run(main())
+    assert buffered == written == 22
+    assert len(telemetry) == 0
+    assert validator.availability.turns[-2:] == [(1, False), (2, True)]
+
+    stats = validator.score_store.turn_latency_stats(time.time() - 60)
+    spymaster = stats[("hk0", "spymaster")]
+    assert spymaster["turns"] == 21
+    assert spymaster["failures"] == 1
+    assert spymaster["p50"] == pytest.approx(1.0)
+    assert spymaster["p95"] == pytest.approx(1.9)
+    assert stats[("hk1", "operative")]["p95"] == 2.0
+    assert list(validator.score_store.turn_latency_stats(0, role="operative")) == [
+        ("hk1", "operative")
+    ]
+
+
+def test_full_buffer_flushes_in_the_background(validator):
+    telemetry = TurnTelemetry(validator, max_buffer=5)
+
+    async def main():
+        for step in range(5):
+            telemetry.record(**_turn("hk0", "guesser", step, 0.2))
+        # record() itself never waits on the store.
+        assert len(telemetry) == 5
+        await asyncio.sleep(0.2)
+        return len(telemetry)
+
+    assert asyncio.run(main()) == 0
+    assert telemetry.written == 5
+
+
+def test_failed_flush_keeps_rows_up_to_the_backlog():
+    async def broken(rows):
+        raise RuntimeError("disk full")
+
+    validator = SimpleNamespace(
+        async_store=SimpleNamespace(record_turns=broken), availability=None
+    )
+    telemetry = TurnTelemetry(validator, max_buffer=10, max_backlog=12)
+
+    async def main():
+        for step in range(9):
+            telemetry.record(**_turn("hk0", "guesser", step, 0.2))
+        await telemetry.flush()
+        for step in range(9, 14):
+            telemetry.record(**_turn("hk0", "guesser", step, 0.2))
+        await telemetry.flush()
+
+    asyncio.run(main())
+    assert len(telemetry) == 12
+    assert telemetry.dropped == 2
+    assert telemetry._buffer[0]["turn"] == 2
+
+
+def test_stored_latencies_seed_the_latency_model(validator):
+    store = validator.score_store
+    store.record_turns(
+        [_turn("hk0", "guesser", step, 0.1 * (step + 1)) for step in range(8)]
+        + [_turn("hk0", "guesser", 8, None, "no_response")]
+    )
+    recent = store.recent_turn_latencies(per_hotkey=5)
+    assert recent["hk0"] == pytest.approx([0.4, 0.5, 0.6, 0.7, 0.8])
+
+    model = LatencyModel(min_timeout=0.1, max_timeout=5.0)
+    assert model.seed(1, "hk0", recent["hk0"])
+    assert model.timeout_for(1, "hk0") == pytest.approx(1.6)
+    # An already-warm record is left alone.
+    assert not model.seed(1, "hk0", [3.0] * 5)
+
+
+def test_clue_turns_record_who_decided_and_the_verdict(tmp_path):
+    path = str(tmp_path / "scores.db")
+    conn = sqlite3.connect(path)
+    # A database from before the columns existed.
+    conn.execute(
+        """
+        CREATE TABLE turn_telemetry (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            room_id TEXT NOT NULL, uid INTEGER NOT NULL, hotkey TEXT NOT NULL,
+            role TEXT NOT NULL, turn INTEGER NOT NULL, ts REAL NOT NULL,
+            latency REAL, attempts INTEGER NOT NULL,
+            request_bytes INTEGER NOT NULL, response_bytes INTEGER NOT NULL,
+            adjudication TEXT, outcome TEXT NOT NULL
+        )
+        """
+    )
+    conn.close()
+    store = ScoreStore(path, backend_url="")
+    store.init([])
+    turn = _turn("hk0", "spymaster", 0, 1.0)
+    turn.update(adjudication="ambiguous", adjudicated_by="arbiter", verdict="invalid")
+    store.record_turns([turn])
+
+    row = store.conn.execute(
+        "SELECT adjudication, adjudicated_by, verdict FROM turn_telemetry"
+    ).fetchone()
+    assert row == ("ambiguous", "arbiter", "invalid")
+    store.close()